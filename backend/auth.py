@@ -1,16 +1,28 @@
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+import hashlib
+import hmac
+import secrets
+import uuid
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from database import get_db
-from database.models import User
+from sqlalchemy import delete, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from database.models import User, RefreshToken, PasswordResetToken
+from principals import load_principal, load_token_version
+from revocation import token_revocations
 import os
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+# 회전된 지 이 시간 이내의 재사용은 동시 재발급(여러 탭)으로 보고 세션을 폐기하지 않음
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = int(os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "10"))
+PASSWORD_RESET_TOKEN_EXPIRE_MINUTES = int(os.getenv("PASSWORD_RESET_TOKEN_EXPIRE_MINUTES", "60"))
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
@@ -26,21 +38,141 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def create_user_token(user: User, expires_delta: Optional[timedelta] = None, **claims) -> str:
+    """사용자 액세스 토큰 - 사용자 id, 역할, token_version(tv)을 포함하여 역할 확인에 User 행이 필요 없음
+
+    jti는 토큰마다 고유한 id로, 로그아웃 시 이 토큰만 폐기하는 데 사용합니다.
+    """
+    roles = [role for role, granted in (("admin", user.is_admin), ("editor", user.is_editor)) if granted]
+    return create_access_token(
+        {"sub": user.email, "uid": user.id, "roles": roles, "tv": user.token_version,
+         "jti": uuid.uuid4().hex, **claims},
+        expires_delta=expires_delta,
+    )
+
+
+def hash_refresh_token(token: str) -> str:
+    """리프레시 토큰 저장/조회용 HMAC-SHA256 (원문은 저장하지 않음)"""
+    return hmac.new(SECRET_KEY.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def issue_refresh_token(db: AsyncSession, user: User, family_id: Optional[str] = None) -> str:
+    """리프레시 토큰 발급 (호출자가 커밋) - family_id가 없으면 새 로그인 세션으로 시작"""
+    token = secrets.token_urlsafe(32)
+    db.add(RefreshToken(
+        user_id=user.id,
+        family_id=family_id or uuid.uuid4().hex,
+        token_hash=hash_refresh_token(token),
+        token_version=user.token_version,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return token
+
+
+async def revoke_refresh_family(db: AsyncSession, family_id: str) -> None:
+    """로그인 세션(family)의 리프레시 토큰 모두 폐기 (호출자가 커밋)"""
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def hash_reset_token(token: str) -> str:
+    """비밀번호 재설정 토큰 저장/조회용 SHA-256 (원문은 저장하지 않음)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def issue_password_reset_token(db: AsyncSession, user: User) -> str:
+    """비밀번호 재설정 토큰 발급 (호출자가 커밋) - 이전에 발급한 토큰은 폐기"""
+    token = secrets.token_urlsafe(32)
+    await db.execute(delete(PasswordResetToken).where(PasswordResetToken.user_id == user.id))
+    db.add(PasswordResetToken(
+        user_id=user.id,
+        token_hash=hash_reset_token(token),
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=PASSWORD_RESET_TOKEN_EXPIRE_MINUTES),
+    ))
+    return token
+
+
+async def consume_password_reset_token(db: AsyncSession, token: str) -> Optional[int]:
+    """재설정 토큰 사용 처리 후 사용자 id 반환 (호출자가 커밋) - 없거나 만료/사용된 토큰은 None
+
+    조건부 UPDATE로 사용 처리하므로 같은 토큰을 동시에 제시해도 한 요청만 성공합니다.
+    """
+    return await db.scalar(
+        update(PasswordResetToken)
+        .where(
+            PasswordResetToken.token_hash == hash_reset_token(token),
+            PasswordResetToken.used_at.is_(None),
+            PasswordResetToken.expires_at > func.now(),
+        )
+        .values(used_at=func.now())
+        .returning(PasswordResetToken.user_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@dataclass(frozen=True)
+class Principal:
+    """토큰에서 읽은 인증 주체 (id와 역할만 필요한 엔드포인트용)"""
+    id: int
+    email: str
+    is_admin: bool
+    is_editor: bool
+
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def decode_access_token(token: str) -> dict:
+    """토큰 검증 후 클레임 반환 - uid/tv/jti가 없는(이전 형식) 토큰은 거부"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
-        raise credentials_exception
+        raise credentials_exception()
+    if (not isinstance(payload.get("uid"), int) or not isinstance(payload.get("tv"), int)
+            or not isinstance(payload.get("jti"), str)):
+        raise credentials_exception()
+    return payload
+
+
+async def verify_access_token(token: str, db: AsyncSession) -> dict:
+    """토큰 검증 + 폐기(로그아웃) 확인 - 폐기 여부는 대부분 Bloom 필터로 조회 없이 판정"""
+    payload = decode_access_token(token)
+    if await token_revocations.is_revoked(db, payload["jti"]):
+        raise credentials_exception()
+    return payload
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    """현재 사용자 (User) - 사용자 정보를 읽거나 수정하는 엔드포인트용"""
+    payload = await verify_access_token(token, db)
+    # 주체 캐시에 있으면 users 조회 없이 인증 (사용자 변경 시 invalidate_principals로 무효화)
+    user = await load_principal(db, payload["uid"])
+    if user is None or user.token_version != payload["tv"]:
+        raise credentials_exception()
     return user
 
+
+async def get_principal(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
+    """현재 인증 주체 - 역할은 토큰에서 읽고 token_version만 확인 (대부분 캐시 적중으로 조회 없음)
+
+    역할 변경, 비활성화, 비밀번호 변경 시 token_version이 올라가므로 버전이 같으면 토큰의 역할이 최신입니다.
+    """
+    payload = await verify_access_token(token, db)
+    if await load_token_version(db, payload["uid"]) != payload["tv"]:
+        raise credentials_exception()
+    roles = payload.get("roles") or []
+    return Principal(
+        id=payload["uid"],
+        email=payload.get("sub"),
+        is_admin="admin" in roles,
+        is_editor="editor" in roles,
+    )
@@ -0,0 +1,174 @@
+"""
+프로세스 내 응답 캐시
+LRU + TTL로 항목을 제거하며, 각 항목은 의존성 태그(예: "categories", "tags", "post:{id}")의
+버전을 함께 기록합니다. 쓰기 핸들러가 bump()로 태그 버전을 올리면 해당 태그에 의존하는
+항목은 다음 조회 시 무효로 판정되어 절대 반환되지 않습니다.
+
+캐시는 워커 프로세스마다 독립적이므로, 쓰기 핸들러는 커밋 전에 invalidate_cache(db, *tags)를 호출합니다.
+- 커밋 시 pg_notify로 모든 워커에 알림 → 각 워커의 notification_listener가 태그 버전을 올림
+- 이 워커의 태그는 커밋 직후(after_commit) 바로 올림
+LISTEN 연결이 끊긴 동안 놓친 알림은 재연결 시 전체 비우기로, 그래도 남는 경우는 TTL로 제한됩니다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from notifications import notification_listener
+
+
+class VersionedCache:
+    """의존성 태그 버전 기반 LRU/TTL 캐시"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, Tuple[Tuple[str, int], ...], float]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def _snapshot(self, depends_on: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        return tuple((tag, self._versions.get(tag, 0)) for tag in depends_on)
+
+    def _is_current(self, snapshot: Tuple[Tuple[str, int], ...]) -> bool:
+        return all(self._versions.get(tag, 0) == version for tag, version in snapshot)
+
+    def version(self, tag: str) -> int:
+        """태그의 현재 버전"""
+        with self._lock:
+            return self._versions.get(tag, 0)
+
+    def snapshot(self, depends_on: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        """의존성 태그들의 현재 버전 스냅샷 (로딩 시작 전에 잡아 set()에 전달)"""
+        with self._lock:
+            return self._snapshot(depends_on)
+
+    def bump(self, *tags: str) -> None:
+        """태그 버전 증가 - 해당 태그에 의존하는 모든 항목을 무효화"""
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            value, snapshot, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return False, None
+            if not self._is_current(snapshot):
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, value
+
+    def set(self, key: str, value: Any, snapshot: Tuple[Tuple[str, int], ...]) -> None:
+        """값 저장
+
+        snapshot은 값을 로딩하기 전에 잡아 둔 버전이어야 합니다. 로딩 중에 bump가 일어나면
+        저장된 항목은 즉시 무효로 판정되므로 오래된 값이 반환되지 않습니다.
+        """
+        with self._lock:
+            if not self._is_current(snapshot):
+                return
+            self._entries[key] = (value, snapshot, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_set(self, key: str, depends_on: Iterable[str], loader: Callable[[], Any]) -> Any:
+        """캐시에 있으면 반환하고, 없으면 loader() 결과를 저장 후 반환"""
+        hit, value = self.get(key)
+        if hit:
+            return value
+        snapshot = self.snapshot(depends_on)
+        value = loader()
+        self.set(key, value, snapshot)
+        return value
+
+    async def get_or_set_async(self, key: str, depends_on: Iterable[str], loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_set의 비동기 버전 - loader()가 반환하는 awaitable의 결과를 저장"""
+        hit, value = self.get(key)
+        if hit:
+            return value
+        snapshot = self.snapshot(depends_on)
+        value = await loader()
+        self.set(key, value, snapshot)
+        return value
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (버전은 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스/제거 카운터"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+response_cache = VersionedCache(
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "1024")),
+    ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "300")),
+)
+
+
+CACHE_CHANNEL = "cache_invalidation"
+_PENDING_KEY = "cache_invalidations"
+
+
+def invalidate_cache_tags(session: Session, *tags: str) -> None:
+    """변경을 커밋하기 전에 호출 (동기 세션) - 커밋되면 모든 워커에서 태그 버전을 올림"""
+    if not tags:
+        return
+    session.info.setdefault(_PENDING_KEY, set()).update(tags)
+    # NOTIFY는 트랜잭션이 커밋될 때 전달됨
+    session.execute(select(*[func.pg_notify(CACHE_CHANNEL, tag) for tag in tags]))
+
+
+async def invalidate_cache(db: AsyncSession, *tags: str) -> None:
+    """invalidate_cache_tags의 비동기 세션 버전"""
+    await db.run_sync(invalidate_cache_tags, *tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed(session: Session) -> None:
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        response_cache.bump(*tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def _clear_all() -> None:
+    response_cache.clear()
+
+
+notification_listener.register(CACHE_CHANNEL, response_cache.bump, on_connect=_clear_all)
@@ -2,25 +2,42 @@
 Database 패키지
 데이터베이스 연결, 모델, 스키마를 관리합니다.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+from database.pool import pool_options, InstrumentedQueuePool, InstrumentedAsyncQueuePool
+
 # 데이터베이스 URL 가져오기
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
     f"postgresql://{os.getenv('POSTGRES_USER', 'dashboard_user')}:{os.getenv('POSTGRES_PASSWORD', 'dashboard_password')}@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}/{os.getenv('POSTGRES_DB', 'dashboard_db')}"
 )
 
-engine = create_engine(DATABASE_URL)
+# 동기 엔진 (psycopg2) - database/scripts 도구, 백그라운드 작업, 내보내기 스트리밍에서 사용
+# 풀 설정은 DB_POOL_* 환경 변수 (database/pool.py), 사용량은 GET /api/metrics/pool
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **pool_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (asyncpg) - API 라우터에서 사용하여 쿼리 대기 중 이벤트 루프를 막지 않음
+# ASYNC_DATABASE_URL이 없으면 DATABASE_URL의 드라이버만 asyncpg로 바꿔 사용
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **pool_options())
+# 커밋 후 속성 접근이 지연 로딩(동기 IO)을 일으키지 않도록 만료하지 않음
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
 def get_db():
-    """데이터베이스 세션 의존성"""
+    """데이터베이스 세션 의존성 (동기)"""
     db = SessionLocal()
     try:
         yield db
@@ -28,8 +45,22 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """데이터베이스 세션 의존성 (비동기)
+
+    같은 요청 안의 의존성(get_current_user 등)과 핸들러가 하나의 세션을 공유합니다.
+    Session을 받는 동기 헬퍼(database.loaders, database.tags 등)는 await db.run_sync(helper, ...)로
+    호출합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """데이터베이스 초기화 - 모든 테이블 생성"""
-    from database.models import User, Profile, Post, Comment, PostEditor, Category, Tag, PostTag
+    from database.models import User, Profile, Post, Comment, PostEditor, Category, Tag, PostTag, Job, TermDocumentFrequency, RateLimitBucket, RefreshToken, RevokedToken, PasswordResetToken
+    # trigram 인덱스(사용자 검색)에 필요한 확장
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
 
@@ -0,0 +1,181 @@
+"""
+포스트 대량 가져오기
+NDJSON 행 묶음을 고정된 수의 집합 기반 문장으로 저장합니다.
+
+배치 하나당:
+- 기존 slug 확인 SELECT 1회, 카테고리 id 확인 SELECT 1회
+- 카테고리/태그 해석: 각각 INSERT ... ON CONFLICT DO NOTHING 1회 + SELECT 1회
+- posts 다중 행 INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING 1회
+- post_tags 다중 행 INSERT 1회
+- 자동 태그용 문서 빈도 조회 SELECT 1회 + 증감 upsert 1회
+
+배치 단위로 커밋하며, 잘못된 행은 건너뛰고 행 번호와 함께 오류로 보고합니다.
+POST /api/posts/bulk 와 database/scripts/import_posts.py 가 함께 사용합니다.
+"""
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select, bindparam, insert as sa_insert
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database.models import Post, PostTag, Category, Tag
+from database.schemas import PostImportRecord
+from database.derived import compute_post_derived
+from database.search import search_document, weighted_search_vector
+from database.tags import slugify, resolve_slug_ids
+from database.tag_extraction import (
+    DOCUMENT_COUNT_TERM, document_terms, extract_tags_batch, load_document_frequencies,
+    apply_document_frequency_deltas,
+)
+
+# 배치당 행 수 (배치마다 한 트랜잭션으로 커밋)
+IMPORT_BATCH_SIZE = 1000
+
+
+def validation_message(error: ValidationError) -> str:
+    """pydantic 검증 오류를 한 줄 메시지로 변환"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+def parse_lines(lines: Sequence[Tuple[int, str]]):
+    """(행 번호, NDJSON 문자열) 목록을 검증된 레코드와 오류로 분리 (빈 줄은 무시)"""
+    records: List[Tuple[int, PostImportRecord]] = []
+    errors: List[dict] = []
+    for line_no, line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append((line_no, PostImportRecord.model_validate(json.loads(line))))
+        except json.JSONDecodeError as e:
+            errors.append({"line": line_no, "error": f"Invalid JSON: {e.msg}"})
+        except ValidationError as e:
+            errors.append({"line": line_no, "error": validation_message(e)})
+    return records, errors
+
+
+def record_tag_names(record: PostImportRecord, auto_tag_names: Sequence[str] = ()) -> List[str]:
+    """레코드에 연결할 태그 이름 (지정 태그 + 자동 추출 태그, slug 기준 중복 제거)"""
+    names = [name for name in (record.tags or []) if name and name.strip()]
+    if record.auto_tags:
+        names += auto_tag_names
+    unique: Dict[str, str] = {}
+    for name in names:
+        slug = slugify(name.strip())
+        if slug and slug not in unique:
+            unique[slug] = name.strip()
+    return list(unique.values())
+
+
+def import_post_batch(db: Session, lines: Sequence[Tuple[int, str]], author_id: int) -> Tuple[int, List[dict]]:
+    """NDJSON 행 묶음을 가져와 (생성 수, 행 오류 목록)을 반환 - 성공 시 배치를 커밋"""
+    records, errors = parse_lines(lines)
+
+    # slug 결정 및 배치 내 중복 확인
+    rows = []
+    seen_slugs = set()
+    for line_no, record in records:
+        slug = slugify(record.slug) if record.slug else slugify(record.title)
+        if not slug:
+            errors.append({"line": line_no, "error": "Cannot derive slug"})
+        elif slug in seen_slugs:
+            errors.append({"line": line_no, "error": "Duplicate slug in import"})
+        else:
+            seen_slugs.add(slug)
+            rows.append((line_no, record, slug))
+
+    # 이미 있는 slug
+    if rows:
+        existing = set(db.scalars(select(Post.slug).where(Post.slug.in_([slug for _, _, slug in rows]))))
+        errors += [{"line": line_no, "error": "Slug already exists"} for line_no, _, slug in rows if slug in existing]
+        rows = [row for row in rows if row[2] not in existing]
+
+    # category_id 확인
+    requested_category_ids = {record.category_id for _, record, _ in rows if record.category_id}
+    if requested_category_ids:
+        known = set(db.scalars(select(Category.id).where(Category.id.in_(requested_category_ids))))
+        errors += [
+            {"line": line_no, "error": "Category not found"}
+            for line_no, record, _ in rows if record.category_id and record.category_id not in known
+        ]
+        rows = [row for row in rows if not row[1].category_id or row[1].category_id in known]
+
+    if not rows:
+        db.rollback()
+        return 0, errors
+
+    try:
+        # 카테고리/태그 이름을 한 번에 해석 (없으면 생성)
+        category_ids = resolve_slug_ids(db, Category, [record.category for _, record, _ in rows if record.category])
+        # 자동 태그: 배치 전체 용어의 문서 빈도를 한 번에 조회해 TF-IDF로 한꺼번에 추출
+        terms = {slug: document_terms(record.title, record.content) for _, record, slug in rows}
+        frequencies, n_docs = load_document_frequencies(db, {term for values in terms.values() for term in values})
+        auto_rows = [(record, slug) for _, record, slug in rows if record.auto_tags]
+        auto_tag_names = dict(zip(
+            [slug for _, slug in auto_rows],
+            extract_tags_batch([(record.title, record.content) for record, _ in auto_rows], frequencies, n_docs),
+        ))
+        tag_names = {slug: record_tag_names(record, auto_tag_names.get(slug, ())) for _, record, slug in rows}
+        tag_ids = resolve_slug_ids(db, Tag, [name for names in tag_names.values() for name in names])
+
+        now = datetime.now(timezone.utc)
+        values = []
+        for _, record, slug in rows:
+            category_id = record.category_id
+            if record.category and not category_id:
+                category_id = category_ids.get(slugify(record.category.strip()))
+            value = {
+                "title": record.title,
+                "content": record.content,
+                "slug": slug,
+                "author_id": author_id,
+                "category_id": category_id,
+                "is_published": record.is_published,
+                "published_at": record.published_at or (now if record.is_published else None),
+                "created_at": record.created_at or now,
+                "title_document": search_document(record.title),
+                "content_document": search_document(record.content),
+                "indexed_terms": terms[slug],
+                **compute_post_derived(record.content),
+            }
+            values.append(value)
+
+        # 문장 형태가 고정되어 컴파일이 캐시되며, 드라이버가 다중 행 VALUES로 묶어 실행함
+        # 동시에 같은 slug가 생성된 경우 해당 행만 건너뜀
+        inserted = db.connection().execute(
+            insert(Post)
+            .values(search_vector=weighted_search_vector(bindparam("title_document"), bindparam("content_document")))
+            .on_conflict_do_nothing(index_elements=["slug"])
+            .returning(Post.id, Post.slug),
+            values
+        ).all()
+        post_ids = {row.slug: row.id for row in inserted}
+        errors += [{"line": line_no, "error": "Slug already exists"} for line_no, _, slug in rows if slug not in post_ids]
+
+        links = [
+            {"post_id": post_ids[slug], "tag_id": tag_ids[slugify(name)]}
+            for slug, names in tag_names.items() if slug in post_ids
+            for name in names if slugify(name) in tag_ids
+        ]
+        if links:
+            db.connection().execute(sa_insert(PostTag), links)
+
+        # 실제로 생성된 포스트의 용어만 문서 빈도에 반영
+        deltas = Counter(term for slug in post_ids for term in terms[slug])
+        deltas[DOCUMENT_COUNT_TERM] = len(post_ids)
+        apply_document_frequency_deltas(db, deltas)
+
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = str(getattr(e, "orig", None) or e).strip().splitlines()[0]
+        errors += [{"line": line_no, "error": f"Database error: {message}"} for line_no, _, _ in rows]
+        return 0, errors
+
+    return len(post_ids), errors
@@ -0,0 +1,88 @@
+"""
+포스트 댓글 통계 (comment_count, last_comment_at)
+댓글 작성/삭제와 같은 트랜잭션에서 posts 행을 원자적으로 갱신하므로, 목록 조회와 정렬은
+comments 테이블을 집계하지 않습니다. 직접 SQL로 댓글을 넣는 등 어긋난 값은
+reconcile_comment_stats()로 comments 테이블 기준으로 바로잡습니다.
+"""
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from database.models import Post, Comment
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def record_comment_added(db: Session, post_id: int) -> None:
+    """댓글 작성 반영 - 개수 증가, 마지막 댓글 시각 갱신 (커밋은 호출자가 수행)
+
+    comments.created_at과 같은 트랜잭션 시각(now())을 사용하며, 동시 작성 시에도
+    더 늦은 값이 유지되도록 GREATEST를 사용합니다 (NULL은 무시됨).
+    """
+    db.query(Post).filter(Post.id == post_id).update(
+        {
+            Post.comment_count: Post.comment_count + 1,
+            Post.last_comment_at: func.greatest(Post.last_comment_at, func.now()),
+            # 댓글은 포스트 수정이 아니므로 onupdate(updated_at) 적용을 막음
+            Post.updated_at: Post.updated_at,
+        },
+        synchronize_session=False,
+    )
+
+
+def record_comment_removed(db: Session, post_id: int) -> None:
+    """댓글 삭제 반영 - 삭제 flush 이후 호출 (커밋은 호출자가 수행)
+
+    마지막 댓글 시각은 남은 댓글에서 다시 계산합니다 (ix_comments_post_id_created_at_id 사용).
+    """
+    latest = (
+        select(func.max(Comment.created_at))
+        .where(Comment.post_id == post_id)
+        .scalar_subquery()
+    )
+    db.query(Post).filter(Post.id == post_id).update(
+        {
+            Post.comment_count: func.greatest(Post.comment_count - 1, 0),
+            Post.last_comment_at: latest,
+            Post.updated_at: Post.updated_at,
+        },
+        synchronize_session=False,
+    )
+
+
+def reconcile_comment_stats(db: Session, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """comments 테이블 기준으로 posts의 댓글 통계를 다시 계산
+
+    포스트 id 범위 단위로 나누어 각 배치를 별도 트랜잭션으로 커밋하며(긴 잠금 방지),
+    값이 다른 행만 갱신합니다. 수정된 포스트 수를 반환합니다.
+    """
+    repaired = 0
+    last_id = 0
+    while True:
+        upper = db.execute(text("""
+            SELECT max(id) FROM (
+                SELECT id FROM posts WHERE id > :last_id ORDER BY id LIMIT :batch_size
+            ) AS batch
+        """), {"last_id": last_id, "batch_size": batch_size}).scalar()
+        if upper is None:
+            break
+        result = db.execute(text("""
+            UPDATE posts AS p
+            SET comment_count = s.comment_count,
+                last_comment_at = s.last_comment_at
+            FROM (
+                SELECT p2.id,
+                       count(c.id) AS comment_count,
+                       max(c.created_at) AS last_comment_at
+                FROM posts AS p2
+                LEFT JOIN comments AS c ON c.post_id = p2.id
+                WHERE p2.id > :last_id AND p2.id <= :upper
+                GROUP BY p2.id
+            ) AS s
+            WHERE p.id = s.id
+              AND (p.comment_count IS DISTINCT FROM s.comment_count
+                   OR p.last_comment_at IS DISTINCT FROM s.last_comment_at)
+        """), {"last_id": last_id, "upper": upper})
+        db.commit()
+        repaired += result.rowcount
+        last_id = upper
+    return repaired
@@ -0,0 +1,89 @@
+"""
+포스트 파생 컬럼 계산
+본문(마크다운)에서 발췌, 단어/문자 수, 예상 읽기 시간, 콘텐츠 해시를 계산합니다.
+쓰기 시점에 한 번 계산해 posts 테이블에 저장하므로, 목록 조회와 정렬은 본문을 읽지 않습니다.
+"""
+import hashlib
+import math
+import re
+from typing import Dict, Any
+
+EXCERPT_LENGTH = 200
+
+# 분당 읽기 속도: 한글은 글자 수, 그 외는 단어 수 기준
+HANGUL_CHARS_PER_MINUTE = 500
+WORDS_PER_MINUTE = 200
+
+_CODE_FENCE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s*", re.MULTILINE)
+_BLOCKQUOTE = re.compile(r"^\s{0,3}>\s?", re.MULTILINE)
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+", re.MULTILINE)
+_HORIZONTAL_RULE = re.compile(r"^\s*(?:[-*_]\s*){3,}$", re.MULTILINE)
+_EMPHASIS = re.compile(r"(\*\*|__|\*|_|~~)(?=\S)(.+?)(?<=\S)\1")
+_TABLE_PIPE = re.compile(r"\s*\|\s*")
+_WORD = re.compile(r"[^\W_]+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def strip_markdown(text: str) -> str:
+    """마크다운 문법을 제거한 일반 텍스트 (공백 정규화)"""
+    if not text:
+        return ""
+    text = _CODE_FENCE.sub(" ", text)
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = _INLINE_CODE.sub(r"\1", text)
+    text = _HTML_TAG.sub(" ", text)
+    text = _HORIZONTAL_RULE.sub(" ", text)
+    text = _HEADING.sub("", text)
+    text = _BLOCKQUOTE.sub("", text)
+    text = _LIST_MARKER.sub("", text)
+    text = _EMPHASIS.sub(r"\2", text)
+    text = _TABLE_PIPE.sub(" ", text)
+    return " ".join(text.split())
+
+
+def make_excerpt(plain_text: str, length: int = EXCERPT_LENGTH) -> str:
+    """일반 텍스트 앞부분 발췌 (가능하면 단어 경계에서 자름)"""
+    if len(plain_text) <= length:
+        return plain_text
+    cut = plain_text[:length]
+    boundary = cut.rfind(" ")
+    if boundary > length // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
+
+
+def estimate_reading_minutes(plain_text: str) -> int:
+    """예상 읽기 시간(분) - 한글은 글자 수, 그 외 단어는 단어 수 기준 (최소 1분)"""
+    hangul_chars = len(_HANGUL.findall(plain_text))
+    other_words = sum(1 for word in _WORD.findall(plain_text) if not _HANGUL.search(word))
+    minutes = hangul_chars / HANGUL_CHARS_PER_MINUTE + other_words / WORDS_PER_MINUTE
+    return max(1, math.ceil(minutes))
+
+
+def content_hash(content: str) -> str:
+    """본문 SHA-256 해시 (변경 감지용)"""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+
+def compute_post_derived(content: str) -> Dict[str, Any]:
+    """posts 파생 컬럼 값 계산"""
+    plain = strip_markdown(content)
+    return {
+        "excerpt": make_excerpt(plain),
+        "word_count": len(_WORD.findall(plain)),
+        "char_count": len(plain.replace(" ", "")),
+        "reading_time_minutes": estimate_reading_minutes(plain),
+        "content_hash": content_hash(content),
+    }
+
+
+def apply_post_derived(post) -> None:
+    """Post 인스턴스의 파생 컬럼을 현재 본문 기준으로 갱신"""
+    for field, value in compute_post_derived(post.content).items():
+        setattr(post, field, value)
@@ -0,0 +1,172 @@
+"""
+포스트 관계 데이터 로더
+작성자, 카테고리, 편집자, 태그를 포스트 개수와 무관하게 고정된 쿼리 수로 로드합니다.
+
+- 작성자/카테고리: 본 쿼리에 JOIN (추가 쿼리 없음)
+- 편집자: post_id IN (...) 배치 1회 (편집자 User JOIN)
+- 태그: post_id IN (...) 배치 1회 (Tag JOIN)
+
+즉 목록/상세 조회 모두 최대 3개의 쿼리로 PostResponse에 필요한 데이터를 채웁니다.
+"""
+from typing import List, Optional, Sequence
+
+from sqlalchemy import func, select, cast, String
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload, load_only
+
+from database.models import Post, PostEditor, PostTag, User, Category
+from database.schemas import UserInfo, CategoryResponse, TagResponse
+
+# 목록 조회 시 선택 가능한 필드 (fields= 파라미터)
+POST_COLUMN_FIELDS = {
+    "id": Post.id,
+    "title": Post.title,
+    "content": Post.content,
+    "slug": Post.slug,
+    "is_published": Post.is_published,
+    "author_id": Post.author_id,
+    "category_id": Post.category_id,
+    "published_at": Post.published_at,
+    "created_at": Post.created_at,
+    "updated_at": Post.updated_at,
+    "excerpt": Post.excerpt,
+    "word_count": Post.word_count,
+    "char_count": Post.char_count,
+    "reading_time_minutes": Post.reading_time_minutes,
+    "content_hash": Post.content_hash,
+    "comment_count": Post.comment_count,
+    "last_comment_at": Post.last_comment_at,
+}
+POST_RELATION_FIELDS = {"author", "category", "editors", "tags"}
+
+# view=summary 응답 필드 (본문 대신 발췌)
+POST_SUMMARY_FIELDS = (
+    "id", "title", "slug", "excerpt", "word_count", "reading_time_minutes", "is_published",
+    "author_id", "category_id", "published_at", "created_at", "updated_at", "comment_count", "last_comment_at",
+    "author", "category", "tags",
+)
+
+
+def post_relation_options():
+    """PostResponse 직렬화에 필요한 관계 로딩 옵션"""
+    return (
+        joinedload(Post.author),
+        joinedload(Post.category),
+        selectinload(Post.post_editors).joinedload(PostEditor.user),
+        selectinload(Post.post_tags).joinedload(PostTag.tag),
+    )
+
+
+def select_posts_with_relations():
+    """관계 로딩 옵션이 적용된 Post SELECT 문 (동기/비동기 세션 공용)"""
+    return select(Post).options(*post_relation_options())
+
+
+def load_post(db: Session, post_id: int) -> Optional[Post]:
+    """단일 포스트를 관계 데이터와 함께 로드
+
+    커밋 직후 만료된 인스턴스도 다시 채우기 위해 populate_existing을 사용합니다.
+    비동기 세션에서는 await db.run_sync(load_post, post_id)로 호출합니다.
+    """
+    return db.scalar(
+        select_posts_with_relations()
+        .where(Post.id == post_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+
+def load_post_version(db: Session, post_id: int):
+    """포스트 응답의 버전 정보를 단일 쿼리로 조회 (ETag 생성용)
+
+    포스트 행, 작성자/카테고리 변경 시각, 편집자 목록, 태그 목록을 포함하며
+    본문(content)과 관계 객체는 로드하지 않습니다. 포스트가 없으면 None을 반환합니다.
+    """
+    editor_user = aliased(User)
+    editors_state = (
+        select(
+            func.string_agg(
+                cast(PostEditor.user_id, String) + ":" + func.coalesce(cast(editor_user.updated_at, String), ""),
+                aggregate_order_by(",", PostEditor.id)
+            )
+        )
+        .join(editor_user, editor_user.id == PostEditor.user_id)
+        .where(PostEditor.post_id == Post.id)
+        .scalar_subquery()
+    )
+    tags_state = (
+        select(func.string_agg(cast(PostTag.tag_id, String), aggregate_order_by(",", PostTag.tag_id)))
+        .where(PostTag.post_id == Post.id)
+        .scalar_subquery()
+    )
+    return (
+        db.query(
+            Post.id,
+            Post.is_published,
+            Post.published_at,
+            Post.created_at,
+            Post.updated_at,
+            Post.category_id,
+            Post.comment_count,
+            Post.last_comment_at,
+            User.updated_at.label("author_updated_at"),
+            Category.name.label("category_name"),
+            Category.slug.label("category_slug"),
+            Category.description.label("category_description"),
+            editors_state.label("editors_state"),
+            tags_state.label("tags_state"),
+        )
+        .join(User, User.id == Post.author_id)
+        .outerjoin(Category, Category.id == Post.category_id)
+        .filter(Post.id == post_id)
+        .first()
+    )
+
+
+def parse_post_fields(fields: str) -> List[str]:
+    """쉼표로 구분된 fields 파라미터 검증 (알 수 없는 필드는 ValueError)"""
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    allowed = set(POST_COLUMN_FIELDS) | POST_RELATION_FIELDS
+    unknown = [name for name in names if name not in allowed]
+    if unknown or not names:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested")
+    return names
+
+
+def post_projection_options(fields: Sequence[str], extra_columns: Sequence = ()):
+    """요청된 필드만 SELECT 하도록 하는 로딩 옵션
+
+    컬럼은 load_only로 제한하고(본문 미요청 시 content를 읽지 않음), 관계는 요청된 것만 로드합니다.
+    정렬/커서에 필요한 id, created_at은 항상 포함됩니다.
+    """
+    columns = [POST_COLUMN_FIELDS[name] for name in fields if name in POST_COLUMN_FIELDS]
+    columns += [Post.id, Post.created_at, *extra_columns]
+    options = [load_only(*dict.fromkeys(columns))]
+    if "author" in fields:
+        options.append(joinedload(Post.author).load_only(User.id, User.email, User.full_name))
+    if "category" in fields:
+        options.append(joinedload(Post.category))
+    if "editors" in fields:
+        options.append(
+            selectinload(Post.post_editors).joinedload(PostEditor.user).load_only(User.id, User.email, User.full_name)
+        )
+    if "tags" in fields:
+        options.append(selectinload(Post.post_tags).joinedload(PostTag.tag))
+    return options
+
+
+def serialize_post_fields(post: Post, fields: Sequence[str]) -> dict:
+    """요청된 필드만 담은 응답 dict 생성"""
+    item = {}
+    for name in fields:
+        if name == "author":
+            item[name] = UserInfo.model_validate(post.author).model_dump() if post.author else None
+        elif name == "category":
+            item[name] = CategoryResponse.model_validate(post.category).model_dump() if post.category else None
+        elif name == "editors":
+            item[name] = [UserInfo.model_validate(user).model_dump() for user in post.editors]
+        elif name == "tags":
+            item[name] = [TagResponse.model_validate(tag).model_dump() for tag in post.tags]
+        else:
+            item[name] = getattr(post, name)
+    return item
@@ -1,11 +1,13 @@
 """
 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Text, Index, text
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import TSVECTOR, JSONB, ARRAY
 from sqlalchemy.sql import func
 from database import Base
-import bcrypt
+from passwords import hash_password, check_password
 
 
 class User(Base):
@@ -22,19 +24,22 @@ class User(Base):
     is_editor = Column(Boolean, default=False)
     two_factor_enabled = Column(Boolean, default=False)
     two_factor_secret = Column(String, nullable=True)
-    reset_token = Column(String, nullable=True)
-    reset_token_expires = Column(DateTime, nullable=True)
+    # 액세스 토큰의 tv 클레임과 비교 - 올리면 이전에 발급된 토큰이 모두 무효
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    def revoke_tokens(self):
+        """발급된 액세스 토큰 무효화 (역할 변경, 비활성화, 비밀번호 변경 시)"""
+        self.token_version = (self.token_version or 0) + 1
+
     def verify_password(self, password: str) -> bool:
-        """비밀번호 검증"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.hashed_password.encode('utf-8'))
+        """비밀번호 검증 (동기 - 비동기 핸들러에서는 password_hasher.verify 사용)"""
+        return check_password(password, self.hashed_password)
 
     def set_password(self, password: str):
-        """비밀번호 해싱 및 저장"""
-        hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        self.hashed_password = hashed.decode('utf-8')
+        """비밀번호 해싱 및 저장 (동기 - 비동기 핸들러에서는 password_hasher.hash 사용)"""
+        self.hashed_password = hash_password(password)
 
     # Relationships
     posts = relationship("Post", back_populates="author", foreign_keys="Post.author_id")
@@ -42,6 +47,11 @@ class User(Base):
     edited_posts = relationship("PostEditor", back_populates="user")
 
 
+# 관리자 사용자 검색용 trigram 인덱스 (ILIKE '%q%' 및 similarity 정렬, pg_trgm 확장 필요)
+Index("ix_users_email_trgm", User.email, postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"})
+Index("ix_users_full_name_trgm", User.full_name, postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"})
+
+
 class Profile(Base):
     """사용자 프로필 모델"""
     __tablename__ = "profiles"
@@ -115,6 +125,10 @@ class PostTag(Base):
     tag = relationship("Tag", back_populates="posts")
 
 
+# 포스트당 같은 태그는 한 번만 연결 (INSERT ... ON CONFLICT DO NOTHING 및 post_id 조회에 사용)
+Index("uq_post_tags_post_id_tag_id", PostTag.post_id, PostTag.tag_id, unique=True)
+
+
 class Post(Base):
     """블로그 포스트 모델"""
     __tablename__ = "posts"
@@ -129,14 +143,74 @@ class Post(Base):
     published_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 전문 검색용 tsvector (제목 A / 본문 B 가중치, 한글 bigram) - database.search 참고
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    # 본문에서 파생된 컬럼 - 쓰기 시점에 갱신 (database.derived 참고)
+    excerpt = Column(Text, nullable=True)  # 마크다운을 제거한 발췌
+    word_count = Column(Integer, nullable=True)
+    char_count = Column(Integer, nullable=True)  # 공백 제외 문자 수
+    reading_time_minutes = Column(Integer, nullable=True)
+    content_hash = Column(String(64), nullable=True)  # 본문 SHA-256
+    # 댓글 통계 - 댓글 작성/삭제 시 갱신 (database.comment_stats 참고)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_comment_at = Column(DateTime(timezone=True), nullable=True)
+    # 문서 빈도(term_document_frequencies)에 반영된 용어 목록 - 수정/삭제 시 차이 계산용 (database.tag_extraction 참고)
+    indexed_terms = deferred(Column(ARRAY(Text), nullable=True))
 
     # Relationships
     author = relationship("User", back_populates="posts", foreign_keys=[author_id])
     category = relationship("Category", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
-    editors = relationship("PostEditor", back_populates="post", cascade="all, delete-orphan")
+    post_editors = relationship("PostEditor", back_populates="post", cascade="all, delete-orphan")
     post_tags = relationship("PostTag", back_populates="post", cascade="all, delete-orphan")
 
+    @hybrid_property
+    def last_activity_at(self):
+        """최근 활동 시각 (마지막 댓글 시각, 댓글이 없으면 작성 시각)"""
+        return self.last_comment_at or self.created_at
+
+    @last_activity_at.expression
+    def last_activity_at(cls):
+        return func.coalesce(cls.last_comment_at, cls.created_at)
+
+    @property
+    def editors(self):
+        """편집자 사용자 목록 (PostResponse.editors 용)"""
+        return [pe.user for pe in self.post_editors]
+
+    @property
+    def tags(self):
+        """태그 목록 (PostResponse.tags 용)"""
+        return [pt.tag for pt in self.post_tags]
+
+
+# 목록 조회용 키셋 페이지네이션 인덱스 (ORDER BY created_at DESC, id DESC)
+# - 전체 목록(편집자/관리자)
+Index("ix_posts_created_at_id", Post.created_at.desc(), Post.id.desc())
+# - 공개 목록(일반 사용자, published_only): is_published = true 부분 인덱스
+Index(
+    "ix_posts_published_created_at_id",
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=text("is_published"),
+)
+# 전문 검색 GIN 인덱스
+Index("ix_posts_search_vector", Post.search_vector, postgresql_using="gin")
+# 목록 정렬 인덱스 - sort=activity (최근 활동순), sort=comments (댓글 많은 순)
+Index("ix_posts_last_activity_at_id", Post.last_activity_at.desc(), Post.id.desc())
+Index("ix_posts_comment_count_created_at_id", Post.comment_count.desc(), Post.created_at.desc(), Post.id.desc())
+
+
+class TermDocumentFrequency(Base):
+    """자동 태그 추출용 용어별 문서 빈도 (TF-IDF의 DF)
+
+    term이 빈 문자열인 행은 반영된 전체 문서 수(N)를 담습니다.
+    """
+    __tablename__ = "term_document_frequencies"
+
+    term = Column(String, primary_key=True)
+    document_count = Column(Integer, nullable=False, default=0)
+
 
 class PostEditor(Base):
     """포스트 편집자 추적 모델"""
@@ -148,7 +222,7 @@ class PostEditor(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    post = relationship("Post", back_populates="editors")
+    post = relationship("Post", back_populates="post_editors")
     user = relationship("User", back_populates="edited_posts")
 
 
@@ -167,3 +241,101 @@ class Comment(Base):
     post = relationship("Post", back_populates="comments")
     user = relationship("User", back_populates="comments")
 
+
+
+# 댓글 피드 키셋 페이지네이션 인덱스 (ORDER BY created_at, id)
+# - 포스트별 댓글 (작성순/최신순 모두 사용)
+Index("ix_comments_post_id_created_at_id", Comment.post_id, Comment.created_at, Comment.id)
+# - 전체 댓글 모더레이션 피드 (최신순)
+Index("ix_comments_created_at_id", Comment.created_at.desc(), Comment.id.desc())
+# - 작성자별 필터
+Index("ix_comments_user_id_created_at_id", Comment.user_id, Comment.created_at.desc(), Comment.id.desc())
+
+
+class Job(Base):
+    """백그라운드 작업 모델 (jobs.py 작업 큐의 영속 저장소)
+
+    요청 트랜잭션 안에서 함께 INSERT 되므로(outbox), 커밋된 변경에 대한 작업은 프로세스가
+    재시작되어도 유실되지 않습니다.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)  # 작업 종류 (예: auto_tag_post)
+    payload = Column(JSONB, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="pending")  # pending, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())  # 다음 실행 가능 시각
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+# 실행 대기 작업 조회 (status = 'pending' 부분 인덱스)
+Index("ix_jobs_pending_run_at", Job.run_at, postgresql_where=text("status = 'pending'"))
+
+
+class RateLimitBucket(Base):
+    """요청 제한 토큰 버킷 (throttle.py의 Postgres 저장소 - 여러 워커가 공유)
+
+    tokens는 updated_at 시점의 남은 토큰 수이며, 조회 시 경과 시간만큼 다시 채워 계산합니다.
+    allowed는 마지막 요청의 허용 여부입니다 (한 번의 UPSERT로 판정과 갱신을 함께 하기 위해 저장).
+    """
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String, primary_key=True)  # 예: login:ip:203.0.113.7, login:email:user@example.com
+    tokens = Column(Float, nullable=False)
+    allowed = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class RefreshToken(Base):
+    """리프레시 토큰 (auth.py)
+
+    토큰 원문은 저장하지 않고 HMAC-SHA256 값만 저장합니다. 사용할 때마다 used_at을 기록하고 같은
+    family_id로 새 토큰을 발급(회전)하며, 이미 사용된 토큰이 다시 제시되면 탈취로 보고 family 전체를
+    폐기합니다. token_version은 발급 시점 사용자 값으로, 달라지면(비밀번호/역할 변경 등) 거절합니다.
+    """
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False, index=True)
+    family_id = Column(String, nullable=False, index=True)  # 로그인 한 번에서 이어지는 토큰 묶음
+    token_hash = Column(String, nullable=False, unique=True)
+    token_version = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    used_at = Column(DateTime(timezone=True), nullable=True)  # 회전된 시각 (다시 제시되면 재사용)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RevokedToken(Base):
+    """폐기된 액세스 토큰 (revocation.py)
+
+    로그아웃한 토큰의 jti를 토큰 만료 시각까지 보관합니다. 각 워커는 시작 시 이 테이블로 Bloom 필터를
+    만들고 LISTEN/NOTIFY로 갱신하여, 필터에 걸린 토큰만 jti(기본 키)로 조회합니다.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # 이후 행은 정리해도 됨
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class PasswordResetToken(Base):
+    """비밀번호 재설정 토큰 (auth.py)
+
+    토큰 원문은 저장하지 않고 SHA-256 값만 유일 인덱스로 저장합니다. 한 번 사용하면 used_at을
+    기록하며, 만료된 행은 sweeper.py가 주기적으로 일괄 삭제합니다.
+    """
+    __tablename__ = "password_reset_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String, nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    used_at = Column(DateTime(timezone=True), nullable=True)
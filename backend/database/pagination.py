@@ -0,0 +1,99 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+OFFSET 대신 마지막 행의 정렬 키를 기준으로 다음 페이지를 조회합니다.
+커서는 정렬 키 값 목록을 JSON으로 직렬화한 뒤 base64url로 인코딩한 불투명 문자열입니다.
+"""
+import base64
+import json
+import math
+from datetime import datetime
+from typing import Any, List, Sequence
+
+from sqlalchemy import Select, func, literal_column, select, tuple_
+from sqlalchemy.orm import Session
+
+# 이 개수 이하이면 정확한 개수, 초과하면 플래너 추정치를 반환
+EXACT_COUNT_THRESHOLD = 10000
+# 커서의 정수 값 범위 (Postgres bigint) - 벗어나면 쿼리 실행 시 오류가 나므로 디코딩 단계에서 거부
+CURSOR_INT_MIN = -(2 ** 63)
+CURSOR_INT_MAX = 2 ** 63 - 1
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록을 커서 문자열로 인코딩"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩
+
+    types에 datetime이 지정된 위치는 ISO 8601 문자열을 datetime으로 변환합니다.
+    형식이 잘못되었거나 값이 범위를 벗어난 경우(bigint 밖의 정수, 유한하지 않은 실수)
+    ValueError를 발생시킵니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+
+    decoded = []
+    for value, value_type in zip(values, types):
+        try:
+            if value_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            else:
+                decoded.append(value_type(value))
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError("Invalid cursor") from e
+        if value_type is int and not CURSOR_INT_MIN <= decoded[-1] <= CURSOR_INT_MAX:
+            raise ValueError("Invalid cursor")
+        if value_type is float and not math.isfinite(decoded[-1]):
+            raise ValueError("Invalid cursor")
+    return decoded
+
+
+def keyset_filter(columns: Sequence[Any], values: Sequence[Any], descending: bool = True):
+    """(col1, col2, ...) 행 비교 조건 생성
+
+    모든 정렬 컬럼이 같은 방향이어야 하며, 동일 순서의 복합 인덱스를 그대로 사용할 수 있습니다.
+    """
+    if descending:
+        return tuple_(*columns) < tuple_(*values)
+    return tuple_(*columns) > tuple_(*values)
+
+
+def split_page(rows: list, limit: int):
+    """limit + 1개 조회 결과를 (페이지, 다음 페이지 존재 여부)로 분리"""
+    return rows[:limit], len(rows) > limit
+
+
+def count_with_estimate(db: Session, statement: Select, threshold: int = EXACT_COUNT_THRESHOLD):
+    """조회 결과 개수를 (개수, 추정 여부)로 반환
+
+    threshold + 1개까지만 세어 보고, 그 이하이면 정확한 개수를 반환합니다.
+    초과하면 전체를 세지 않고 EXPLAIN의 예상 행 수를 반환합니다.
+    비동기 세션에서는 await db.run_sync(count_with_estimate, statement)로 호출합니다.
+    """
+    base = statement.order_by(None).limit(None).offset(None)
+
+    bounded = base.with_only_columns(literal_column("1"), maintain_column_froms=True).limit(threshold + 1).subquery()
+    exact = db.scalar(select(func.count()).select_from(bounded))
+    if exact <= threshold:
+        return exact, False
+
+    connection = db.connection()
+    compiled = base.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        # asyncpg 등 위치 기반 파라미터 드라이버
+        params = tuple(params[name] for name in compiled.positiontup)
+    plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimated = int(plan[0]["Plan"]["Plan Rows"])
+    return max(estimated, exact), True
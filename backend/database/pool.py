@@ -0,0 +1,147 @@
+"""
+데이터베이스 연결 풀 설정 및 계측
+풀 크기, 오버플로, 대기 시간 제한, 재활용 주기, pre-ping을 환경 변수로 설정하고,
+연결을 얻기까지 기다린 시간과 사용 중/오버플로 연결 수를 기록합니다 (GET /api/metrics/pool).
+
+워커 프로세스마다 동기 엔진과 비동기 엔진이 각각 풀을 가지므로, 워커 하나가 여는 최대 연결 수는
+2 × (DB_POOL_SIZE + DB_MAX_OVERFLOW)입니다. 워커 수를 곱한 값이 Postgres max_connections보다
+작아야 합니다.
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# 이 시간(초)보다 오래된 연결은 다음 체크아웃 때 다시 연결 (-1: 사용 안 함)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# 체크아웃 시 연결이 살아 있는지 확인 (DB 재시작/유휴 연결 끊김 대비)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# 최근 체크아웃 대기 시간 보관 개수
+WAIT_SAMPLES = 1000
+
+
+def pool_options() -> Dict[str, Any]:
+    """create_engine / create_async_engine에 넘길 풀 설정"""
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def percentile(values, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PoolStats:
+    """풀 하나의 체크아웃 대기 시간과 사용량 카운터
+
+    이벤트 리스너는 이 객체에 등록됩니다. dispose()로 풀이 다시 만들어지면 리스너도 새 풀로
+    복사되므로, 카운터와 현재 풀 참조(pool)를 이어받아 중복 집계 없이 계속 기록합니다.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self._counters = {
+            "checkouts": 0, "timeouts": 0, "connects": 0, "invalidations": 0,
+            "overflow_checkouts": 0, "peak_checked_out": 0, "peak_overflow": 0,
+        }
+        event.listen(pool, "checkout", self.on_checkout)
+        event.listen(pool, "connect", self.on_connect)
+        event.listen(pool, "invalidate", self.on_invalidate)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self._waits.append(seconds)
+            if timed_out:
+                self._counters["timeouts"] += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_out = self.pool.checkedout()
+        overflow = max(self.pool.overflow(), 0)
+        with self._lock:
+            self._counters["checkouts"] += 1
+            if checked_out > self.pool.size():
+                self._counters["overflow_checkouts"] += 1
+            self._counters["peak_checked_out"] = max(self._counters["peak_checked_out"], checked_out)
+            self._counters["peak_overflow"] = max(self._counters["peak_overflow"], overflow)
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._counters["connects"] += 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._counters["invalidations"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.pool
+        with self._lock:
+            waits = list(self._waits)
+            counters = dict(self._counters)
+        return {
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            **counters,
+            "checkout_wait_seconds": {
+                "p50": percentile(waits, 0.5),
+                "p95": percentile(waits, 0.95),
+                "max": max(waits) if waits else None,
+            },
+        }
+
+
+class InstrumentedPoolMixin:
+    """연결을 얻기까지 기다린 시간(풀이 가득 찬 경우 대기 포함)을 기록하는 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # recreate()로 만들어진 풀은 리스너가 복사되므로 stats를 이어받음
+        if "_dispatch" not in kwargs:
+            self.stats = PoolStats(self)
+
+    def connect(self):
+        # 풀이 가득 차 반환을 기다린 시간, 새 연결 생성, pre-ping까지 포함한 체크아웃 소요 시간
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        self.stats.pool = pool
+        return pool
+
+    def metrics(self) -> Dict[str, Any]:
+        return self.stats.snapshot()
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """동기 엔진용 계측 풀"""
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 계측 풀"""
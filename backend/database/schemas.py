@@ -43,6 +43,17 @@ class Token(BaseModel):
     """JWT 토큰 스키마"""
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """액세스 토큰 재발급 요청 스키마"""
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """로그아웃 요청 스키마 - 리프레시 토큰을 보내면 그 로그인 세션도 폐기"""
+    refresh_token: Optional[str] = None
 
 
 class ResetPasswordRequest(BaseModel):
@@ -176,6 +187,33 @@ class PostUpdate(BaseModel):
     tag_names: Optional[List[str]] = None  # 새 태그 이름 목록
 
 
+class PostImportRecord(BaseModel):
+    """대량 가져오기 NDJSON 한 줄 스키마"""
+    title: str
+    content: str
+    slug: Optional[str] = None  # 없으면 제목으로 생성
+    category: Optional[str] = None  # 카테고리 이름 (없으면 생성)
+    category_id: Optional[int] = None
+    tags: Optional[List[str]] = None  # 태그 이름 목록 (없으면 생성)
+    auto_tags: bool = True  # 본문에서 태그 자동 추출 여부
+    is_published: bool = False
+    published_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None  # 원본 블로그의 작성 시각 유지용
+
+
+class PostImportError(BaseModel):
+    """대량 가져오기 행 오류"""
+    line: int
+    error: str
+
+
+class PostImportResult(BaseModel):
+    """대량 가져오기 결과"""
+    created: int
+    failed: int
+    errors: List[PostImportError] = []
+
+
 class UserInfo(BaseModel):
     """사용자 정보 스키마 (포스트 응답용)"""
     id: int
@@ -199,6 +237,15 @@ class PostResponse(PostBase):
     category: Optional[CategoryResponse] = None
     tags: Optional[List[TagResponse]] = None
     editors: Optional[List[UserInfo]] = None
+    excerpt: Optional[str] = None
+    word_count: Optional[int] = None
+    char_count: Optional[int] = None
+    reading_time_minutes: Optional[int] = None
+    content_hash: Optional[str] = None
+    comment_count: int = 0
+    last_comment_at: Optional[datetime] = None
+    search_rank: Optional[float] = None  # 검색 시 관련도 점수
+    search_snippet: Optional[str] = None  # 검색 시 하이라이트된 본문 일부 (<mark>)
 
     class Config:
         from_attributes = True
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+동시 요청 처리량 벤치마크
+실행 중인 API 서버에 동시성 수준별로 요청을 보내 처리량(요청/초)과 지연 시간(p50/p95)을 측정합니다.
+부하와 함께 DB를 쓰지 않는 가벼운 요청(--probe-path, 기본 /health)의 지연 시간도 측정하므로,
+핸들러가 쿼리를 기다리는 동안 이벤트 루프를 막는지(동기 세션) 확인할 수 있습니다.
+
+변경 전후 비교는 같은 데이터로 각 버전의 서버를 워커 1개로 띄워 같은 옵션으로 실행합니다.
+    uvicorn main:app --port 8000 --workers 1
+
+실행 방법:
+    python -m database.scripts.benchmark_requests --email admin@example.com --password admin123
+    또는
+    cd backend && python database/scripts/benchmark_requests.py --concurrency 1,8,32 --duration 10
+
+옵션:
+    --url URL            서버 주소 (기본 http://localhost:8000)
+    --email/--password   로그인 계정 (요청에 Bearer 토큰 사용)
+    --path PATH          요청 경로 (여러 번 지정 가능, 순서대로 돌아가며 요청)
+    --concurrency LIST   동시 요청 수 목록 (쉼표 구분, 기본 1,8,32)
+    --duration SECONDS   동시성 수준별 측정 시간 (기본 10)
+    --probe-path PATH    부하 중 지연 시간을 함께 측정할 경로 (빈 값이면 생략)
+
+표준 라이브러리만 사용합니다.
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = ["/api/posts?limit=20", "/api/posts?view=summary&limit=50", "/api/auth/me"]
+PROBE_INTERVAL_SECONDS = 0.05
+
+
+def login(url: str, email: str, password: str) -> str:
+    """액세스 토큰 발급"""
+    body = urllib.parse.urlencode({"username": email, "password": password}).encode()
+    with urllib.request.urlopen(urllib.request.Request(f"{url}/api/auth/login", data=body), timeout=30) as response:
+        return json.load(response)["access_token"]
+
+
+def request(url: str, headers: dict) -> float:
+    """GET 요청 하나의 지연 시간 (초) - 실패하면 예외"""
+    started = time.perf_counter()
+    with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60) as response:
+        response.read()
+    return time.perf_counter() - started
+
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_level(url: str, paths, headers: dict, concurrency: int, duration: float, probe_path: str):
+    """동시성 수준 하나를 duration 동안 측정"""
+    deadline = time.monotonic() + duration
+    latencies, probes = [], []
+    errors = 0
+    lock = threading.Lock()
+
+    def client(index: int):
+        nonlocal errors
+        count = index
+        while time.monotonic() < deadline:
+            path = paths[count % len(paths)]
+            count += 1
+            try:
+                elapsed = request(url + path, headers)
+            except (urllib.error.URLError, OSError):
+                with lock:
+                    errors += 1
+                continue
+            with lock:
+                latencies.append(elapsed)
+
+    def probe():
+        while time.monotonic() < deadline:
+            try:
+                probes.append(request(url + probe_path, {}))
+            except (urllib.error.URLError, OSError):
+                pass
+            time.sleep(PROBE_INTERVAL_SECONDS)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency + 1) as executor:
+        futures = [executor.submit(client, i) for i in range(concurrency)]
+        if probe_path:
+            futures.append(executor.submit(probe))
+        for future in futures:
+            future.result()
+    elapsed = time.monotonic() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "probe_p95_ms": percentile(probes, 0.95) * 1000 if probe_path else None,
+    }
+
+
+def benchmark(url: str, email: str, password: str, paths, levels, duration: float, probe_path: str):
+    """벤치마크 실행 함수"""
+    try:
+        headers = {"Authorization": f"Bearer {login(url, email, password)}"}
+        print(f"🔄 벤치마크 시작... ({url}, 경로 {len(paths)}개, 수준별 {duration:.0f}초)\n")
+        header = f"{'동시성':>6} {'요청/초':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'오류':>6}"
+        if probe_path:
+            header += f" {'probe p95(ms)':>14}"
+        print(header)
+        results = []
+        for concurrency in levels:
+            result = run_level(url, paths, headers, concurrency, duration, probe_path)
+            results.append(result)
+            line = (f"{concurrency:>6} {result['rps']:>10.1f} {result['p50_ms']:>10.1f} "
+                    f"{result['p95_ms']:>10.1f} {result['errors']:>6}")
+            if probe_path:
+                line += f" {result['probe_p95_ms']:>14.1f}"
+            print(line)
+        print("\n✅ 벤치마크가 완료되었습니다!")
+        return results
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동시 요청 처리량 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--email", default="admin@example.com", help="로그인 이메일")
+    parser.add_argument("--password", default="admin123", help="로그인 비밀번호")
+    parser.add_argument("--path", action="append", dest="paths", help="요청 경로 (여러 번 지정 가능)")
+    parser.add_argument("--concurrency", default="1,8,32", help="동시 요청 수 목록 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=10, help="동시성 수준별 측정 시간 (초)")
+    parser.add_argument("--probe-path", default="/health", help="부하 중 지연 시간을 측정할 경로")
+    args = parser.parse_args()
+    benchmark(
+        url=args.url.rstrip("/"),
+        email=args.email,
+        password=args.password,
+        paths=args.paths or DEFAULT_PATHS,
+        levels=[int(level) for level in args.concurrency.split(",") if level.strip()],
+        duration=args.duration,
+        probe_path=args.probe_path,
+    )
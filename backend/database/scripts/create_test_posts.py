@@ -17,6 +17,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from database import SessionLocal
 from database.models import User, Post, Category, Tag, PostTag
+from database.search import search_vector_expression
+from database.derived import apply_post_derived
 import re
 
 
@@ -500,8 +502,10 @@ TDD는 모든 상황에 적합하지 않지만, 장기적으로 코드 품질을
                 category_id=category.id,
                 is_published=post_data.get("is_published", False),
                 published_at=published_at,
-                created_at=created_at
+                created_at=created_at,
+                search_vector=search_vector_expression(post_data["title"], post_data["content"])
             )
+            apply_post_derived(new_post)
             
             db.add(new_post)
             db.commit()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+NDJSON 파일에서 포스트 대량 가져오기
+한 줄에 포스트 하나(title, content, slug, category, tags, is_published, published_at, created_at ...)를
+배치 단위 집합 기반 문장으로 저장합니다. POST /api/posts/bulk 와 같은 처리를 사용합니다.
+
+실행 방법:
+    python -m database.scripts.import_posts posts.ndjson --author-email admin@example.com
+    또는
+    cd backend && python database/scripts/import_posts.py posts.ndjson --author-email admin@example.com
+
+옵션:
+    -                  파일 대신 표준 입력에서 읽기
+    --batch-size N     배치당 행 수 (기본 1000)
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import SessionLocal
+from database.models import User
+from database.bulk_import import import_post_batch, IMPORT_BATCH_SIZE
+
+
+def import_posts(path: str, author_email: str, batch_size: int = IMPORT_BATCH_SIZE):
+    """가져오기 실행 함수"""
+    db = SessionLocal()
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        author = db.query(User).filter(User.email == author_email).first()
+        if not author:
+            print(f"❌ 작성자를 찾을 수 없습니다: {author_email}")
+            sys.exit(1)
+        author_id = author.id
+
+        print(f"🔄 가져오기 시작... (작성자: {author_email})\n")
+        started = time.monotonic()
+        created = 0
+        failed = 0
+        batch = []
+
+        def flush():
+            nonlocal created, failed
+            batch_created, errors = import_post_batch(db, batch, author_id)
+            created += batch_created
+            failed += len(errors)
+            for error in errors:
+                print(f"  ✗ {error['line']}행: {error['error']}")
+            batch.clear()
+            print(f"  ... {created}개 생성 ({created / max(time.monotonic() - started, 1e-9):.0f}개/초)")
+
+        for line_no, line in enumerate(source, start=1):
+            batch.append((line_no, line))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+
+        print(f"\n✅ {created}개 포스트를 가져왔습니다. (실패 {failed}개, {time.monotonic() - started:.1f}초)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NDJSON 파일에서 포스트 대량 가져오기")
+    parser.add_argument("path", help="NDJSON 파일 경로 (- 이면 표준 입력)")
+    parser.add_argument("--author-email", required=True, help="가져온 포스트의 작성자 이메일")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="배치당 행 수")
+    args = parser.parse_args()
+    import_posts(args.path, args.author_email, batch_size=args.batch_size)
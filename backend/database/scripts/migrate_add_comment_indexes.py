@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+comments 테이블에 댓글 피드용 인덱스 추가 마이그레이션
+댓글 목록의 (created_at, id) 정렬과 커서 조건, 포스트/작성자 필터를 인덱스로 처리합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_comment_indexes
+    또는
+    cd backend && python database/scripts/migrate_add_comment_indexes.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+INDEX_NAMES = [
+    "ix_comments_post_id_created_at_id",
+    "ix_comments_created_at_id",
+    "ix_comments_user_id_created_at_id",
+]
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        from database.models import Comment
+        indexes = {index.name: index for index in Comment.__table__.indexes}
+
+        for index_name in INDEX_NAMES:
+            # 인덱스가 있는지 확인
+            result = db.execute(text("""
+                SELECT indexname
+                FROM pg_indexes
+                WHERE tablename='comments' AND indexname=:name
+            """), {"name": index_name})
+
+            if result.fetchone():
+                print(f"✓ {index_name} 인덱스가 이미 존재합니다.")
+            else:
+                indexes[index_name].create(engine, checkfirst=True)
+                print(f"✓ {index_name} 인덱스를 생성했습니다.")
+
+        db.execute(text("ANALYZE comments"))
+        db.commit()
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+jobs 테이블 추가 마이그레이션
+백그라운드 작업 큐(jobs.py)의 작업을 저장하는 jobs 테이블과 대기 작업 인덱스를 생성합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_jobs
+    또는
+    cd backend && python database/scripts/migrate_add_jobs.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # jobs 테이블이 있는지 확인
+        result = db.execute(text("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_name='jobs'
+        """))
+
+        if result.fetchone():
+            print("✓ jobs 테이블이 이미 존재합니다.")
+        else:
+            # jobs 테이블 생성 (ix_jobs_pending_run_at 인덱스 포함)
+            from database.models import Job
+            Job.__table__.create(engine, checkfirst=True)
+            print("✓ jobs 테이블을 생성했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
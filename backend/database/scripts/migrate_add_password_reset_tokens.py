@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+비밀번호 재설정 토큰 테이블 추가 마이그레이션
+password_reset_tokens 테이블(토큰 SHA-256 유일 인덱스, 만료 시각 인덱스)을 생성하고,
+더 이상 사용하지 않는 users.reset_token / reset_token_expires 컬럼을 삭제합니다.
+(배포 전에 발송된 재설정 링크는 사용할 수 없게 되므로 다시 요청해야 합니다.)
+
+실행 방법:
+    python -m database.scripts.migrate_add_password_reset_tokens
+    또는
+    cd backend && python database/scripts/migrate_add_password_reset_tokens.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # password_reset_tokens 테이블이 있는지 확인
+        result = db.execute(text("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_name='password_reset_tokens'
+        """))
+
+        if result.fetchone():
+            print("✓ password_reset_tokens 테이블이 이미 존재합니다.")
+        else:
+            from database.models import PasswordResetToken
+            PasswordResetToken.__table__.create(engine, checkfirst=True)
+            print("✓ password_reset_tokens 테이블을 생성했습니다.")
+
+        # users의 평문 재설정 토큰 컬럼 삭제
+        for column in ("reset_token", "reset_token_expires"):
+            result = db.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='users' AND column_name=:column
+            """), {"column": column})
+
+            if result.fetchone():
+                db.execute(text(f"ALTER TABLE users DROP COLUMN {column}"))
+                db.commit()
+                print(f"✓ users.{column} 컬럼을 삭제했습니다.")
+            else:
+                print(f"✓ users.{column} 컬럼이 이미 없습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
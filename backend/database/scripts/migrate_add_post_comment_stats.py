@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+posts 테이블에 댓글 통계 컬럼 추가 및 백필 마이그레이션
+comment_count, last_comment_at 컬럼과 정렬 인덱스(최근 활동순/댓글 많은 순)를 추가하고
+기존 댓글로부터 값을 계산합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_post_comment_stats
+    또는
+    cd backend && python database/scripts/migrate_add_post_comment_stats.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+COLUMNS = [
+    ("comment_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("last_comment_at", "TIMESTAMP WITH TIME ZONE"),
+]
+
+INDEX_NAMES = [
+    "ix_posts_last_activity_at_id",
+    "ix_posts_comment_count_created_at_id",
+]
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        for column_name, column_type in COLUMNS:
+            # 컬럼이 있는지 확인
+            result = db.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='posts' AND column_name=:name
+            """), {"name": column_name})
+
+            if result.fetchone():
+                print(f"✓ {column_name} 컬럼이 이미 존재합니다.")
+            else:
+                db.execute(text(f"ALTER TABLE posts ADD COLUMN {column_name} {column_type}"))
+                db.commit()
+                print(f"✓ {column_name} 컬럼을 추가했습니다.")
+
+        from database.comment_stats import reconcile_comment_stats
+        repaired = reconcile_comment_stats(db)
+        print(f"✓ {repaired}개 포스트의 댓글 통계를 계산했습니다.")
+
+        from database.models import Post
+        indexes = {index.name: index for index in Post.__table__.indexes}
+
+        for index_name in INDEX_NAMES:
+            # 인덱스가 있는지 확인
+            result = db.execute(text("""
+                SELECT indexname
+                FROM pg_indexes
+                WHERE tablename='posts' AND indexname=:name
+            """), {"name": index_name})
+
+            if result.fetchone():
+                print(f"✓ {index_name} 인덱스가 이미 존재합니다.")
+            else:
+                indexes[index_name].create(engine, checkfirst=True)
+                print(f"✓ {index_name} 인덱스를 생성했습니다.")
+
+        db.execute(text("ANALYZE posts"))
+        db.commit()
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
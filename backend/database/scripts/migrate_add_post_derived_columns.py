@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+posts 테이블에 본문 파생 컬럼 추가 및 백필 마이그레이션
+excerpt, word_count, char_count, reading_time_minutes, content_hash 컬럼을 추가하고
+기존 포스트의 값을 배치로 계산합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_post_derived_columns
+    또는
+    cd backend && python database/scripts/migrate_add_post_derived_columns.py
+
+옵션:
+    --recompute   이미 계산된 포스트도 다시 계산 (추출 규칙 변경 시)
+"""
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import SessionLocal
+from sqlalchemy import bindparam, text, update
+
+BATCH_SIZE = 500
+
+COLUMNS = [
+    ("excerpt", "TEXT"),
+    ("word_count", "INTEGER"),
+    ("char_count", "INTEGER"),
+    ("reading_time_minutes", "INTEGER"),
+    ("content_hash", "VARCHAR(64)"),
+]
+
+
+def backfill_derived_columns(db, recompute: bool = False):
+    """파생 컬럼을 id 순서로 배치 계산 (기본은 content_hash가 비어 있는 행만)"""
+    from database.models import Post
+    from database.derived import compute_post_derived
+
+    posts = Post.__table__
+    # 백필은 포스트 수정이 아니므로 updated_at을 그대로 두어 onupdate 적용을 막음
+    set_derived = (
+        update(posts)
+        .where(posts.c.id == bindparam("b_id"))
+        .values(
+            **{name: bindparam(f"b_{name}") for name, _ in COLUMNS},
+            updated_at=posts.c.updated_at,
+        )
+    )
+    total = 0
+    last_id = 0
+    while True:
+        query = db.query(Post.id, Post.content).filter(Post.id > last_id)
+        if not recompute:
+            query = query.filter(Post.content_hash.is_(None))
+        rows = query.order_by(Post.id).limit(BATCH_SIZE).all()
+        if not rows:
+            break
+        params = []
+        for post_id, content in rows:
+            derived = compute_post_derived(content)
+            params.append({"b_id": post_id, **{f"b_{name}": derived[name] for name, _ in COLUMNS}})
+        db.execute(set_derived, params)
+        db.commit()
+        total += len(rows)
+        last_id = rows[-1].id
+        print(f"  ... {total}개 포스트 처리 완료")
+    return total
+
+
+def migrate(recompute: bool = False):
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        for column_name, column_type in COLUMNS:
+            # 컬럼이 있는지 확인
+            result = db.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='posts' AND column_name=:name
+            """), {"name": column_name})
+
+            if result.fetchone():
+                print(f"✓ {column_name} 컬럼이 이미 존재합니다.")
+            else:
+                db.execute(text(f"ALTER TABLE posts ADD COLUMN {column_name} {column_type}"))
+                db.commit()
+                print(f"✓ {column_name} 컬럼을 추가했습니다.")
+
+        total = backfill_derived_columns(db, recompute=recompute)
+        print(f"✓ {total}개 포스트의 파생 컬럼을 계산했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="posts 파생 컬럼 추가 및 백필")
+    parser.add_argument("--recompute", action="store_true", help="모든 포스트의 파생 컬럼을 다시 계산")
+    args = parser.parse_args()
+    migrate(recompute=args.recompute)
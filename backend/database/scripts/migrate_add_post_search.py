@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+posts 테이블에 전문 검색 컬럼(search_vector)과 GIN 인덱스 추가 마이그레이션
+기존 포스트의 search_vector도 배치로 채웁니다. (재실행 시 비어 있는 행만 처리)
+
+실행 방법:
+    python -m database.scripts.migrate_add_post_search
+    또는
+    cd backend && python database/scripts/migrate_add_post_search.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+BATCH_SIZE = 500
+
+
+def backfill_search_vectors(db):
+    """search_vector가 비어 있는 포스트를 id 순서로 배치 처리"""
+    from database.models import Post
+    from database.search import search_vector_expression
+
+    total = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Post.id, Post.title, Post.content)
+            .filter(Post.id > last_id, Post.search_vector.is_(None))
+            .order_by(Post.id)
+            .limit(BATCH_SIZE)
+            .all()
+        )
+        if not rows:
+            break
+        for post_id, title, content in rows:
+            db.query(Post).filter(Post.id == post_id).update(
+                # 색인 백필은 포스트 수정이 아니므로 onupdate(updated_at) 적용을 막음
+                {Post.search_vector: search_vector_expression(title, content), Post.updated_at: Post.updated_at},
+                synchronize_session=False
+            )
+        db.commit()
+        total += len(rows)
+        last_id = rows[-1].id
+        print(f"  ... {total}개 포스트 색인 완료")
+    return total
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # search_vector 컬럼이 있는지 확인
+        result = db.execute(text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name='posts' AND column_name='search_vector'
+        """))
+
+        if result.fetchone():
+            print("✓ search_vector 컬럼이 이미 존재합니다.")
+        else:
+            db.execute(text("ALTER TABLE posts ADD COLUMN search_vector TSVECTOR"))
+            db.commit()
+            print("✓ search_vector 컬럼을 추가했습니다.")
+
+        # 기존 포스트 색인
+        total = backfill_search_vectors(db)
+        print(f"✓ {total}개 포스트의 검색 색인을 생성했습니다.")
+
+        # GIN 인덱스가 있는지 확인 (백필 후 생성하는 편이 빠름)
+        result = db.execute(text("""
+            SELECT indexname
+            FROM pg_indexes
+            WHERE tablename='posts' AND indexname='ix_posts_search_vector'
+        """))
+
+        if result.fetchone():
+            print("✓ ix_posts_search_vector 인덱스가 이미 존재합니다.")
+        else:
+            from database.models import Post
+            indexes = {index.name: index for index in Post.__table__.indexes}
+            db.commit()
+            indexes["ix_posts_search_vector"].create(engine, checkfirst=True)
+            print("✓ ix_posts_search_vector 인덱스를 생성했습니다.")
+
+        db.execute(text("ANALYZE posts"))
+        db.commit()
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+post_tags (post_id, tag_id) 유일 인덱스 추가 마이그레이션
+중복 연결을 정리한 뒤 유일 인덱스를 생성합니다. 태그 재지정(retag_posts) 등의
+배치 upsert(INSERT ... ON CONFLICT DO NOTHING)에 필요합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_post_tags_unique
+    또는
+    cd backend && python database/scripts/migrate_add_post_tags_unique.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+INDEX_NAME = "uq_post_tags_post_id_tag_id"
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # 인덱스가 있는지 확인
+        result = db.execute(text("""
+            SELECT indexname
+            FROM pg_indexes
+            WHERE tablename='post_tags' AND indexname=:name
+        """), {"name": INDEX_NAME})
+
+        if result.fetchone():
+            print(f"✓ {INDEX_NAME} 인덱스가 이미 존재합니다.")
+        else:
+            # 중복 연결 정리 (가장 먼저 만든 행만 유지)
+            result = db.execute(text("""
+                DELETE FROM post_tags AS a
+                USING post_tags AS b
+                WHERE a.post_id = b.post_id AND a.tag_id = b.tag_id AND a.id > b.id
+            """))
+            db.commit()
+            print(f"✓ 중복 태그 연결 {result.rowcount}개를 삭제했습니다.")
+
+            from database.models import PostTag
+            indexes = {index.name: index for index in PostTag.__table__.indexes}
+            indexes[INDEX_NAME].create(engine, checkfirst=True)
+            print(f"✓ {INDEX_NAME} 인덱스를 생성했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
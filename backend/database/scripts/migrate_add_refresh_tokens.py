@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+리프레시 토큰 테이블 추가 마이그레이션
+POST /api/auth/refresh에서 사용하는 refresh_tokens 테이블(토큰 HMAC 유일 인덱스)을 생성합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_refresh_tokens
+    또는
+    cd backend && python database/scripts/migrate_add_refresh_tokens.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # refresh_tokens 테이블이 있는지 확인
+        result = db.execute(text("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_name='refresh_tokens'
+        """))
+
+        if result.fetchone():
+            print("✓ refresh_tokens 테이블이 이미 존재합니다.")
+        else:
+            from database.models import RefreshToken
+            RefreshToken.__table__.create(engine, checkfirst=True)
+            print("✓ refresh_tokens 테이블을 생성했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+자동 태그용 문서 빈도 테이블 추가 마이그레이션
+term_document_frequencies 테이블과 posts.indexed_terms 컬럼을 추가하고,
+기존 포스트로 문서 빈도를 계산합니다 (database.tag_extraction 참고).
+
+실행 방법:
+    python -m database.scripts.migrate_add_term_frequencies
+    또는
+    cd backend && python database/scripts/migrate_add_term_frequencies.py
+
+옵션:
+    --rebuild   이미 있는 문서 빈도도 전체 포스트로 다시 계산 (추출 규칙/불용어 변경 시)
+"""
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+
+def migrate(rebuild: bool = False):
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # term_document_frequencies 테이블이 있는지 확인
+        result = db.execute(text("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_name='term_document_frequencies'
+        """))
+
+        if result.fetchone():
+            print("✓ term_document_frequencies 테이블이 이미 존재합니다.")
+        else:
+            from database.models import TermDocumentFrequency
+            TermDocumentFrequency.__table__.create(engine, checkfirst=True)
+            print("✓ term_document_frequencies 테이블을 생성했습니다.")
+            rebuild = True
+
+        # indexed_terms 컬럼이 있는지 확인
+        result = db.execute(text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name='posts' AND column_name='indexed_terms'
+        """))
+
+        if result.fetchone():
+            print("✓ indexed_terms 컬럼이 이미 존재합니다.")
+        else:
+            db.execute(text("ALTER TABLE posts ADD COLUMN indexed_terms TEXT[]"))
+            db.commit()
+            print("✓ indexed_terms 컬럼을 추가했습니다.")
+            rebuild = True
+
+        if rebuild:
+            from database.tag_extraction import rebuild_document_frequencies
+            print("🔄 문서 빈도 계산 중...")
+            total = rebuild_document_frequencies(db)
+            print(f"✓ {total}개 포스트로 문서 빈도를 계산했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="자동 태그용 문서 빈도 테이블 추가")
+    parser.add_argument("--rebuild", action="store_true", help="전체 포스트로 문서 빈도 다시 계산")
+    args = parser.parse_args()
+    migrate(rebuild=args.rebuild)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+사용자 token_version 컬럼 추가 마이그레이션
+액세스 토큰의 tv 클레임과 비교할 users.token_version 컬럼을 추가합니다.
+역할 변경, 비활성화, 비밀번호 변경 시 값이 올라가 이전에 발급된 토큰이 무효가 됩니다.
+
+배포 후에는 uid/roles/tv 클레임이 없는 이전 형식의 토큰이 거부되므로 사용자는 다시 로그인해야 합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_token_version
+    또는
+    cd backend && python database/scripts/migrate_add_token_version.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import SessionLocal
+from sqlalchemy import text
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        # token_version 컬럼이 있는지 확인
+        result = db.execute(text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name='users' AND column_name='token_version'
+        """))
+
+        if result.fetchone():
+            print("✓ token_version 컬럼이 이미 존재합니다.")
+        else:
+            # PostgreSQL 11+에서는 상수 기본값 컬럼 추가가 테이블 재작성 없이 처리됨
+            db.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
+            db.commit()
+            print("✓ token_version 컬럼을 추가했습니다.")
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+users 테이블에 trigram 검색 인덱스 추가 마이그레이션
+pg_trgm 확장을 활성화하고 email/full_name에 GIN(gin_trgm_ops) 인덱스를 생성합니다.
+
+실행 방법:
+    python -m database.scripts.migrate_add_user_search_indexes
+    또는
+    cd backend && python database/scripts/migrate_add_user_search_indexes.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import engine, SessionLocal
+from sqlalchemy import text
+
+INDEX_NAMES = [
+    "ix_users_email_trgm",
+    "ix_users_full_name_trgm",
+]
+
+
+def migrate():
+    """마이그레이션 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 마이그레이션 시작...\n")
+
+        db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        db.commit()
+        print("✓ pg_trgm 확장을 활성화했습니다.")
+
+        from database.models import User
+        indexes = {index.name: index for index in User.__table__.indexes}
+
+        for index_name in INDEX_NAMES:
+            # 인덱스가 있는지 확인
+            result = db.execute(text("""
+                SELECT indexname
+                FROM pg_indexes
+                WHERE tablename='users' AND indexname=:name
+            """), {"name": index_name})
+
+            if result.fetchone():
+                print(f"✓ {index_name} 인덱스가 이미 존재합니다.")
+            else:
+                indexes[index_name].create(engine, checkfirst=True)
+                print(f"✓ {index_name} 인덱스를 생성했습니다.")
+
+        db.execute(text("ANALYZE users"))
+        db.commit()
+
+        print("\n✅ 마이그레이션이 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+포스트 댓글 통계 정합성 복구
+comments 테이블을 기준으로 posts.comment_count / last_comment_at을 다시 계산하고
+어긋난 행만 갱신합니다. 직접 SQL로 댓글을 넣거나 지운 뒤, 또는 주기 작업(cron)으로 실행합니다.
+
+실행 방법:
+    python -m database.scripts.reconcile_post_comment_stats
+    또는
+    cd backend && python database/scripts/reconcile_post_comment_stats.py
+
+옵션:
+    --batch-size N   한 트랜잭션에서 처리할 포스트 수 (기본 1000)
+"""
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import SessionLocal
+from database.comment_stats import reconcile_comment_stats, RECONCILE_BATCH_SIZE
+
+
+def reconcile(batch_size: int = RECONCILE_BATCH_SIZE):
+    """정합성 복구 실행 함수"""
+    db = SessionLocal()
+    try:
+        print("🔄 댓글 통계 정합성 확인 중...\n")
+
+        repaired = reconcile_comment_stats(db, batch_size=batch_size)
+        if repaired:
+            print(f"✓ {repaired}개 포스트의 댓글 통계를 바로잡았습니다.")
+        else:
+            print("✓ 어긋난 댓글 통계가 없습니다.")
+
+        print("\n✅ 완료되었습니다!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="posts 댓글 통계 정합성 복구")
+    parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE, help="배치당 포스트 수")
+    args = parser.parse_args()
+    reconcile(batch_size=args.batch_size)
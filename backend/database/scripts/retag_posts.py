@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+기존 포스트 자동 태그 재지정
+불용어 목록이나 추출 규칙을 바꾼 뒤 전체 포스트에 다시 적용합니다.
+
+- 포스트를 id 순서로 청크 단위 스트리밍하고, 추출은 ProcessPoolExecutor로 모든 코어에서 병렬 실행
+- 기본 추출기(tfidf)는 시작 시점의 문서 빈도 스냅샷을 작업 프로세스마다 한 번 전달하고
+  청크 단위로 NumPy 점수 계산 (database.tag_extraction)
+- 청크마다 태그 이름 upsert 1회 + 조회 1회, post_tags 배치 upsert(ON CONFLICT DO NOTHING) 1회
+- 청크를 커밋할 때마다 체크포인트 파일에 마지막 포스트 id를 기록하여 --resume으로 이어서 실행
+
+기본(add)은 추출된 태그 중 없는 연결만 추가합니다. --replace는 추출 결과에 없는 연결을
+삭제하므로, 편집자가 직접 선택한 태그도 추출되지 않으면 제거됩니다 (--dry-run으로 먼저 확인).
+
+실행 방법:
+    python -m database.scripts.retag_posts --dry-run
+    python -m database.scripts.retag_posts
+    또는
+    cd backend && python database/scripts/retag_posts.py
+
+옵션:
+    --dry-run            변경 내용(+추가/-삭제)만 출력하고 저장하지 않음
+    --replace            추출 결과에 없는 태그 연결 삭제
+    --chunk-size N       청크당 포스트 수 (기본 500)
+    --workers N          추출 프로세스 수 (기본 CPU 코어 수)
+    --checkpoint PATH    체크포인트 파일 (기본 .retag_posts.checkpoint.json)
+    --resume             체크포인트의 다음 포스트부터 이어서 실행 (체크포인트와 같은 --replace 여부 필요)
+    --extractor NAME     tfidf(기본) 또는 frequency(본문 빈도만 사용하는 기존 추출기)
+
+선행 마이그레이션: migrate_add_post_tags_unique (post_tags 유일 인덱스),
+                  migrate_add_term_frequencies (문서 빈도 테이블, tfidf 추출기)
+"""
+import sys
+import os
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from cache import invalidate_cache_tags
+from database import SessionLocal
+from database.models import Post, Tag, PostTag
+from database.tags import slugify, extract_tags_from_content, resolve_slug_ids
+from database.tag_extraction import extract_tags_batch, load_all_document_frequencies
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_CHECKPOINT = ".retag_posts.checkpoint.json"
+EXTRACTORS = ("tfidf", "frequency")
+
+# 작업 프로세스의 문서 빈도 스냅샷 ({용어: DF}, 전체 문서 수) - init_worker에서 설정
+_frequencies = None
+
+
+def init_worker(frequencies):
+    """작업 프로세스 초기화 - 문서 빈도 스냅샷을 프로세스당 한 번만 받음"""
+    global _frequencies
+    _frequencies = frequencies
+
+
+def extract_chunk(rows):
+    """[(id, title, content)] → [(id, {slug: name})] (작업 프로세스에서 실행)"""
+    documents = [(title, content) for _, title, content in rows]
+    if _frequencies is None:
+        extracted = [extract_tags_from_content(title, content) for title, content in documents]
+    else:
+        extracted = extract_tags_batch(documents, *_frequencies)
+    results = []
+    for (post_id, _, _), tag_names in zip(rows, extracted):
+        names = {}
+        for name in tag_names:
+            name = name.strip()
+            slug = slugify(name)
+            if slug and slug not in names:
+                names[slug] = name
+        results.append((post_id, names))
+    return results
+
+
+def iter_chunks(db, start_after: int, chunk_size: int):
+    """id 순서 키셋 조회로 포스트를 청크 단위 스트리밍 (본문은 청크 하나 분량만 메모리에 유지)"""
+    last_id = start_after
+    while True:
+        rows = db.execute(
+            select(Post.id, Post.title, Post.content)
+            .where(Post.id > last_id)
+            .order_by(Post.id)
+            .limit(chunk_size)
+        ).all()
+        db.rollback()  # 읽기 트랜잭션을 길게 유지하지 않음
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield [tuple(row) for row in rows]
+
+
+def load_current_links(db, post_ids):
+    """{post_id: {slug: (post_tags.id, tag_id)}}"""
+    links = {post_id: {} for post_id in post_ids}
+    rows = db.execute(
+        select(PostTag.id, PostTag.post_id, PostTag.tag_id, Tag.slug)
+        .join(Tag, Tag.id == PostTag.tag_id)
+        .where(PostTag.post_id.in_(post_ids))
+    ).all()
+    for row in rows:
+        links[row.post_id][row.slug] = (row.id, row.tag_id)
+    return links
+
+
+def apply_chunk(db, results, replace: bool, dry_run: bool):
+    """추출 결과를 반영하고 (추가 수, 삭제 수)를 반환"""
+    current = load_current_links(db, [post_id for post_id, _ in results])
+
+    diffs = []
+    for post_id, names in results:
+        added = [slug for slug in names if slug not in current[post_id]]
+        removed = [slug for slug in current[post_id] if slug not in names] if replace else []
+        if added or removed:
+            diffs.append((post_id, names, added, removed))
+
+    if dry_run:
+        for post_id, names, added, removed in diffs:
+            changes = [f"+{names[slug]}" for slug in added] + [f"-{slug}" for slug in removed]
+            print(f"  post {post_id}: {' '.join(changes)}")
+        db.rollback()
+        return sum(len(d[2]) for d in diffs), sum(len(d[3]) for d in diffs)
+
+    tag_ids = resolve_slug_ids(db, Tag, [names[slug] for _, names, added, _ in diffs for slug in added])
+    links = [
+        {"post_id": post_id, "tag_id": tag_ids[slug]}
+        for post_id, _, added, _ in diffs for slug in added if slug in tag_ids
+    ]
+    if links:
+        db.execute(insert(PostTag).values(links).on_conflict_do_nothing(index_elements=["post_id", "tag_id"]))
+    removed_ids = [current[post_id][slug][0] for post_id, _, _, removed in diffs for slug in removed]
+    if removed_ids:
+        db.execute(delete(PostTag).where(PostTag.id.in_(removed_ids)))
+    if diffs:
+        # 커밋되면 모든 서버 워커의 태그 목록/포스트 상세 캐시가 무효화됨
+        invalidate_cache_tags(db, "tags", *(f"post:{post_id}" for post_id, _, _, _ in diffs))
+    db.commit()
+    return len(links), len(removed_ids)
+
+
+def read_checkpoint(path: str):
+    """체크포인트의 (마지막 포스트 id, replace 여부) - 파일이 없으면 (0, None)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return 0, None
+    return int(data["last_post_id"]), data.get("replace")
+
+
+def write_checkpoint(path: str, last_post_id: int, replace: bool):
+    """체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 손상되지 않음)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"last_post_id": last_post_id, "replace": replace, "updated_at": time.time()}, f)
+    os.replace(tmp_path, path)
+
+
+def retag_posts(
+    dry_run: bool = False,
+    replace: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = None,
+    checkpoint: str = DEFAULT_CHECKPOINT,
+    resume: bool = False,
+    extractor: str = "tfidf",
+):
+    """태그 재지정 실행 함수"""
+    db = SessionLocal()
+    try:
+        start_after, checkpoint_replace = read_checkpoint(checkpoint) if resume else (0, None)
+        # 모드가 바뀌면 앞부분과 뒷부분 포스트의 결과가 달라지므로 이어서 실행하지 않음
+        if checkpoint_replace is not None and checkpoint_replace != replace:
+            flag = "--replace와 함께" if checkpoint_replace else "--replace 없이"
+            print(f"❌ 체크포인트는 {'replace' if checkpoint_replace else 'add'} 모드로 기록되었습니다. "
+                  f"{flag} --resume 하거나, 체크포인트 파일을 지우고 처음부터 실행하세요.")
+            sys.exit(1)
+        workers = workers or os.cpu_count() or 1
+        mode = "replace" if replace else "add"
+        print(f"🔄 태그 재지정 시작... (mode={mode}, extractor={extractor}, workers={workers}, "
+              f"시작 id > {start_after}{', dry-run' if dry_run else ''})\n")
+
+        frequencies = None
+        if extractor == "tfidf":
+            frequencies = load_all_document_frequencies(db)
+            db.rollback()
+            print(f"  문서 빈도 스냅샷: 용어 {len(frequencies[0])}개, 문서 {frequencies[1]}개\n")
+
+        started = time.monotonic()
+        processed = added_total = removed_total = 0
+        # 추출은 앞선 청크를 미리 제출해 두고, 쓰기는 제출 순서대로 수행 (체크포인트가 단조 증가)
+        pending = deque()
+
+        def finish_next():
+            nonlocal processed, added_total, removed_total
+            last_id, count, future = pending.popleft()
+            added, removed = apply_chunk(db, future.result(), replace, dry_run)
+            processed += count
+            added_total += added
+            removed_total += removed
+            if not dry_run:
+                write_checkpoint(checkpoint, last_id, replace)
+            print(f"  ... {processed}개 포스트 처리 (id ≤ {last_id}, {processed / (time.monotonic() - started):.0f}개/초)")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(frequencies,)) as executor:
+            for rows in iter_chunks(db, start_after, chunk_size):
+                pending.append((rows[-1][0], len(rows), executor.submit(extract_chunk, rows)))
+                if len(pending) >= workers * 2:
+                    finish_next()
+            while pending:
+                finish_next()
+
+        verb = "추가 예정" if dry_run else "추가"
+        print(f"\n✅ {processed}개 포스트: 태그 연결 {added_total}개 {verb}, {removed_total}개 "
+              f"{'삭제 예정' if dry_run else '삭제'} ({time.monotonic() - started:.1f}초)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기존 포스트 자동 태그 재지정")
+    parser.add_argument("--dry-run", action="store_true", help="변경 내용만 출력")
+    parser.add_argument("--replace", action="store_true", help="추출 결과에 없는 태그 연결 삭제")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 포스트 수")
+    parser.add_argument("--workers", type=int, default=None, help="추출 프로세스 수 (기본 CPU 코어 수)")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="체크포인트 파일 경로")
+    parser.add_argument("--resume", action="store_true", help="체크포인트 다음 포스트부터 실행")
+    parser.add_argument("--extractor", choices=EXTRACTORS, default="tfidf", help="태그 추출기")
+    args = parser.parse_args()
+    retag_posts(
+        dry_run=args.dry_run,
+        replace=args.replace,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint=args.checkpoint,
+        resume=args.resume,
+        extractor=args.extractor,
+    )
@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from database import SessionLocal
 from database.models import User, Post, Category, Comment
+from database.comment_stats import reconcile_comment_stats
 import re
 
 
@@ -171,6 +172,8 @@ def setup_categories_and_comments():
                     comment_count += 1
         
         db.commit()
+        # 과거 시각으로 직접 넣은 댓글이므로 포스트 댓글 통계를 다시 계산
+        reconcile_comment_stats(db)
         print(f"✅ 총 {comment_count}개의 댓글이 생성되었습니다!")
         print(f"   (각 게시글당 최대 3개씩)\n")
         
@@ -0,0 +1,109 @@
+"""
+포스트 전문 검색 (PostgreSQL Full Text Search)
+
+posts.search_vector(tsvector, GIN 인덱스)를 기준으로 검색합니다.
+- 제목은 가중치 A, 본문은 가중치 B로 색인하여 제목 일치가 더 높게 랭킹됩니다.
+- 'simple' 설정은 한국어 복합어를 분리하지 못하므로, 한글 연속 구간은
+  애플리케이션에서 2글자 단위(bigram)로 분해한 뒤 색인/검색합니다.
+  예: "데이터베이스" → "데이 이터 터베 베이 이스"
+- 검색 결과에는 ts_rank_cd 점수와 하이라이트된 스니펫이 함께 제공됩니다.
+"""
+import html
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, literal, literal_column
+
+SEARCH_CONFIG = "simple"
+
+# 한글 연속 구간 또는 (한글/밑줄을 제외한) 단어 문자 연속 구간
+_TOKEN_PATTERN = re.compile(r"([가-힣]+)|([^\W_가-힣]+)")
+
+
+def _hangul_bigrams(word: str) -> List[str]:
+    """한글 단어를 bigram 목록으로 분해 (1글자는 그대로)"""
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """검색용 토큰 목록 생성 (한글은 bigram, 그 외는 소문자 단어)"""
+    if not text:
+        return []
+    tokens = []
+    for hangul, other in _TOKEN_PATTERN.findall(text):
+        if hangul:
+            tokens.extend(_hangul_bigrams(hangul))
+        else:
+            tokens.append(other.lower())
+    return tokens
+
+
+def search_document(text: Optional[str]) -> str:
+    """to_tsvector에 넘길 토큰 문자열 (공백 구분)"""
+    return " ".join(tokenize(text))
+
+
+def weighted_search_vector(title_document, content_document):
+    """토큰 문자열 SQL 표현식(리터럴 또는 바인드 파라미터)으로 가중치 tsvector 생성"""
+    # 가중치는 "char" 타입 상수 - 바인드 파라미터로 보내면 드라이버에 따라 varchar로 캐스팅되어 실패함
+    title_vector = func.setweight(func.to_tsvector(SEARCH_CONFIG, title_document), literal_column("'A'"))
+    content_vector = func.setweight(func.to_tsvector(SEARCH_CONFIG, content_document), literal_column("'B'"))
+    return title_vector.op("||")(content_vector)
+
+
+def search_vector_expression(title: str, content: str):
+    """posts.search_vector에 저장할 tsvector SQL 표현식 (제목 A, 본문 B 가중치)"""
+    return weighted_search_vector(literal(search_document(title)), literal(search_document(content)))
+
+
+def search_query_expression(query: str):
+    """검색어를 tsquery SQL 표현식으로 변환
+
+    모든 토큰을 AND로 결합하고, 입력 중인 마지막 토큰은 접두어(:*)로 일치시킵니다.
+    검색 가능한 토큰이 없으면 None을 반환합니다.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return None
+    # 토큰은 단어 문자만 포함하므로 그대로 인용해도 안전함
+    terms = [f"'{token}'" for token in tokens]
+    terms[-1] += ":*"
+    return func.to_tsquery(SEARCH_CONFIG, literal(" & ".join(terms)))
+
+
+def build_snippet(content: str, query: str, width: int = 80) -> Optional[str]:
+    """본문에서 검색어 주변을 잘라 <mark>로 강조한 스니펫 생성
+
+    본문은 HTML 이스케이프되며, 강조 태그만 추가됩니다.
+    """
+    if not content:
+        return None
+    words = [w for w in re.findall(r"[^\W_]+", query or "") if w]
+    if not words:
+        return None
+    pattern = re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)), re.IGNORECASE)
+
+    match = pattern.search(content)
+    if match:
+        start = max(match.start() - width // 2, 0)
+    else:
+        start = 0
+    end = min(start + width, len(content))
+    fragment = content[start:end]
+
+    parts = []
+    last = 0
+    for m in pattern.finditer(fragment):
+        parts.append(html.escape(fragment[last:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        last = m.end()
+    parts.append(html.escape(fragment[last:]))
+
+    snippet = " ".join("".join(parts).split())
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(content):
+        snippet += "…"
+    return snippet
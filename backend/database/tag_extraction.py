@@ -0,0 +1,258 @@
+"""
+TF-IDF 기반 자동 태그 추출
+포스트 전체에서 용어별 문서 빈도(DF)를 term_document_frequencies 테이블에 유지하고,
+본문 빈도(TF)와 함께 점수를 매겨 대부분의 포스트에 나오는 흔한 단어는 태그로 고르지 않습니다.
+
+- 포스트마다 DF에 반영한 용어 목록을 posts.indexed_terms에 저장하고, 생성/수정/삭제 시
+  이전 목록과의 차이만 upsert 1회로 반영합니다 (term이 빈 문자열인 행 = 전체 문서 수 N).
+- 점수 계산은 NumPy로 포스트 묶음 전체를 한 번에 처리합니다 (재지정 스크립트의 전체 재계산용).
+- 반영된 문서가 MIN_CORPUS_DOCUMENTS 미만이면 DF가 의미 없으므로 기존
+  extract_tags_from_content(빈도 기반)를 그대로 사용합니다.
+
+점수: (1 + ln tf) × (ln((1 + N) / (1 + df)) + 1)
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select, update, delete, bindparam, text, insert as sa_insert
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from database.models import Post, Tag, PostTag, TermDocumentFrequency
+from database.tags import STOPWORDS, extract_tags_from_content, resolve_slug_ids
+
+# 전체 문서 수(N)를 담는 행의 term
+DOCUMENT_COUNT_TERM = ""
+# 반영된 문서가 이보다 적으면 빈도 기반 추출기 사용
+MIN_CORPUS_DOCUMENTS = 50
+# 본문에 이 횟수 이상 나온 단어만 후보 (기존 추출기와 동일)
+MIN_TERM_FREQUENCY = 2
+# 전체 문서 중 이 비율을 넘게 나오는 단어는 태그로 쓰지 않음 (해시태그는 예외)
+MAX_DOCUMENT_RATIO = 0.25
+# 포스트당 키워드 태그 수 / 전체 태그 수 (해시태그 포함)
+MAX_KEYWORD_TAGS = 5
+MAX_TAGS = 10
+# rebuild_document_frequencies 에서 한 번에 읽는 포스트 수
+REBUILD_BATCH_SIZE = 1000
+
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+KOREAN_WORD_PATTERN = re.compile(r'[가-힣]{2,}')
+ENGLISH_WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+
+def candidate_terms(title: str, content: str) -> Tuple[Counter, List[str]]:
+    """(키워드 용어별 빈도, 해시태그 목록)
+
+    한글은 2글자 이상, 영문은 3글자 이상을 소문자로 모으고 불용어를 뺍니다.
+    해시태그는 원래 표기를 유지하며 대소문자 구분 없이 중복을 제거합니다.
+    """
+    full_text = f"{title} {content}"
+    counts = Counter(
+        word for word in KOREAN_WORD_PATTERN.findall(full_text) if word not in STOPWORDS
+    )
+    counts.update(
+        word for word in (w.lower() for w in ENGLISH_WORD_PATTERN.findall(full_text)) if word not in STOPWORDS
+    )
+    hashtags = {}
+    for hashtag in HASHTAG_PATTERN.findall(full_text):
+        key = hashtag.lower()
+        if len(hashtag) >= 2 and key not in STOPWORDS and key not in hashtags:
+            hashtags[key] = hashtag
+    return counts, list(hashtags.values())
+
+
+def document_terms(title: str, content: str) -> List[str]:
+    """DF에 반영할 포스트의 용어 목록 (중복 없이 정렬)"""
+    counts, _ = candidate_terms(title, content)
+    return sorted(counts)
+
+
+def term_deltas(old_terms: Optional[Sequence[str]], new_terms: Optional[Sequence[str]]) -> Dict[str, int]:
+    """포스트 용어 목록 변경에 따른 DF 증감 (None = DF에 반영되지 않은 상태)"""
+    old = set(old_terms or ())
+    new = set(new_terms or ())
+    deltas = {term: 1 for term in new - old}
+    deltas.update({term: -1 for term in old - new})
+    if old_terms is None and new_terms is not None:
+        deltas[DOCUMENT_COUNT_TERM] = 1
+    elif old_terms is not None and new_terms is None:
+        deltas[DOCUMENT_COUNT_TERM] = -1
+    return deltas
+
+
+def apply_document_frequency_deltas(db: Session, deltas: Dict[str, int]) -> None:
+    """DF 증감을 INSERT ... ON CONFLICT DO UPDATE 1회로 반영 (커밋은 호출자가 수행)
+
+    용어 순서로 정렬해 동시에 실행되는 갱신끼리 같은 순서로 행을 잠급니다.
+    """
+    rows = [
+        {"term": term, "document_count": delta}
+        for term, delta in sorted(deltas.items()) if delta
+    ]
+    if not rows:
+        return
+    statement = insert(TermDocumentFrequency).values(rows)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=["term"],
+        set_={"document_count": TermDocumentFrequency.document_count + statement.excluded.document_count},
+    ))
+
+
+def load_document_frequencies(db: Session, terms: Iterable[str]) -> Tuple[Dict[str, int], int]:
+    """({용어: DF}, 전체 문서 수 N) - 전체 문서 수 행과 함께 SELECT 1회"""
+    terms = set(terms)
+    terms.add(DOCUMENT_COUNT_TERM)
+    rows = db.execute(
+        select(TermDocumentFrequency.term, TermDocumentFrequency.document_count)
+        .where(TermDocumentFrequency.term.in_(terms))
+    ).all()
+    frequencies = {row.term: row.document_count for row in rows}
+    return frequencies, frequencies.pop(DOCUMENT_COUNT_TERM, 0)
+
+
+def load_all_document_frequencies(db: Session) -> Tuple[Dict[str, int], int]:
+    """DF 전체 스냅샷 (재지정 스크립트의 작업 프로세스에 전달)"""
+    frequencies = dict(db.execute(
+        select(TermDocumentFrequency.term, TermDocumentFrequency.document_count)
+        .where(TermDocumentFrequency.document_count > 0)
+    ).all())
+    return frequencies, frequencies.pop(DOCUMENT_COUNT_TERM, 0)
+
+
+def extract_tags_batch(
+    documents: Sequence[Tuple[str, str]],
+    frequencies: Dict[str, int],
+    n_docs: int,
+) -> List[List[str]]:
+    """(제목, 본문) 목록의 태그 이름 목록 - 모든 포스트의 후보를 한 배열로 모아 한 번에 점수 계산
+
+    해시태그를 먼저 넣고, 남은 자리를 포스트별 TF-IDF 상위 키워드(최대 MAX_KEYWORD_TAGS)로 채웁니다.
+    """
+    if n_docs < MIN_CORPUS_DOCUMENTS:
+        return [extract_tags_from_content(title, content) for title, content in documents]
+
+    results = []
+    doc_index, terms, tfs = [], [], []
+    for i, (title, content) in enumerate(documents):
+        counts, hashtags = candidate_terms(title, content)
+        results.append(hashtags[:MAX_TAGS])
+        for term, tf in counts.items():
+            if tf >= MIN_TERM_FREQUENCY:
+                doc_index.append(i)
+                terms.append(term)
+                tfs.append(tf)
+    if not terms:
+        return results
+
+    doc_index = np.asarray(doc_index, dtype=np.int64)
+    tf = np.asarray(tfs, dtype=np.float64)
+    df = np.fromiter((frequencies.get(term, 0) for term in terms), dtype=np.float64, count=len(terms))
+    scores = (1.0 + np.log(tf)) * (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0)
+
+    # 포스트 순, 같은 포스트 안에서는 점수 내림차순 (동점이면 본문에 먼저 나온 단어)
+    order = np.lexsort((-scores, doc_index))
+    order = order[df[order] <= MAX_DOCUMENT_RATIO * n_docs]
+    ordered_docs = doc_index[order]
+    rank = np.arange(len(order)) - np.searchsorted(ordered_docs, ordered_docs, side="left")
+    for position in order[rank < MAX_KEYWORD_TAGS]:
+        tags = results[doc_index[position]]
+        term = terms[position]
+        if len(tags) < MAX_TAGS and term not in (tag.lower() for tag in tags):
+            tags.append(term)
+    return results
+
+
+def extract_tags_tfidf(db: Session, title: str, content: str) -> List[str]:
+    """포스트 하나의 TF-IDF 태그 (필요한 용어의 DF만 조회)"""
+    frequencies, n_docs = load_document_frequencies(db, document_terms(title, content))
+    return extract_tags_batch([(title, content)], frequencies, n_docs)[0]
+
+
+def index_post_terms(db: Session, post_id: int, title: str, content: str) -> None:
+    """포스트 용어를 DF에 반영하고 indexed_terms 갱신 - 호출자가 포스트 행을 잠근 상태여야 함"""
+    old_terms = db.scalar(select(Post.indexed_terms).where(Post.id == post_id))
+    new_terms = document_terms(title, content)
+    if old_terms is not None and list(old_terms) == new_terms:
+        return
+    apply_document_frequency_deltas(db, term_deltas(old_terms, new_terms))
+    # 색인 갱신은 포스트 수정이 아니므로 onupdate(updated_at) 적용을 막음
+    db.execute(
+        update(Post).where(Post.id == post_id)
+        .values(indexed_terms=new_terms, updated_at=Post.updated_at)
+    )
+
+
+def remove_post_terms(db: Session, post_id: int) -> None:
+    """삭제할 포스트의 용어를 DF에서 제외 (포스트 행을 잠가 자동 태그 작업과 직렬화)"""
+    old_terms = db.scalar(select(Post.indexed_terms).where(Post.id == post_id).with_for_update())
+    if old_terms is not None:
+        apply_document_frequency_deltas(db, term_deltas(old_terms, None))
+
+
+def add_auto_tags(db: Session, post_id: int, link_tags: bool = True) -> bool:
+    """포스트 용어를 DF에 반영하고, 추출한 태그 중 아직 연결되지 않은 것만 연결 (커밋은 호출자가 수행)
+
+    포스트 행을 잠가 같은 포스트의 태그 변경/삭제와 직렬화하며, 여러 번 실행해도 결과가 같습니다.
+    link_tags=False이면 DF만 갱신합니다. 포스트가 없으면 아무것도 하지 않습니다.
+    연결을 추가했으면 True를 반환합니다.
+    """
+    post = db.execute(
+        select(Post.title, Post.content).where(Post.id == post_id).with_for_update()
+    ).first()
+    if post is None:
+        return False
+
+    index_post_terms(db, post_id, post.title, post.content)
+    if not link_tags:
+        return False
+
+    ids_by_slug = resolve_slug_ids(db, Tag, extract_tags_tfidf(db, post.title, post.content))
+    current = set(db.scalars(select(PostTag.tag_id).where(PostTag.post_id == post_id)))
+    added = [tag_id for tag_id in dict.fromkeys(ids_by_slug.values()) if tag_id not in current]
+    if added:
+        db.execute(sa_insert(PostTag).values([{"post_id": post_id, "tag_id": tag_id} for tag_id in added]))
+    return bool(added)
+
+
+def rebuild_document_frequencies(db: Session, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """모든 포스트에서 DF와 indexed_terms를 다시 계산하고 반영한 포스트 수를 반환 (커밋 포함)
+
+    한 트랜잭션에서 DF 테이블을 잠그고 교체하므로, 실행 중 DF를 갱신하는 자동 태그 작업은
+    대기하거나 교착 상태로 실패한 뒤 재시도됩니다. 쓰기가 적은 시간에 실행하세요.
+    """
+    db.execute(text(f"LOCK TABLE {TermDocumentFrequency.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+    totals = Counter()
+    processed = 0
+    last_id = 0
+    set_terms = (
+        update(Post.__table__)
+        .where(Post.__table__.c.id == bindparam("b_id"))
+        .values(indexed_terms=bindparam("b_terms"), updated_at=Post.__table__.c.updated_at)
+    )
+    while True:
+        rows = db.execute(
+            select(Post.id, Post.title, Post.content)
+            .where(Post.id > last_id)
+            .order_by(Post.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            terms = document_terms(row.title, row.content)
+            totals.update(terms)
+            params.append({"b_id": row.id, "b_terms": terms})
+        db.connection().execute(set_terms, params)
+        processed += len(rows)
+        last_id = rows[-1].id
+
+    totals[DOCUMENT_COUNT_TERM] = processed
+    db.execute(delete(TermDocumentFrequency))
+    rows = [{"term": term, "document_count": count} for term, count in totals.items()]
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(TermDocumentFrequency), rows[start:start + batch_size])
+    db.commit()
+    return processed
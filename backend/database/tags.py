@@ -0,0 +1,166 @@
+"""
+태그 유틸리티
+slug 변환, 본문 기반 태그 자동 추출, 그리고 이름 목록으로 태그/카테고리를 한 번에
+생성하거나 찾는 집합 기반 해석(resolve)과 포스트 태그 연결 변경(diff)을 제공합니다.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import select, delete, or_, insert as sa_insert
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from database.models import Tag, PostTag
+
+# 불용어 목록 (한글, 영문) - 자동 태그 추출기 공통
+STOPWORDS = frozenset({
+    '이', '그', '저', '것', '수', '등', '및', '또한', '또는', '그리고', '하지만', '그러나',
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'should', 'could', 'may', 'might', 'can', 'must'
+})
+
+
+def slugify(text: str) -> str:
+    """텍스트를 slug로 변환"""
+    # 소문자로 변환하고 공백을 하이픈으로 변경
+    slug = text.lower()
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[-\s]+', '-', slug)
+    return slug.strip('-')
+
+
+def extract_tags_from_content(title: str, content: str) -> List[str]:
+    """게시글 제목과 내용에서 태그를 자동 추출"""
+    tags = []
+    
+    # 전체 텍스트 결합
+    full_text = f"{title} {content}"
+    
+    # 1. 해시태그 추출 (#tag 형식)
+    hashtags = re.findall(r'#(\w+)', full_text)
+    for hashtag in hashtags:
+        if len(hashtag) >= 2 and hashtag.lower() not in STOPWORDS:
+            tags.append(hashtag)
+    
+    # 2. 한글 키워드 추출 (2글자 이상)
+    korean_words = re.findall(r'[가-힣]{2,}', full_text)
+    word_freq = {}
+    for word in korean_words:
+        if word not in STOPWORDS and len(word) >= 2:
+            word_freq[word] = word_freq.get(word, 0) + 1
+    
+    # 빈도가 2회 이상인 단어를 태그로 추가 (최대 5개)
+    sorted_korean = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    for word, freq in sorted_korean[:5]:
+        if word not in tags:
+            tags.append(word)
+    
+    # 3. 영문 키워드 추출 (2글자 이상, 대소문자 구분 없음)
+    english_words = re.findall(r'\b[a-zA-Z]{3,}\b', full_text)
+    word_freq_en = {}
+    for word in english_words:
+        word_lower = word.lower()
+        if word_lower not in STOPWORDS and len(word_lower) >= 3:
+            word_freq_en[word_lower] = word_freq_en.get(word_lower, 0) + 1
+    
+    # 빈도가 2회 이상인 단어를 태그로 추가 (최대 5개)
+    sorted_english = sorted(word_freq_en.items(), key=lambda x: x[1], reverse=True)
+    for word, freq in sorted_english[:5]:
+        if word not in tags:
+            tags.append(word)
+    
+    # 중복 제거 및 정렬
+    tags = list(dict.fromkeys(tags))  # 순서 유지하면서 중복 제거
+    return tags[:10]  # 최대 10개 태그 반환
+
+
+def resolve_slug_ids(db: Session, model, names: Iterable[str]) -> Dict[str, int]:
+    """이름 목록을 {slug: id}로 해석 - 없는 항목은 생성 (Tag, Category처럼 name/slug가 유일한 모델)
+
+    개수와 무관하게 INSERT ... ON CONFLICT DO NOTHING 1회와 SELECT 1회로 처리하며,
+    동시에 같은 이름을 생성하는 요청이 있어도 충돌 없이 같은 id로 해석됩니다.
+    slug가 비는 이름(기호만 있는 경우)은 무시합니다. 커밋은 호출자가 수행합니다.
+    """
+    by_slug: Dict[str, str] = {}
+    for name in names:
+        name = name.strip() if name else ""
+        slug = slugify(name)
+        if slug and slug not in by_slug:
+            by_slug[slug] = name
+    if not by_slug:
+        return {}
+
+    db.execute(
+        insert(model)
+        .values([{"name": name, "slug": slug} for slug, name in by_slug.items()])
+        .on_conflict_do_nothing()
+    )
+    # 다른 slug로 같은 이름이 이미 있는 경우도 이름으로 찾음
+    rows = db.execute(
+        select(model.id, model.slug, model.name).where(
+            or_(model.slug.in_(list(by_slug)), model.name.in_(list(by_slug.values())))
+        )
+    ).all()
+    ids_by_slug = {row.slug: row.id for row in rows}
+    ids_by_name = {row.name: row.id for row in rows}
+    return {
+        slug: ids_by_slug.get(slug, ids_by_name.get(name))
+        for slug, name in by_slug.items()
+        if slug in ids_by_slug or name in ids_by_name
+    }
+
+
+def resolve_post_tag_ids(
+    db: Session,
+    tag_ids: Optional[Sequence[int]],
+    tag_names: Optional[Sequence[str]],
+    title: str,
+    content: str,
+    auto_tags: bool = True,
+) -> List[int]:
+    """포스트에 연결할 태그 id 목록 (선택한 id → 새 태그 이름 → 자동 추출 태그 순, 중복 제거)
+
+    존재하는 id만 사용하며, 선택한 태그와 slug가 같은 자동 추출 태그는 건너뜁니다.
+    auto_tags=False이면 자동 추출을 생략합니다 (백그라운드 작업에서 tag_extraction.add_auto_tags로 추가).
+    태그 개수와 무관하게 최대 3개의 문장(id 확인 SELECT, 이름 upsert, 이름 SELECT)으로 처리합니다.
+    """
+    resolved: List[int] = []
+    selected_slugs = set()
+    if tag_ids:
+        rows = db.execute(select(Tag.id, Tag.slug).where(Tag.id.in_(set(tag_ids)))).all()
+        slugs_by_id = {row.id: row.slug for row in rows}
+        for tag_id in tag_ids:
+            if tag_id in slugs_by_id and tag_id not in resolved:
+                resolved.append(tag_id)
+                selected_slugs.add(slugs_by_id[tag_id])
+
+    names = [name for name in (tag_names or []) if name and name.strip()]
+    selected_slugs.update(slugify(name.strip()) for name in names)
+    if auto_tags:
+        names += [
+            name for name in extract_tags_from_content(title, content)
+            if slugify(name.strip()) not in selected_slugs
+        ]
+
+    ids_by_slug = resolve_slug_ids(db, Tag, names)
+    for name in names:
+        tag_id = ids_by_slug.get(slugify(name.strip()))
+        if tag_id is not None and tag_id not in resolved:
+            resolved.append(tag_id)
+    return resolved
+
+
+def set_post_tags(db: Session, post_id: int, tag_ids: Sequence[int]) -> None:
+    """포스트의 태그 연결을 tag_ids로 맞춤 - 바뀐 부분만 삭제/삽입 (커밋은 호출자가 수행)"""
+    current = set(db.scalars(select(PostTag.tag_id).where(PostTag.post_id == post_id)))
+    wanted = list(dict.fromkeys(tag_ids))
+    removed = current - set(wanted)
+    added = [tag_id for tag_id in wanted if tag_id not in current]
+    if removed:
+        db.execute(
+            delete(PostTag).where(PostTag.post_id == post_id, PostTag.tag_id.in_(removed))
+        )
+    if added:
+        db.execute(sa_insert(PostTag).values([{"post_id": post_id, "tag_id": tag_id} for tag_id in added]))
+
@@ -0,0 +1,49 @@
+"""
+ETag / 조건부 GET 유틸리티
+강한 ETag를 생성하고 If-None-Match 요청 헤더와 비교하여 304 Not Modified 응답을 만듭니다.
+"""
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# 인증이 필요한 응답이므로 공유 캐시에는 저장하지 않고, 브라우저는 매번 재검증하도록 함
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소로부터 강한 ETag 생성"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def payload_etag(payload: Any) -> str:
+    """JSON 직렬화 가능한 응답 본문으로부터 강한 ETag 생성"""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag와 일치하는지 확인 (GET에는 약한 비교 사용)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [value.strip() for value in header.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """응답에 ETag 및 재검증 캐시 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified 응답"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -0,0 +1,245 @@
+"""
+백그라운드 작업 큐
+요청 트랜잭션에서 jobs 테이블에 작업을 함께 INSERT 하고(outbox), 커밋 후 프로세스 내
+asyncio 큐로 작업 id를 넘기면 워커 태스크가 스레드 풀에서 핸들러를 실행합니다.
+
+- 실행 전 조건부 UPDATE(status = 'pending')로 작업을 선점하므로 여러 워커/프로세스가
+  같은 작업을 중복 실행하지 않습니다.
+- 실패하면 지수 백오프로 run_at을 미뤄 재시도하고, max_attempts를 넘으면 failed로 둡니다.
+- 폴러가 주기적으로 실행 시각이 된 작업(재시도, 재시작 전 커밋된 작업)을 다시 큐에 넣고,
+  오래 running 상태로 남은 작업을 되살리며, 완료된 작업을 정리합니다.
+
+핸들러는 handler(db, payload) 형태이며 직접 커밋합니다. 재시도될 수 있으므로 여러 번
+실행되어도 결과가 같아야 합니다(멱등).
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import func, select, update, delete
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from database.models import Job
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "5"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_BASE_SECONDS = 2.0
+JOB_RETRY_MAX_SECONDS = 300.0
+# running 상태로 이 시간 이상 남은 작업은 중단된 것으로 보고 다시 실행
+JOB_LOCK_TIMEOUT_SECONDS = 300
+# 완료된 작업 보관 시간
+JOB_RETENTION_HOURS = 24
+POLL_BATCH_SIZE = 100
+
+_handlers: Dict[str, Callable[[Session, Dict[str, Any]], None]] = {}
+
+
+def job_handler(kind: str):
+    """작업 종류별 핸들러 등록 데코레이터"""
+    def register(handler):
+        _handlers[kind] = handler
+        return handler
+    return register
+
+
+def enqueue_job(db: Session, kind: str, payload: Dict[str, Any]) -> Job:
+    """작업을 현재 트랜잭션에 추가 - 커밋 후 job_queue.submit(job.id)로 바로 실행을 요청"""
+    job = Job(kind=kind, payload=payload, max_attempts=JOB_MAX_ATTEMPTS)
+    db.add(job)
+    return job
+
+
+def retry_delay(attempts: int) -> float:
+    """재시도 대기 시간 (2, 4, 8 ... 초, 최대 JOB_RETRY_MAX_SECONDS)"""
+    return min(JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), JOB_RETRY_MAX_SECONDS)
+
+
+def percentile(values, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class JobQueue:
+    """프로세스 내 작업 큐와 워커/폴러 태스크"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued = set()
+        self._tasks = []
+        self._lock = threading.Lock()
+        self._stats = {"succeeded": 0, "retried": 0, "failed": 0}
+        # 최근 작업의 (등록→완료) 지연 시간과 실행 시간 (초)
+        self._latencies = deque(maxlen=1000)
+        self._durations = deque(maxlen=1000)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, workers: int = JOB_WORKERS) -> None:
+        """워커와 폴러 시작 (애플리케이션 시작 시)"""
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(workers)]
+        self._tasks.append(asyncio.create_task(self._poller()))
+
+    async def stop(self) -> None:
+        """워커와 폴러 중지 (실행 중이던 작업은 다음 시작 시 폴러가 다시 실행)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queued.clear()
+
+    def submit(self, job_id: int) -> None:
+        """커밋된 작업을 바로 실행하도록 큐에 추가 (큐가 시작되지 않았으면 폴러가 나중에 실행)"""
+        if self._loop is None or not self._tasks:
+            return
+        self._loop.call_soon_threadsafe(self._put, job_id)
+
+    def _put(self, job_id: int) -> None:
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await asyncio.to_thread(self.run_job, job_id)
+            except Exception:
+                logger.exception("Job %s crashed", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _poller(self) -> None:
+        while True:
+            try:
+                for job_id in await asyncio.to_thread(self.poll):
+                    self._put(job_id)
+            except Exception:
+                logger.exception("Job poller failed")
+            await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+
+    def poll(self) -> list:
+        """중단된 작업 복구, 오래된 완료 작업 정리 후 실행 시각이 된 작업 id 반환"""
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            db.execute(
+                update(Job)
+                .where(Job.status == "running", Job.locked_at < now - timedelta(seconds=JOB_LOCK_TIMEOUT_SECONDS))
+                .values(status="pending", locked_at=None)
+            )
+            db.execute(
+                delete(Job).where(Job.status == "done", Job.finished_at < now - timedelta(hours=JOB_RETENTION_HOURS))
+            )
+            db.commit()
+            return list(db.scalars(
+                select(Job.id)
+                .where(Job.status == "pending", Job.run_at <= func.now())
+                .order_by(Job.run_at)
+                .limit(POLL_BATCH_SIZE)
+            ))
+        finally:
+            db.close()
+
+    def run_job(self, job_id: int) -> None:
+        """작업 하나를 선점하여 실행 (워커 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            claimed = db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == "pending", Job.run_at <= func.now())
+                .values(status="running", locked_at=func.now(), attempts=Job.attempts + 1)
+                .returning(Job.kind, Job.payload, Job.attempts, Job.max_attempts, Job.created_at)
+            ).first()
+            db.commit()
+            if claimed is None:
+                return  # 다른 워커가 선점했거나 아직 실행 시각이 아님
+
+            started = time.monotonic()
+            try:
+                handler = _handlers.get(claimed.kind)
+                if handler is None:
+                    raise LookupError(f"No handler for job kind '{claimed.kind}'")
+                handler(db, claimed.payload)
+            except Exception as e:
+                db.rollback()
+                self._record_failure(db, job_id, claimed, e)
+                return
+
+            db.execute(
+                update(Job).where(Job.id == job_id)
+                .values(status="done", finished_at=func.now(), locked_at=None, last_error=None)
+            )
+            db.commit()
+            with self._lock:
+                self._stats["succeeded"] += 1
+                self._durations.append(time.monotonic() - started)
+                self._latencies.append((datetime.now(timezone.utc) - claimed.created_at).total_seconds())
+        finally:
+            db.close()
+
+    def _record_failure(self, db: Session, job_id: int, claimed, error: Exception) -> None:
+        """실패 기록 - 재시도 횟수가 남았으면 백오프 후 재실행 예약"""
+        message = f"{type(error).__name__}: {error}"
+        if claimed.attempts >= claimed.max_attempts:
+            values = {"status": "failed", "finished_at": func.now(), "locked_at": None, "last_error": message}
+            logger.error("Job %s (%s) failed permanently: %s", job_id, claimed.kind, message)
+            outcome = "failed"
+        else:
+            run_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(claimed.attempts))
+            values = {"status": "pending", "run_at": run_at, "locked_at": None, "last_error": message}
+            logger.warning("Job %s (%s) failed, retrying at %s: %s", job_id, claimed.kind, run_at, message)
+            outcome = "retried"
+        db.execute(update(Job).where(Job.id == job_id).values(**values))
+        db.commit()
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 길이, 처리 결과 카운터, 지연 시간(p50/p95/최대, 초)"""
+        with self._lock:
+            latencies = list(self._latencies)
+            durations = list(self._durations)
+            counters = dict(self._stats)
+        return {
+            "running": self.running,
+            "workers": max(len(self._tasks) - 1, 0),
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            **counters,
+            "latency_seconds": {
+                "p50": percentile(latencies, 0.5),
+                "p95": percentile(latencies, 0.95),
+                "max": max(latencies) if latencies else None,
+            },
+            "duration_seconds": {
+                "p50": percentile(durations, 0.5),
+                "p95": percentile(durations, 0.95),
+                "max": max(durations) if durations else None,
+            },
+        }
+
+
+def job_status_counts(db: Session) -> Dict[str, int]:
+    """jobs 테이블의 상태별 작업 수"""
+    return dict(db.execute(select(Job.status, func.count()).group_by(Job.status)).all())
+
+
+job_queue = JobQueue()
@@ -0,0 +1,62 @@
+"""
+메일 발송
+비밀번호 재설정 링크처럼 토큰 원문을 담은 메일을 보냅니다. 토큰 원문은 DB(jobs 포함)에 남기지 않도록
+작업 큐를 거치지 않고, 응답 후 백그라운드(BackgroundTasks)에서 한 번 발송합니다.
+
+- SMTP_HOST가 설정되어 있으면 SMTP로 발송 (smtplib은 블로킹이므로 스레드에서 실행)
+- 설정되어 있지 않으면 발송하지 않고, MAIL_LOG_LINKS=true인 경우에만 링크를 로그에 남김 (개발용)
+"""
+import asyncio
+import logging
+import os
+import smtplib
+from email.message import EmailMessage
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+SMTP_HOST = os.getenv("SMTP_HOST", "")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_USER = os.getenv("SMTP_USER", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+MAIL_FROM = os.getenv("MAIL_FROM", "no-reply@localhost")
+MAIL_LOG_LINKS = os.getenv("MAIL_LOG_LINKS", "false").lower() == "true"
+# 프론트엔드 비밀번호 재설정 페이지 (?token=...)
+PASSWORD_RESET_URL = os.getenv("PASSWORD_RESET_URL", "http://localhost:3000/reset-password")
+
+
+def send_email(to: str, subject: str, body: str) -> None:
+    """SMTP 발송 (동기)"""
+    message = EmailMessage()
+    message["From"] = MAIL_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as smtp:
+        if SMTP_STARTTLS:
+            smtp.starttls()
+        if SMTP_USER:
+            smtp.login(SMTP_USER, SMTP_PASSWORD)
+        smtp.send_message(message)
+
+
+async def send_password_reset(email: str, token: str) -> None:
+    """비밀번호 재설정 링크 발송 - 실패해도 요청에는 영향 없음 (로그만 남김)"""
+    link = f"{PASSWORD_RESET_URL}?{urlencode({'token': token})}"
+    if not SMTP_HOST:
+        if MAIL_LOG_LINKS:
+            logger.warning("SMTP_HOST is not set; password reset link for %s: %s", email, link)
+        else:
+            logger.warning("SMTP_HOST is not set; password reset email for %s was not sent", email)
+        return
+    try:
+        await asyncio.to_thread(
+            send_email,
+            email,
+            "Reset your password",
+            f"Use the link below to reset your password. It can be used once and expires soon.\n\n{link}\n\n"
+            "If you did not request a password reset, you can ignore this email.",
+        )
+    except Exception:
+        logger.exception("Failed to send password reset email to %s", email)
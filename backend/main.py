@@ -3,8 +3,14 @@ from fastapi.middleware.cors import CORSMiddleware
 import os
 from typing import List
 
-from database import init_db
-from routers import auth, profile, users, posts
+from database import init_db, async_engine
+from jobs import job_queue
+from notifications import notification_listener
+import principals  # 인증 주체 캐시 무효화 알림 등록
+import revocation  # 폐기 토큰 알림 등록
+from sweeper import token_sweeper
+import tasks  # 백그라운드 작업 핸들러 등록
+from routers import auth, profile, users, posts, metrics, exports
 
 app = FastAPI(title="Dashboard API", version="1.0.0")
 
@@ -20,6 +26,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated"],
 )
 
 # 라우터 등록
@@ -27,11 +34,24 @@ app.include_router(auth.router)
 app.include_router(profile.router)
 app.include_router(users.router)
 app.include_router(posts.router)
+app.include_router(metrics.router)
+app.include_router(exports.router)
 
 # 데이터베이스 초기화
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    await job_queue.start()
+    await notification_listener.start()
+    await token_sweeper.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await token_sweeper.stop()
+    await notification_listener.stop()
+    await job_queue.stop()
+    await async_engine.dispose()
 
 
 @app.get("/")
@@ -0,0 +1,84 @@
+"""
+워커 간 변경 알림 (Postgres LISTEN/NOTIFY)
+워커마다 전용 asyncpg 연결 하나로 등록된 채널을 LISTEN 하고, 알림이 오면 채널별 핸들러를 호출합니다.
+보내는 쪽은 트랜잭션 안에서 pg_notify(channel, payload)를 실행하므로 커밋된 변경만 전달됩니다.
+
+연결이 끊긴 동안의 알림은 전달되지 않으므로, (재)연결할 때마다 채널별 on_connect로 상태를 보정합니다
+(캐시 전체 무효화, 테이블에서 다시 적재 등).
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import asyncpg
+
+from database import async_engine
+
+logger = logging.getLogger(__name__)
+
+LISTEN_CHECK_INTERVAL_SECONDS = 5.0
+LISTEN_RECONNECT_SECONDS = 5.0
+
+
+class NotificationListener:
+    """등록된 채널을 LISTEN 하는 백그라운드 태스크"""
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable[[str], None]] = {}
+        self._on_connect: Dict[str, Callable[[], Awaitable[None]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+
+    def register(self, channel: str, handler: Callable[[str], None],
+                 on_connect: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        """채널 핸들러 등록 (start 전에 호출) - handler(payload), on_connect()는 (재)연결 직후 실행"""
+        self._handlers[channel] = handler
+        if on_connect is not None:
+            self._on_connect[channel] = on_connect
+
+    async def start(self) -> None:
+        """LISTEN 시작 (애플리케이션 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _dispatch(self, connection, pid, channel, payload) -> None:
+        try:
+            self._handlers[channel](payload)
+        except Exception:
+            logger.exception("Notification handler for %s failed", channel)
+
+    async def _run(self) -> None:
+        # 풀 연결을 계속 점유하지 않도록 전용 asyncpg 연결 사용
+        _, connect_args = async_engine.dialect.create_connect_args(async_engine.url)
+        while True:
+            try:
+                connection = await asyncpg.connect(**connect_args)
+                try:
+                    for channel in self._handlers:
+                        await connection.add_listener(channel, self._dispatch)
+                    # 연결이 없던 동안 놓쳤을 수 있는 알림 보정
+                    for on_connect in self._on_connect.values():
+                        await on_connect()
+                    self.connected = True
+                    while not connection.is_closed():
+                        await asyncio.sleep(LISTEN_CHECK_INTERVAL_SECONDS)
+                finally:
+                    self.connected = False
+                    await connection.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Notification listener failed")
+            await asyncio.sleep(LISTEN_RECONNECT_SECONDS)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"listening": self.connected, "channels": sorted(self._handlers)}
+
+
+notification_listener = NotificationListener()
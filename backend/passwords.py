@@ -0,0 +1,134 @@
+"""
+비밀번호 해싱
+bcrypt 해싱/검증은 호출마다 수백 ms의 CPU를 쓰므로, 비동기 핸들러는 password_hasher로 전용 스레드
+풀에서 실행합니다 (bcrypt는 계산 중 GIL을 놓으므로 이벤트 루프와 다른 요청이 멈추지 않음).
+
+- 동시에 실행되는 해싱은 PASSWORD_HASH_WORKERS개로 제한되고, 나머지는 대기열에서 기다립니다.
+- 대기열에서 PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS를 넘기면 503(Retry-After)으로 거절하여,
+  로그인 폭주가 응답 지연으로 쌓이지 않게 합니다.
+- 해시의 cost가 PASSWORD_HASH_ROUNDS보다 낮으면 needs_rehash()가 True - 로그인 성공 시 다시 해싱하여
+  일괄 비밀번호 재설정 없이 cost를 올릴 수 있습니다.
+
+동기 코드(database/scripts 등)는 hash_password/check_password를 직접 호출합니다 (User.set_password).
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+from fastapi import HTTPException, status
+
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", "5"))
+
+
+def hash_password(password: str) -> str:
+    """비밀번호 해싱 (현재 cost 사용)"""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=PASSWORD_HASH_ROUNDS)).decode("utf-8")
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    """비밀번호 검증"""
+    return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """해시의 cost가 현재 설정보다 낮은지 ($2b$12$... 형식)"""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds < PASSWORD_HASH_ROUNDS
+
+
+def percentile(values, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PasswordHasher:
+    """동시 실행 수가 제한된 해싱 전용 스레드 풀"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS,
+                 queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = asyncio.Semaphore(workers)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._running = 0
+        self._stats = {"hashes": 0, "verifications": 0, "rehashes": 0, "rejected": 0}
+        # 최근 작업의 대기 시간과 실행 시간 (초)
+        self._waits = deque(maxlen=1000)
+        self._durations = deque(maxlen=1000)
+
+    async def _run(self, kind: str, function: Callable, *args) -> Any:
+        started = time.perf_counter()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._stats["rejected"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry",
+                headers={"Retry-After": str(max(1, round(self.queue_timeout)))},
+            )
+        finally:
+            self._waiting -= 1
+        try:
+            self._running += 1
+            queued = time.perf_counter()
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+            with self._lock:
+                self._waits.append(queued - started)
+                self._durations.append(time.perf_counter() - queued)
+                self._stats[kind] += 1
+            return result
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hashes", hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verifications", check_password, password, hashed_password)
+
+    async def upgrade(self, password: str, hashed_password: str) -> Optional[str]:
+        """검증에 성공한 비밀번호의 해시 cost가 낮으면 새 해시, 아니면 None"""
+        if not needs_rehash(hashed_password):
+            return None
+        upgraded = await self.hash(password)
+        self._stats["rehashes"] += 1
+        return upgraded
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 길이, 처리 수, 대기/실행 시간"""
+        with self._lock:
+            waits = list(self._waits)
+            durations = list(self._durations)
+            counters = dict(self._stats)
+        return {
+            **counters,
+            "workers": self.workers,
+            "rounds": PASSWORD_HASH_ROUNDS,
+            "queue_depth": self._waiting,
+            "running": self._running,
+            "queue_timeout_seconds": self.queue_timeout,
+            "wait_seconds": {"p50": percentile(waits, 0.5), "p95": percentile(waits, 0.95),
+                             "max": max(waits) if waits else None},
+            "hash_seconds": {"p50": percentile(durations, 0.5), "p95": percentile(durations, 0.95),
+                             "max": max(durations) if durations else None},
+        }
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,118 @@
+"""
+인증 주체(principal) 캐시
+get_current_user/get_principal이 매 요청 users 테이블을 조회하지 않도록, 사용자 id별로
+프로세스 내 LRU/TTL 캐시(VersionedCache)에 보관합니다.
+- "user:{id}": 사용자 컬럼 값 - 적중 시 User 인스턴스를 만들어 요청 세션에 (조회 없이) 붙이므로,
+  핸들러는 지금처럼 current_user를 읽고 수정할 수 있습니다.
+- "version:{id}": token_version만 - 역할만 필요한 요청의 토큰 버전 확인용 (단일 컬럼 조회)
+
+사용자 정보를 바꾸는 핸들러는 커밋 전에 invalidate_principals(db, user_id)를 호출합니다.
+- 커밋 시 pg_notify로 모든 워커에 알림 → 각 워커의 notification_listener가 해당 항목을 무효화
+- 이 워커의 캐시는 커밋 직후(after_commit) 바로 무효화
+롤백되면 알림도 전송되지 않습니다. LISTEN 연결이 끊긴 동안 놓친 알림은 재연결 시 전체 무효화로,
+그래도 남는 경우는 TTL로 제한됩니다.
+"""
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from cache import VersionedCache
+from database.models import User
+from notifications import notification_listener
+
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "4096"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CHANNEL = "principal_invalidation"
+# 모든 항목이 의존하는 태그 - LISTEN 재연결 시 올려 놓친 알림을 보정
+ALL_PRINCIPALS_TAG = "principals"
+_PENDING_KEY = "principal_invalidations"
+
+principal_cache = VersionedCache(
+    max_entries=PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def principal_tag(user_id) -> str:
+    return f"principal:{user_id}"
+
+
+def principal_dependencies(user_id: int):
+    return (principal_tag(user_id), ALL_PRINCIPALS_TAG)
+
+
+def principal_columns(user: User) -> Dict[str, Any]:
+    """캐시에 저장할 사용자 컬럼 값"""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+async def load_principal(db: AsyncSession, user_id: int) -> Optional[User]:
+    """사용자 - 캐시에 있으면 조회 없이 세션에 붙여 반환"""
+    key = f"user:{user_id}"
+    hit, columns = principal_cache.get(key)
+    if hit:
+        user = User(**columns)
+        # 조회해 온 것처럼 변경 이력 없이 영속 상태로 만들어, 핸들러의 수정이 UPDATE로 반영되도록 함
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    snapshot = principal_cache.snapshot(principal_dependencies(user_id))
+    user = await db.get(User, user_id)
+    if user is not None:
+        principal_cache.set(key, principal_columns(user), snapshot)
+    return user
+
+
+async def load_token_version(db: AsyncSession, user_id: int) -> Optional[int]:
+    """사용자의 현재 token_version (삭제된 사용자는 None) - User 행을 만들지 않음"""
+    key = f"version:{user_id}"
+    hit, version = principal_cache.get(key)
+    if hit:
+        return version
+
+    snapshot = principal_cache.snapshot(principal_dependencies(user_id))
+    version = await db.scalar(select(User.token_version).where(User.id == user_id))
+    if version is not None:
+        principal_cache.set(key, version, snapshot)
+    return version
+
+
+async def invalidate_principals(db: AsyncSession, *user_ids: int) -> None:
+    """사용자 변경을 커밋하기 전에 호출 - 커밋되면 모든 워커의 캐시 항목을 무효화"""
+    if not user_ids:
+        return
+    db.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+    # NOTIFY는 트랜잭션이 커밋될 때 전달됨
+    await db.execute(select(*[func.pg_notify(PRINCIPAL_CHANNEL, str(user_id)) for user_id in user_ids]))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        principal_cache.bump(*(principal_tag(user_id) for user_id in user_ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def principal_stats() -> Dict[str, Any]:
+    """캐시 적중/미스/무효화 통계와 무효화 알림 수신(LISTEN) 상태"""
+    return {**principal_cache.stats(), "listening": notification_listener.connected}
+
+
+async def _invalidate_all() -> None:
+    principal_cache.bump(ALL_PRINCIPALS_TAG)
+
+
+notification_listener.register(
+    PRINCIPAL_CHANNEL,
+    lambda payload: principal_cache.bump(principal_tag(payload)),
+    on_connect=_invalidate_all,
+)
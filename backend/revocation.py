@@ -0,0 +1,152 @@
+"""
+액세스 토큰 폐기 (로그아웃)
+폐기된 토큰의 jti는 revoked_tokens 테이블에 토큰 만료 시각까지 보관합니다. 매 요청 이 테이블을
+조회하지 않도록, 워커마다 폐기된 jti의 Bloom 필터를 메모리에 두고 먼저 확인합니다.
+- 필터에 없으면 폐기되지 않은 토큰 (거짓 음성 없음) - 조회 없이 통과
+- 필터에 있으면 jti(기본 키)로 정확히 조회 - 오탐(false positive)은 조회 한 번으로 끝남
+
+필터는 LISTEN 연결이 (재)연결될 때마다 테이블(만료 전 행)로 다시 만들고, 다른 워커의 폐기는
+pg_notify로 받아 추가합니다. 필터를 만들기 전에는 모든 토큰을 정확히 조회합니다.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import async_engine
+from database.models import RevokedToken
+from notifications import notification_listener
+
+logger = logging.getLogger(__name__)
+
+# 필터에 넣을 최대 jti 수와 그때의 목표 오탐률 - 넘으면 테이블에서 다시 만듦 (만료된 jti 제외)
+REVOKED_TOKEN_FILTER_CAPACITY = int(os.getenv("REVOKED_TOKEN_FILTER_CAPACITY", "100000"))
+REVOKED_TOKEN_FILTER_ERROR_RATE = float(os.getenv("REVOKED_TOKEN_FILTER_ERROR_RATE", "0.001"))
+REVOCATION_CHANNEL = "token_revocation"
+
+
+class BloomFilter:
+    """비트 배열 Bloom 필터 - 해시 하나(blake2b)에서 위치 k개를 만듦 (double hashing)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def error_rate(self) -> float:
+        """현재 항목 수에서 예상되는 오탐률"""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class TokenRevocations:
+    """폐기된 jti의 워커별 Bloom 필터와 정확한 확인"""
+
+    def __init__(self, capacity: int = REVOKED_TOKEN_FILTER_CAPACITY,
+                 error_rate: float = REVOKED_TOKEN_FILTER_ERROR_RATE):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter: Optional[BloomFilter] = None
+        # 다시 만드는 동안 알림으로 들어온 jti (새 필터에도 넣음)
+        self._added_while_loading: Optional[List[str]] = None
+        self._rebuild: Optional[asyncio.Task] = None
+        self._stats = {"checks": 0, "filter_hits": 0, "revoked": 0, "false_positives": 0, "rebuilds": 0}
+
+    async def load(self) -> None:
+        """만료되지 않은 폐기 jti로 필터를 새로 만듦 (LISTEN (재)연결 시, 용량 초과 시)"""
+        self._added_while_loading = []
+        try:
+            async with async_engine.connect() as conn:
+                jtis = (await conn.scalars(
+                    select(RevokedToken.jti).where(RevokedToken.expires_at > func.now())
+                )).all()
+            bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+            for jti in (*jtis, *self._added_while_loading):
+                bloom.add(jti)
+            self._filter = bloom
+            self._stats["rebuilds"] += 1
+        finally:
+            self._added_while_loading = None
+
+    def add(self, jti: str) -> None:
+        """폐기된 jti 추가 (이 워커의 폐기, 다른 워커의 알림)"""
+        if self._added_while_loading is not None:
+            self._added_while_loading.append(jti)
+        # 이 워커의 폐기는 자신의 알림으로 한 번 더 들어옴
+        if self._filter is None or jti in self._filter:
+            return
+        self._filter.add(jti)
+        if self._filter.count > self._filter.capacity and self._rebuild is None:
+            self._rebuild = asyncio.get_running_loop().create_task(self._rebuild_filter())
+
+    async def _rebuild_filter(self) -> None:
+        try:
+            await self.load()
+        except Exception:
+            logger.exception("Revoked token filter rebuild failed")
+        finally:
+            self._rebuild = None
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        """폐기된 토큰인지 - 필터에 걸린 경우에만 조회"""
+        self._stats["checks"] += 1
+        if self._filter is not None and jti not in self._filter:
+            return False
+        self._stats["filter_hits"] += 1
+        revoked = await db.scalar(select(RevokedToken.jti).where(RevokedToken.jti == jti)) is not None
+        self._stats["revoked" if revoked else "false_positives"] += 1
+        return revoked
+
+    async def revoke(self, db: AsyncSession, jti: str, user_id: int, expires_at: datetime) -> None:
+        """토큰 폐기 (호출자가 커밋) - 커밋 시 pg_notify로 모든 워커의 필터에 추가
+
+        이 워커의 필터에는 바로 추가합니다 (롤백되어도 오탐 하나가 늘 뿐).
+        """
+        await db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        await db.execute(select(func.pg_notify(REVOCATION_CHANNEL, jti)))
+        self.add(jti)
+
+    def stats(self) -> Dict[str, Any]:
+        """필터 크기/항목 수/예상 오탐률, 확인/필터 적중/폐기/오탐 수"""
+        bloom = self._filter
+        return {
+            **self._stats,
+            "loaded": bloom is not None,
+            "entries": bloom.count if bloom else 0,
+            "capacity": bloom.capacity if bloom else self.capacity,
+            "bits": bloom.size if bloom else 0,
+            "hashes": bloom.hashes if bloom else 0,
+            "expected_error_rate": bloom.error_rate() if bloom else None,
+            "listening": notification_listener.connected,
+        }
+
+
+token_revocations = TokenRevocations()
+
+notification_listener.register(REVOCATION_CHANNEL, token_revocations.add, on_connect=token_revocations.load)
@@ -1,28 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-import secrets
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 import pyotp
 import qrcode
 import io
 import base64
 
-from database import get_db
-from database.models import User
+from database import get_async_db
+from database.models import User, RefreshToken
 from database.schemas import (
-    UserCreate, UserResponse, UserLogin, Token,
+    UserCreate, UserResponse, UserLogin, Token, RefreshTokenRequest, LogoutRequest,
     ResetPasswordRequest, ResetPassword, TwoFactorVerify, TwoFactorSetup
 )
-from auth import create_access_token, get_current_user
+from auth import (
+    oauth2_scheme, create_user_token, get_current_user, credentials_exception, verify_access_token,
+    issue_refresh_token, hash_refresh_token, revoke_refresh_family, REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+    issue_password_reset_token, consume_password_reset_token,
+)
+from principals import invalidate_principals, load_principal
+from revocation import token_revocations
+from passwords import password_hasher
+from throttle import login_throttle
+from mailer import send_password_reset
+from etag import payload_etag, etag_matches, set_etag, not_modified
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,20 +45,22 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         email=user_data.email,
         full_name=user_data.full_name,
     )
-    new_user.set_password(user_data.password)
+    new_user.hashed_password = await password_hasher.hash(user_data.password)
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
 
 @router.post("/login", response_model=Token)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == form_data.username).first()
+async def login(request: Request, form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    # 비밀번호 검증(bcrypt) 전에 IP/이메일별 시도 횟수 제한
+    await login_throttle.check(request.client.host if request.client else "unknown", form_data.username)
+    user = await db.scalar(select(User).where(User.email == form_data.username))
     
-    if not user or not user.verify_password(form_data.password):
+    if not user or not await password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -60,18 +73,114 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
             detail="User account is disabled"
         )
     
+    # 이전 cost로 만든 해시는 다시 해싱 - 그 사이 비밀번호가 바뀌었으면 덮어쓰지 않음 (토큰은 그대로 유효)
+    upgraded = await password_hasher.upgrade(form_data.password, user.hashed_password)
+    if upgraded:
+        await db.execute(
+            update(User)
+            .where(User.id == user.id, User.hashed_password == user.hashed_password)
+            .values(hashed_password=upgraded)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    
     # 2단계 인증이 활성화된 경우 토큰에 플래그 추가
     access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": user.email, "two_factor_required": user.two_factor_enabled},
-        expires_delta=access_token_expires
+    access_token = create_user_token(
+        user,
+        expires_delta=access_token_expires,
+        two_factor_required=user.two_factor_enabled,
     )
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    # 리프레시 토큰은 인증이 끝난 경우에만 발급 (2단계 인증 사용자는 verify-2fa에서 발급)
+    if user.two_factor_enabled:
+        return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = issue_refresh_token(db, user)
+    await db.commit()
+    
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(refresh_data: RefreshTokenRequest, db: AsyncSession = Depends(get_async_db)):
+    """리프레시 토큰으로 액세스 토큰 재발급 - 비밀번호 검증 없이 HMAC과 인덱스 조회만 사용
+
+    리프레시 토큰은 한 번만 사용할 수 있고 매번 새 토큰으로 교체됩니다. 이미 사용된 토큰이 다시
+    제시되면 탈취된 것으로 보고 같은 로그인 세션(family)의 토큰을 모두 폐기합니다. 회전 직후의
+    재사용은 폐기하지 않고 401만 반환합니다 (다른 탭이 받은 새 토큰을 사용하도록).
+    """
+    token_hash = hash_refresh_token(refresh_data.refresh_token)
+    # 조건부 UPDATE로 사용 처리 - 동시에 같은 토큰을 제시해도 한 요청만 성공
+    rotated = (await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > func.now(),
+        )
+        .values(used_at=func.now())
+        .returning(RefreshToken.user_id, RefreshToken.family_id, RefreshToken.token_version)
+        .execution_options(synchronize_session=False)
+    )).first()
+    
+    if rotated is None:
+        # 방금(REFRESH_TOKEN_REUSE_GRACE_SECONDS 이내) 회전된 토큰은 여러 탭의 동시 재발급으로 보고 폐기하지 않음
+        reused = (await db.execute(
+            select(
+                RefreshToken.family_id,
+                (RefreshToken.used_at > func.now() - timedelta(seconds=REFRESH_TOKEN_REUSE_GRACE_SECONDS)).label("recent"),
+            )
+            .where(RefreshToken.token_hash == token_hash, RefreshToken.used_at.is_not(None))
+        )).first()
+        if reused is not None and not reused.recent:
+            await revoke_refresh_family(db, reused.family_id)
+            await db.commit()
+        raise credentials_exception()
+    
+    # 비밀번호/역할 변경, 비활성화 후에는 세션을 이어가지 않음
+    user = await load_principal(db, rotated.user_id)
+    if user is None or not user.is_active or user.token_version != rotated.token_version:
+        await revoke_refresh_family(db, rotated.family_id)
+        await db.commit()
+        raise credentials_exception()
+    
+    access_token = create_user_token(
+        user,
+        expires_delta=timedelta(minutes=30),
+        **({"two_factor_verified": True} if user.two_factor_enabled else {"two_factor_required": False}),
+    )
+    refresh_token = issue_refresh_token(db, user, family_id=rotated.family_id)
+    await db.commit()
+    
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    logout_data: Optional[LogoutRequest] = None,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """현재 액세스 토큰 폐기 - 리프레시 토큰을 함께 보내면 그 로그인 세션(family)도 폐기"""
+    payload = await verify_access_token(token, db)
+    await token_revocations.revoke(
+        db, payload["jti"], payload["uid"], datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    )
+    if logout_data and logout_data.refresh_token:
+        family_id = await db.scalar(
+            select(RefreshToken.family_id).where(
+                RefreshToken.token_hash == hash_refresh_token(logout_data.refresh_token),
+                RefreshToken.user_id == payload["uid"],
+            )
+        )
+        if family_id:
+            await revoke_refresh_family(db, family_id)
+    await db.commit()
 
 
 @router.post("/verify-2fa")
-async def verify_2fa(verification: TwoFactorVerify, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def verify_2fa(verification: TwoFactorVerify, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     if not current_user.two_factor_enabled or not current_user.two_factor_secret:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,16 +196,19 @@ async def verify_2fa(verification: TwoFactorVerify, current_user: User = Depends
     
     # 최종 인증 토큰 발급
     access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": current_user.email, "two_factor_verified": True},
-        expires_delta=access_token_expires
+    access_token = create_user_token(
+        current_user,
+        expires_delta=access_token_expires,
+        two_factor_verified=True,
     )
+    refresh_token = issue_refresh_token(db, current_user)
+    await db.commit()
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
 
 
 @router.post("/setup-2fa", response_model=TwoFactorSetup)
-async def setup_2fa(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def setup_2fa(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     if current_user.two_factor_enabled:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -106,7 +218,8 @@ async def setup_2fa(current_user: User = Depends(get_current_user), db: Session
     # TOTP 시크릿 생성
     secret = pyotp.random_base32()
     current_user.two_factor_secret = secret
-    db.commit()
+    await invalidate_principals(db, current_user.id)
+    await db.commit()
     
     # QR 코드 생성
     totp_uri = pyotp.totp.TOTP(secret).provisioning_uri(
@@ -130,7 +243,7 @@ async def setup_2fa(current_user: User = Depends(get_current_user), db: Session
 
 
 @router.post("/enable-2fa")
-async def enable_2fa(verification: TwoFactorVerify, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def enable_2fa(verification: TwoFactorVerify, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     if not current_user.two_factor_secret:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -145,45 +258,52 @@ async def enable_2fa(verification: TwoFactorVerify, current_user: User = Depends
         )
     
     current_user.two_factor_enabled = True
-    db.commit()
+    await invalidate_principals(db, current_user.id)
+    await db.commit()
     
     return {"message": "Two-factor authentication enabled successfully"}
 
 
 @router.post("/reset-password-request")
-async def reset_password_request(request: ResetPasswordRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == request.email).first()
+async def reset_password_request(request: ResetPasswordRequest, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(User).where(User.email == request.email))
     
     # 보안을 위해 존재하지 않는 이메일이어도 성공 메시지 반환
     if user:
-        # 리셋 토큰 생성
-        reset_token = secrets.token_urlsafe(32)
-        user.reset_token = reset_token
-        user.reset_token_expires = datetime.utcnow() + timedelta(hours=1)
-        db.commit()
+        # 리셋 토큰 생성 (해시만 저장) - 원문은 응답 후 메일로만 전달하여 응답 시간으로 가입 여부가 드러나지 않게 함
+        reset_token = await issue_password_reset_token(db, user)
+        await db.commit()
+        background_tasks.add_task(send_password_reset, user.email, reset_token)
     
     return {"message": "If the email exists, a password reset link has been sent"}
 
 
 @router.post("/reset-password")
-async def reset_password(reset_data: ResetPassword, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.reset_token == reset_data.token).first()
+async def reset_password(reset_data: ResetPassword, db: AsyncSession = Depends(get_async_db)):
+    # 토큰 해시 유일 인덱스로 조회하며 사용 처리 (1회용)
+    user_id = await consume_password_reset_token(db, reset_data.token)
+    user = await db.get(User, user_id) if user_id else None
     
-    if not user or not user.reset_token_expires or user.reset_token_expires < datetime.utcnow():
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired reset token"
         )
     
-    user.set_password(reset_data.new_password)
-    user.reset_token = None
-    user.reset_token_expires = None
-    db.commit()
+    user.hashed_password = await password_hasher.hash(reset_data.new_password)
+    user.revoke_tokens()
+    await invalidate_principals(db, user.id)
+    await db.commit()
     
     return {"message": "Password reset successfully"}
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
-    return current_user
+async def get_current_user_info(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    payload = UserResponse.model_validate(current_user).model_dump(mode="json")
+    etag = payload_etag(payload)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return payload
 
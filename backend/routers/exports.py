@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timezone
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from database import engine
+from database.models import User, Post, Comment, PostTag, Tag
+from auth import Principal
+from routers.users import require_admin
+
+router = APIRouter(prefix="/api/exports", tags=["exports"])
+
+# 서버 측 커서에서 한 번에 가져오는 행 수 (= 한 번에 전송하는 청크 크기)
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def post_tags_column():
+    """포스트 태그 이름 목록 (쉼표 구분, 이름순)"""
+    return (
+        select(func.string_agg(Tag.name, aggregate_order_by(",", Tag.name)))
+        .join(PostTag, PostTag.tag_id == Tag.id)
+        .where(PostTag.post_id == Post.id)
+        .scalar_subquery()
+        .label("tags")
+    )
+
+
+def export_statement(dataset: str, include_content: bool):
+    """내보낼 컬럼만 SELECT 하는 문장 (ORM 객체를 만들지 않음, id 순서)"""
+    if dataset == "posts":
+        columns = [
+            Post.id, Post.title, Post.slug, Post.is_published, Post.author_id, Post.category_id,
+            Post.published_at, Post.created_at, Post.updated_at, Post.excerpt, Post.word_count,
+            Post.reading_time_minutes, Post.comment_count, Post.last_comment_at, post_tags_column(),
+        ]
+        if include_content:
+            columns.insert(3, Post.content)
+        return select(*columns).order_by(Post.id)
+    if dataset == "comments":
+        columns = [Comment.id, Comment.post_id, Comment.user_id, Comment.created_at, Comment.updated_at]
+        if include_content:
+            columns.insert(3, Comment.content)
+        return select(*columns).order_by(Comment.id)
+    # 비밀번호 해시, 2단계 인증 비밀값, 재설정 토큰은 내보내지 않음
+    return select(
+        User.id, User.email, User.full_name, User.is_active, User.is_verified,
+        User.is_admin, User.is_editor, User.two_factor_enabled, User.created_at, User.updated_at,
+    ).order_by(User.id)
+
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_rows(rows, keys, export_format: str) -> bytes:
+    """행 묶음을 NDJSON 또는 CSV 바이트로 변환"""
+    if export_format == "ndjson":
+        lines = [
+            json.dumps(dict(zip(keys, row)), default=json_default, ensure_ascii=False)
+            for row in rows
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def stream_export(dataset: str, export_format: Literal["ndjson", "csv"], include_content: bool):
+    """서버 측 커서에서 EXPORT_BATCH_SIZE 행씩 읽어 인코딩한 청크를 생성
+
+    요청 세션과 별도의 연결을 응답 스트리밍 동안 사용하며(요청 의존성은 응답 전송 전에 정리됨),
+    메모리 사용량은 테이블 크기와 무관하게 배치 하나 분량으로 유지됩니다.
+    """
+    statement = export_statement(dataset, include_content)
+    keys = [column.key for column in statement.selected_columns]
+
+    if export_format == "csv":
+        # 첫 바이트(헤더)는 쿼리 실행 전에 바로 전송
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(keys)
+        yield buffer.getvalue().encode("utf-8")
+
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE).execute(statement)
+        for rows in result.partitions():
+            yield encode_rows(rows, keys, export_format)
+
+
+def gzip_stream(chunks):
+    """청크 단위 gzip 압축 - 청크마다 sync flush 하여 받은 만큼 바로 풀 수 있음"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: Literal["posts", "comments", "users"],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    gzip: bool = False,
+    include_content: bool = True,
+    current_user: Principal = Depends(require_admin)
+):
+    """포스트/댓글/사용자 전체 내보내기 (관리자만)
+
+    NDJSON(행마다 JSON 객체 하나) 또는 CSV로 서버 측 커서에서 바로 스트리밍합니다.
+    gzip=true이면 전송하면서 압축하고, include_content=false이면 본문을 제외합니다.
+    """
+    chunks = stream_export(dataset, format, include_content)
+    filename = f"{dataset}-{datetime.now(timezone.utc):%Y%m%d%H%M%S}.{format}"
+    media_type = MEDIA_TYPES[format]
+    if gzip:
+        chunks = gzip_stream(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
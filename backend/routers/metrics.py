@@ -0,0 +1,94 @@
+import os
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_async_db, engine, async_engine
+from auth import Principal
+from cache import response_cache
+from jobs import job_queue, job_status_counts
+from principals import principal_stats
+from passwords import password_hasher
+from revocation import token_revocations
+from throttle import login_throttle
+from sweeper import token_sweeper
+from routers.users import require_admin
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("/cache")
+async def get_cache_metrics(current_user: Principal = Depends(require_admin)):
+    """응답 캐시 적중/미스/제거 통계 (관리자만)"""
+    return response_cache.stats()
+
+
+@router.get("/principals")
+async def get_principal_metrics(current_user: Principal = Depends(require_admin)):
+    """인증 주체 캐시 적중/미스/무효화 통계와 무효화 알림 수신(LISTEN) 상태 (관리자만)"""
+    return principal_stats()
+
+
+@router.get("/revocations")
+async def get_revocation_metrics(current_user: Principal = Depends(require_admin)):
+    """폐기 토큰 Bloom 필터 크기/항목 수/예상 오탐률, 필터 적중/폐기/오탐 수 (관리자만)"""
+    return token_revocations.stats()
+
+
+@router.get("/sweeper")
+async def get_sweeper_metrics(current_user: Principal = Depends(require_admin)):
+    """만료 토큰 정리 실행/배치/오류 수, 테이블별 삭제 수 (관리자만)"""
+    return token_sweeper.stats()
+
+
+@router.get("/passwords")
+async def get_password_metrics(current_user: Principal = Depends(require_admin)):
+    """비밀번호 해싱 대기열 길이, 처리/거절 수, 재해싱 수, 대기/실행 시간 (관리자만)"""
+    return password_hasher.stats()
+
+
+@router.get("/throttle")
+async def get_throttle_metrics(current_user: Principal = Depends(require_admin)):
+    """로그인 시도 제한 허용/거절(IP, 이메일) 수 (관리자만)"""
+    return login_throttle.stats()
+
+
+@router.get("/jobs")
+async def get_job_metrics(
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """백그라운드 작업 큐 길이, 처리 결과, 지연 시간 및 상태별 작업 수 (관리자만)"""
+    return {**job_queue.stats(), "jobs_by_status": await db.run_sync(job_status_counts)}
+
+
+@router.get("/pool")
+async def get_pool_metrics(
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """이 워커의 연결 풀 사용량과 체크아웃 대기 시간, Postgres 연결 한도 (관리자만)
+
+    workers는 WEB_CONCURRENCY 환경 변수 기준이며, max_connections_required(워커 수 × 워커당 최대 연결 수)가
+    max_connections보다 작아야 연결 한도 초과 없이 모든 풀이 오버플로까지 사용할 수 있습니다.
+    """
+    sync_pool = engine.pool.metrics()
+    async_pool = async_engine.sync_engine.pool.metrics()
+    max_connections = int(await db.scalar(text("SHOW max_connections")))
+    connections = await db.scalar(
+        text("SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()")
+    )
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    per_worker = sum(pool["pool_size"] + pool["max_overflow"] for pool in (sync_pool, async_pool))
+    return {
+        "sync": sync_pool,
+        "async": async_pool,
+        "server": {
+            "max_connections": max_connections,
+            "connections": connections,
+            "workers": workers,
+            "max_connections_per_worker": per_worker,
+            "max_connections_required": workers * per_worker,
+        },
+    }
@@ -1,19 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_, func, cast
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from typing import List, Literal, Optional
 from datetime import datetime
-import re
 
-from database import get_db
-from database.models import User, Post, Comment, PostEditor, Category, Tag, PostTag
-from database.schemas import PostCreate, PostUpdate, PostResponse, CommentCreate, CommentResponse, UserInfo, CategoryResponse, CategoryCreate, TagResponse
-from auth import get_current_user
+from database import get_db, get_async_db
+from database.models import User, Post, Comment, PostEditor, Category, Tag
+from database.loaders import (
+    select_posts_with_relations, load_post, load_post_version,
+    parse_post_fields, post_projection_options, serialize_post_fields, POST_SUMMARY_FIELDS
+)
+from database.pagination import encode_cursor, decode_cursor, keyset_filter, split_page
+from database.search import search_query_expression, search_vector_expression, build_snippet
+from database.derived import apply_post_derived
+from database.tags import slugify, resolve_post_tag_ids, set_post_tags
+from database.tag_extraction import remove_post_terms
+from database.bulk_import import import_post_batch, IMPORT_BATCH_SIZE
+from database.comment_stats import record_comment_added, record_comment_removed
+from database.schemas import PostCreate, PostUpdate, PostResponse, CommentCreate, CommentResponse, UserInfo, CategoryResponse, CategoryCreate, TagResponse, PostImportResult
+from auth import Principal, get_principal
+from routers.users import require_admin
+from cache import response_cache, invalidate_cache, invalidate_cache_tags
+from jobs import job_queue
+from tasks import enqueue_auto_tag
+from etag import make_etag, payload_etag, etag_matches, set_etag, not_modified
 
 router = APIRouter(prefix="/api/posts", tags=["posts"])
 
 
-def require_editor_or_admin(current_user: User = Depends(get_current_user)):
+def require_editor_or_admin(current_user: Principal = Depends(get_principal)):
     """편집자 또는 관리자 권한 확인"""
     if not (current_user.is_editor or current_user.is_admin):
         raise HTTPException(
@@ -23,27 +43,48 @@ def require_editor_or_admin(current_user: User = Depends(get_current_user)):
     return current_user
 
 
+def with_etag(payload):
+    """캐시에 저장할 (본문, ETag) 묶음"""
+    return {"payload": payload, "etag": payload_etag(payload)}
+
+
+def load_post_payload(db: Session, post_id: int) -> dict:
+    """포스트 상세 응답 본문 (await db.run_sync(load_post_payload, post_id)로 호출)"""
+    return PostResponse.model_validate(load_post(db, post_id)).model_dump(mode="json")
+
+
 # Categories 라우터 (/{post_id} 패턴보다 먼저 정의해야 함)
 @router.get("/categories", response_model=List[CategoryResponse])
 async def get_categories(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """카테고리 목록 조회"""
-    categories = db.query(Category).order_by(Category.name).all()
-    return categories
+    """카테고리 목록 조회 (응답 캐시 사용, 카테고리 변경 시 무효화, ETag 지원)"""
+    async def load():
+        categories = await db.scalars(select(Category).order_by(Category.name))
+        return with_etag([
+            CategoryResponse.model_validate(category).model_dump(mode="json") for category in categories
+        ])
+    
+    cached = await response_cache.get_or_set_async("categories", ("categories",), load)
+    if etag_matches(request, cached["etag"]):
+        return not_modified(cached["etag"])
+    set_etag(response, cached["etag"])
+    return cached["payload"]
 
 
 @router.post("/categories", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreate,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 생성"""
     # 중복 체크
-    existing = db.query(Category).filter(
-        or_(Category.name == category_data.name, Category.slug == category_data.slug)
-    ).first()
+    existing = await db.scalar(
+        select(Category.id).where(or_(Category.name == category_data.name, Category.slug == category_data.slug))
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -57,8 +98,9 @@ async def create_category(
     )
     
     db.add(new_category)
-    db.commit()
-    db.refresh(new_category)
+    await invalidate_cache(db, "categories")
+    await db.commit()
+    await db.refresh(new_category)
     
     return new_category
 
@@ -67,11 +109,11 @@ async def create_category(
 async def update_category(
     category_id: int,
     category_data: CategoryCreate,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 수정"""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.get(Category, category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,9 +121,11 @@ async def update_category(
         )
     
     # 중복 체크 (자기 자신 제외)
-    existing = db.query(Category).filter(
-        or_(Category.name == category_data.name, Category.slug == category_data.slug)
-    ).filter(Category.id != category_id).first()
+    existing = await db.scalar(
+        select(Category.id)
+        .where(or_(Category.name == category_data.name, Category.slug == category_data.slug))
+        .where(Category.id != category_id)
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -92,8 +136,9 @@ async def update_category(
     category.slug = category_data.slug
     category.description = category_data.description
     
-    db.commit()
-    db.refresh(category)
+    await invalidate_cache(db, "categories")
+    await db.commit()
+    await db.refresh(category)
     
     return category
 
@@ -101,19 +146,20 @@ async def update_category(
 @router.delete("/categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: int,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 삭제"""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.get(Category, category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
     
-    db.delete(category)
-    db.commit()
+    await db.delete(category)
+    await invalidate_cache(db, "categories")
+    await db.commit()
     
     return None
 
@@ -121,178 +167,287 @@ async def delete_category(
 # Tags 라우터 (/{post_id} 패턴보다 먼저 정의해야 함)
 @router.get("/tags", response_model=List[TagResponse])
 async def get_tags(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """태그 목록 조회"""
-    tags = db.query(Tag).order_by(Tag.name).all()
-    return tags
+    """태그 목록 조회 (응답 캐시 사용, 태그 생성 시 무효화, ETag 지원)"""
+    async def load():
+        tags = await db.scalars(select(Tag).order_by(Tag.name))
+        return with_etag([TagResponse.model_validate(tag).model_dump(mode="json") for tag in tags])
+    
+    cached = await response_cache.get_or_set_async("tags", ("tags",), load)
+    if etag_matches(request, cached["etag"]):
+        return not_modified(cached["etag"])
+    set_etag(response, cached["etag"])
+    return cached["payload"]
 
 
-# Comments 라우터 (/{post_id}/comments 패턴보다 먼저 정의해야 함)
-@router.get("/comments", response_model=List[CommentResponse])
-async def get_all_comments(
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+async def paginate_comments(
+    db: AsyncSession, query, response: Response, limit: int, cursor: Optional[str], descending: bool
 ):
-    """전체 댓글 목록 조회 (편집자/관리자만)"""
-    comments = db.query(Comment).order_by(Comment.created_at.desc()).all()
-    
-    for comment in comments:
-        comment.user = db.query(User).filter(User.id == comment.user_id).first()
+    """댓글 쿼리에 (created_at, id) 키셋 페이지네이션 적용
+
+    작성자는 같은 쿼리에서 JOIN으로 로드하며, 다음 페이지가 있으면 X-Next-Cursor 헤더를 설정합니다.
+    """
+    sort_columns = (Comment.created_at, Comment.id)
+    if cursor:
+        try:
+            cursor_values = decode_cursor(cursor, (datetime, int))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        query = query.where(keyset_filter(sort_columns, cursor_values, descending=descending))
     
+    rows = await db.scalars(
+        query.options(joinedload(Comment.user))
+        .order_by(*[column.desc() if descending else column.asc() for column in sort_columns])
+        .limit(limit + 1)
+    )
+    comments, has_more = split_page(rows.all(), limit)
+    if has_more:
+        last = comments[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor((last.created_at, last.id))
     return comments
 
 
-def slugify(text: str) -> str:
-    """텍스트를 slug로 변환"""
-    # 소문자로 변환하고 공백을 하이픈으로 변경
-    slug = text.lower()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    return slug.strip('-')
-
-
-def extract_tags_from_content(title: str, content: str) -> List[str]:
-    """게시글 제목과 내용에서 태그를 자동 추출"""
-    tags = []
-    
-    # 불용어 목록 (한글, 영문)
-    stopwords = {
-        '이', '그', '저', '것', '수', '등', '및', '또한', '또는', '그리고', '하지만', '그러나',
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-        'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
-        'will', 'would', 'should', 'could', 'may', 'might', 'can', 'must'
-    }
-    
-    # 전체 텍스트 결합
-    full_text = f"{title} {content}"
-    
-    # 1. 해시태그 추출 (#tag 형식)
-    hashtags = re.findall(r'#(\w+)', full_text)
-    for hashtag in hashtags:
-        if len(hashtag) >= 2 and hashtag.lower() not in stopwords:
-            tags.append(hashtag)
-    
-    # 2. 한글 키워드 추출 (2글자 이상)
-    korean_words = re.findall(r'[가-힣]{2,}', full_text)
-    word_freq = {}
-    for word in korean_words:
-        if word not in stopwords and len(word) >= 2:
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # 빈도가 2회 이상인 단어를 태그로 추가 (최대 5개)
-    sorted_korean = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    for word, freq in sorted_korean[:5]:
-        if word not in tags:
-            tags.append(word)
-    
-    # 3. 영문 키워드 추출 (2글자 이상, 대소문자 구분 없음)
-    english_words = re.findall(r'\b[a-zA-Z]{3,}\b', full_text)
-    word_freq_en = {}
-    for word in english_words:
-        word_lower = word.lower()
-        if word_lower not in stopwords and len(word_lower) >= 3:
-            word_freq_en[word_lower] = word_freq_en.get(word_lower, 0) + 1
-    
-    # 빈도가 2회 이상인 단어를 태그로 추가 (최대 5개)
-    sorted_english = sorted(word_freq_en.items(), key=lambda x: x[1], reverse=True)
-    for word, freq in sorted_english[:5]:
-        if word not in tags:
-            tags.append(word)
-    
-    # 중복 제거 및 정렬
-    tags = list(dict.fromkeys(tags))  # 순서 유지하면서 중복 제거
-    return tags[:10]  # 최대 10개 태그 반환
+async def load_comment(db: AsyncSession, comment_id: int) -> Optional[Comment]:
+    """댓글을 작성자와 함께 다시 로드 (커밋 후 서버에서 채워진 값 포함)"""
+    return await db.scalar(
+        select(Comment)
+        .options(joinedload(Comment.user))
+        .where(Comment.id == comment_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+# Comments 라우터 (/{post_id}/comments 패턴보다 먼저 정의해야 함)
+@router.get("/comments", response_model=List[CommentResponse])
+async def get_all_comments(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    post_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """전체 댓글 목록 조회 (편집자/관리자만)
+
+    최신순 키셋 페이지네이션이며, 포스트/작성자/작성일 범위로 필터링할 수 있습니다.
+    """
+    query = select(Comment)
+    if post_id is not None:
+        query = query.where(Comment.post_id == post_id)
+    if user_id is not None:
+        query = query.where(Comment.user_id == user_id)
+    if created_from is not None:
+        query = query.where(Comment.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Comment.created_at < created_to)
+    
+    return await paginate_comments(db, query, response, limit, cursor, descending=True)
+
+
+# PostResponse 형태가 바뀌면 올려서 이전 ETag를 무효화
+POST_ETAG_VERSION = "post-v3"
+
+# 목록 정렬 키 (모두 내림차순, id로 동순위 해소) 및 커서 값 타입
+# - created: 작성일순 (ix_posts_created_at_id)
+# - activity: 최근 활동순 - 마지막 댓글 시각, 없으면 작성일 (ix_posts_last_activity_at_id)
+# - comments: 댓글 많은 순 (ix_posts_comment_count_created_at_id)
+POST_SORTS = {
+    "created": ((Post.created_at, Post.id), (datetime, int)),
+    "activity": ((Post.last_activity_at, Post.id), (datetime, int)),
+    "comments": ((Post.comment_count, Post.created_at, Post.id), (int, datetime, int)),
+}
+POST_SORT_FIELDS = {
+    "created": ("created_at", "id"),
+    "activity": ("last_activity_at", "id"),
+    "comments": ("comment_count", "created_at", "id"),
+}
+
+
+def post_cache_dependencies(post_id: int):
+    """포스트 상세 응답이 의존하는 캐시 태그 (작성자/편집자/카테고리 정보 포함)"""
+    return (f"post:{post_id}", "categories", "users")
 
 
 @router.get("", response_model=List[PostResponse])
 async def get_posts(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     published_only: Optional[bool] = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    sort: Literal["created", "activity", "comments"] = "created",
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """포스트 목록 조회"""
-    query = db.query(Post)
+    """포스트 목록 조회
+
+    기본은 skip/limit 오프셋 페이지네이션이며, 다음 페이지가 있으면 X-Next-Cursor 헤더로
+    커서를 반환합니다. cursor를 전달하면 정렬 키 기준 키셋 페이지네이션으로 조회하므로
+    페이지 깊이와 무관하게 일정한 비용이 들고, 동시 삽입에도 페이지가 밀리지 않습니다.
+    sort는 created(작성일순, 기본), activity(최근 댓글 활동순), comments(댓글 많은 순)이며,
+    posts에 저장된 댓글 통계를 사용하므로 comments 테이블을 집계하지 않습니다.
+    search를 전달하면 전문 검색 인덱스로 조회하고 관련도(search_rank) 순으로 정렬하며,
+    각 포스트에 하이라이트된 스니펫(search_snippet)을 포함합니다.
+    view=summary 또는 fields=title,excerpt,... 를 지정하면 요청된 컬럼만 SELECT 하여
+    본문 대신 발췌(excerpt)를 반환합니다.
+    """
+    # 응답 필드 결정 (None이면 PostResponse 전체)
+    projection = None
+    if fields:
+        try:
+            projection = parse_post_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    elif view == "summary":
+        projection = list(POST_SUMMARY_FIELDS)
+    
+    if projection is not None:
+        # 정렬/커서 컬럼은 항상 읽고, 검색 스니펫은 본문에서 만들므로 검색 시에만 content를 함께 읽음
+        extra_columns = [Post.comment_count, Post.last_comment_at]
+        if search:
+            extra_columns.append(Post.content)
+        query = select(Post).options(*post_projection_options(projection, extra_columns))
+    else:
+        query = select_posts_with_relations()
     
     # 편집자나 관리자가 아니면 published만 보여줌
     if not (current_user.is_editor or current_user.is_admin):
-        query = query.filter(Post.is_published == True)
+        query = query.where(Post.is_published == True)
     elif published_only:
-        query = query.filter(Post.is_published == published_only)
-    
-    # 검색 기능
-    if search:
-        query = query.filter(
-            or_(
-                Post.title.ilike(f"%{search}%"),
-                Post.content.ilike(f"%{search}%")
+        query = query.where(Post.is_published == published_only)
+    
+    # 정렬 키: POST_SORTS[sort], 검색 시 관련도를 맨 앞에 추가
+    sort_columns = list(POST_SORTS[sort][0])
+    cursor_types = list(POST_SORTS[sort][1])
+    
+    # 검색 기능 (ix_posts_search_vector GIN 인덱스 사용)
+    ts_query = search_query_expression(search) if search else None
+    if ts_query is not None:
+        # 커서에 담긴 점수와 정확히 비교되도록 double precision으로 변환
+        rank = cast(func.ts_rank_cd(Post.search_vector, ts_query), DOUBLE_PRECISION)
+        query = query.where(Post.search_vector.op("@@")(ts_query)).add_columns(rank)
+        sort_columns.insert(0, rank)
+        cursor_types.insert(0, float)
+    
+    # 키셋 페이지네이션: 정렬 키와 같은 순서의 인덱스 사용
+    if cursor:
+        try:
+            cursor_values = decode_cursor(cursor, cursor_types)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
             )
+        query = query.where(keyset_filter(sort_columns, cursor_values))
+    
+    query = query.order_by(*[column.desc() for column in sort_columns])
+    if not cursor:
+        query = query.offset(skip)
+    
+    # 관계 데이터(작성자/카테고리/편집자/태그)는 배치로 함께 로드
+    result = await db.execute(query.limit(limit + 1))
+    rows, has_more = split_page(result.all(), limit)
+    
+    if ts_query is not None:
+        posts = []
+        for post, post_rank in rows:
+            post.search_rank = post_rank
+            post.search_snippet = build_snippet(post.content, search)
+            posts.append(post)
+    else:
+        posts = [row[0] for row in rows]
+    
+    if has_more:
+        last = posts[-1]
+        cursor_values = [getattr(last, name) for name in POST_SORT_FIELDS[sort]]
+        if ts_query is not None:
+            cursor_values.insert(0, last.search_rank)
+        response.headers["X-Next-Cursor"] = encode_cursor(cursor_values)
+    
+    if projection is not None:
+        items = []
+        for post in posts:
+            item = serialize_post_fields(post, projection)
+            if ts_query is not None:
+                item["search_rank"] = post.search_rank
+                item["search_snippet"] = post.search_snippet
+            items.append(item)
+        next_cursor = response.headers.get("X-Next-Cursor")
+        return JSONResponse(
+            content=jsonable_encoder(items),
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None
         )
     
-    posts = query.order_by(Post.created_at.desc()).offset(skip).limit(limit).all()
-    
-    # 관계 데이터 로드
-    for post in posts:
-        post.author = db.query(User).filter(User.id == post.author_id).first()
-        if post.category_id:
-            post.category = db.query(Category).filter(Category.id == post.category_id).first()
-        post_editors = db.query(PostEditor).filter(PostEditor.post_id == post.id).all()
-        post.editors = [db.query(User).filter(User.id == pe.user_id).first() for pe in post_editors]
-        # 태그 로드
-        post_tags = db.query(PostTag).filter(PostTag.post_id == post.id).all()
-        post.tags = [db.query(Tag).filter(Tag.id == pt.tag_id).first() for pt in post_tags]
-    
     return posts
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """포스트 상세 조회"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+    """포스트 상세 조회
+
+    버전 정보만 담은 가벼운 쿼리로 ETag를 먼저 계산하여, If-None-Match가 일치하면
+    관계 로딩과 직렬화 없이 304를 반환합니다. 본문은 ETag 단위로 응답 캐시에 저장됩니다.
+    """
+    version = await db.run_sync(load_post_version, post_id)
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
     # published가 아니고 편집자/관리자가 아니면 접근 불가
-    if not post.is_published and not (current_user.is_editor or current_user.is_admin):
+    if not version.is_published and not (current_user.is_editor or current_user.is_admin):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Post is not published"
         )
     
-    post.author = db.query(User).filter(User.id == post.author_id).first()
-    if post.category_id:
-        post.category = db.query(Category).filter(Category.id == post.category_id).first()
-    post_editors = db.query(PostEditor).filter(PostEditor.post_id == post.id).all()
-    post.editors = [db.query(User).filter(User.id == pe.user_id).first() for pe in post_editors]
-    # 태그 로드
-    post_tags = db.query(PostTag).filter(PostTag.post_id == post.id).all()
-    post.tags = [db.query(Tag).filter(Tag.id == pt.tag_id).first() for pt in post_tags]
+    etag = make_etag(POST_ETAG_VERSION, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    return post
+    payload = await response_cache.get_or_set_async(
+        f"post:{post_id}:{etag}",
+        post_cache_dependencies(post_id),
+        lambda: db.run_sync(load_post_payload, post_id)
+    )
+    set_etag(response, etag)
+    return payload
 
 
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_data: PostCreate,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """포스트 생성 (편집자/관리자만)"""
     # slug 생성
     slug = slugify(post_data.slug) if post_data.slug else slugify(post_data.title)
     
     # slug 중복 확인
-    existing_post = db.query(Post).filter(Post.slug == slug).first()
+    existing_post = await db.scalar(select(Post.id).where(Post.slug == slug))
     if existing_post:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -306,102 +461,86 @@ async def create_post(
         slug=slug,
         author_id=current_user.id,
         category_id=post_data.category_id,
-        is_published=False
+        is_published=False,
+        search_vector=search_vector_expression(post_data.title, post_data.content)
     )
+    apply_post_derived(new_post)
     
+    # 포스트, 선택한 태그 연결, 자동 태그 작업을 한 트랜잭션으로 저장 (태그 개수와 무관하게 고정된 문장 수)
+    # 자동 태그는 커밋 후 백그라운드 작업에서 추가됨
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
-    
-    # 태그 연결
-    tag_ids_to_link = []
-    
-    # 기존 태그 ID 연결
-    if post_data.tag_ids:
-        for tag_id in post_data.tag_ids:
-            tag = db.query(Tag).filter(Tag.id == tag_id).first()
-            if tag:
-                tag_ids_to_link.append(tag_id)
-    
-    # 새 태그 이름으로 태그 생성 및 연결
-    if post_data.tag_names:
-        for tag_name in post_data.tag_names:
-            tag_name = tag_name.strip()
-            if tag_name:
-                # 기존 태그 확인
-                tag_slug = slugify(tag_name)
-                existing_tag = db.query(Tag).filter(Tag.slug == tag_slug).first()
-                if existing_tag:
-                    if existing_tag.id not in tag_ids_to_link:
-                        tag_ids_to_link.append(existing_tag.id)
-                else:
-                    # 새 태그 생성
-                    new_tag = Tag(name=tag_name, slug=tag_slug)
-                    db.add(new_tag)
-                    db.flush()
-                    tag_ids_to_link.append(new_tag.id)
-    
-    # 자동 태그 추출 및 추가 (이미 선택된 태그는 제외)
-    # 이미 선택된 태그 이름 목록 생성 (중복 체크용)
-    selected_tag_names = set()
-    if post_data.tag_ids:
-        for tag_id in post_data.tag_ids:
-            tag = db.query(Tag).filter(Tag.id == tag_id).first()
-            if tag:
-                selected_tag_names.add(tag.name.lower())
-                selected_tag_names.add(tag.slug.lower())
-    if post_data.tag_names:
-        for tag_name in post_data.tag_names:
-            tag_name_clean = tag_name.strip().lower()
-            if tag_name_clean:
-                selected_tag_names.add(tag_name_clean)
-                selected_tag_names.add(slugify(tag_name_clean).lower())
-    
-    auto_tags = extract_tags_from_content(post_data.title, post_data.content)
-    for tag_name in auto_tags:
-        tag_name = tag_name.strip()
-        if tag_name:
-            tag_slug = slugify(tag_name)
-            # 이미 선택된 태그인지 확인 (이름 또는 슬러그로 비교)
-            if tag_name.lower() in selected_tag_names or tag_slug.lower() in selected_tag_names:
-                continue  # 이미 선택된 태그는 스킵
-            existing_tag = db.query(Tag).filter(Tag.slug == tag_slug).first()
-            if existing_tag:
-                if existing_tag.id not in tag_ids_to_link:
-                    tag_ids_to_link.append(existing_tag.id)
-            else:
-                # 새 태그 생성
-                new_tag = Tag(name=tag_name, slug=tag_slug)
-                db.add(new_tag)
-                db.flush()
-                tag_ids_to_link.append(new_tag.id)
-    
-    # 태그 연결
-    for tag_id in tag_ids_to_link:
-        post_tag = PostTag(post_id=new_post.id, tag_id=tag_id)
-        db.add(post_tag)
-    
-    db.commit()
-    
-    new_post.author = current_user
-    new_post.editors = []
-    if new_post.category_id:
-        new_post.category = db.query(Category).filter(Category.id == new_post.category_id).first()
-    post_tags = db.query(PostTag).filter(PostTag.post_id == new_post.id).all()
-    new_post.tags = [db.query(Tag).filter(Tag.id == pt.tag_id).first() for pt in post_tags]
-    
-    return new_post
+    await db.flush()
+    tag_ids = await db.run_sync(
+        resolve_post_tag_ids, post_data.tag_ids, post_data.tag_names, post_data.title, post_data.content,
+        auto_tags=False
+    )
+    await db.run_sync(set_post_tags, new_post.id, tag_ids)
+    job = enqueue_auto_tag(db, new_post.id)
+    await invalidate_cache(db, "tags", f"post:{new_post.id}")
+    
+    await db.commit()
+    job_queue.submit(job.id)
+    
+    return await db.run_sync(load_post, new_post.id)
+
+
+@router.post("/bulk", response_model=PostImportResult)
+async def bulk_import_posts(
+    request: Request,
+    current_user: Principal = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """포스트 대량 가져오기 (관리자만)
+
+    요청 본문은 NDJSON(한 줄에 PostImportRecord 하나)이며, 수신하는 대로 IMPORT_BATCH_SIZE 행씩
+    집합 기반 문장으로 저장합니다. 가져온 포스트의 작성자는 요청한 관리자입니다.
+    잘못된 행은 건너뛰고 1부터 시작하는 행 번호와 함께 errors에 보고합니다.
+    배치 처리(파싱, 태그 추출)는 CPU 작업이 많으므로 동기 세션으로 스레드 풀에서 실행합니다.
+    """
+    created = 0
+    errors = []
+    batch = []
+    line_no = 0
+    pending = b""
+
+    async def flush_batch():
+        nonlocal created
+        batch_created, batch_errors = await run_in_threadpool(import_post_batch, db, batch, current_user.id)
+        created += batch_created
+        errors.extend(batch_errors)
+        batch.clear()
+
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            batch.append((line_no, line.decode("utf-8", errors="replace")))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush_batch()
+    if pending.strip():
+        line_no += 1
+        batch.append((line_no, pending.decode("utf-8", errors="replace")))
+    if batch:
+        await flush_batch()
+    
+    if created:
+        # 배치는 각각 커밋되었으므로 알림만 담은 트랜잭션으로 전달
+        await run_in_threadpool(invalidate_cache_tags, db, "tags", "categories")
+        await run_in_threadpool(db.commit)
+    errors.sort(key=lambda error: error["line"])
+    return {"created": created, "failed": len(errors), "errors": errors}
 
 
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """포스트 수정 (편집자/관리자만)"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -422,10 +561,14 @@ async def update_post(
         post.title = post_data.title
     if post_data.content is not None:
         post.content = post_data.content
+        apply_post_derived(post)
+    if post_data.title is not None or post_data.content is not None:
+        # 검색 색인 갱신
+        post.search_vector = search_vector_expression(post.title, post.content)
     if post_data.slug is not None:
         new_slug = slugify(post_data.slug)
         # slug 중복 확인 (자신의 slug는 제외)
-        existing_post = db.query(Post).filter(Post.slug == new_slug, Post.id != post_id).first()
+        existing_post = await db.scalar(select(Post.id).where(Post.slug == new_slug, Post.id != post_id))
         if existing_post:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -435,7 +578,7 @@ async def update_post(
     if post_data.category_id is not None:
         # 카테고리 존재 확인
         if post_data.category_id:
-            category = db.query(Category).filter(Category.id == post_data.category_id).first()
+            category = await db.scalar(select(Category.id).where(Category.id == post_data.category_id))
             if not category:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -445,111 +588,42 @@ async def update_post(
     
     # 편집자가 다른 사람의 글을 수정한 경우 편집자 목록에 추가
     if post.author_id != current_user.id:
-        existing_editor = db.query(PostEditor).filter(
-            PostEditor.post_id == post_id,
-            PostEditor.user_id == current_user.id
-        ).first()
+        existing_editor = await db.scalar(
+            select(PostEditor.id).where(PostEditor.post_id == post_id, PostEditor.user_id == current_user.id)
+        )
         if not existing_editor:
             editor = PostEditor(post_id=post_id, user_id=current_user.id)
             db.add(editor)
     
-    # 태그 업데이트
-    if post_data.tag_ids is not None or post_data.tag_names is not None:
-        # 기존 태그 삭제
-        db.query(PostTag).filter(PostTag.post_id == post_id).delete()
-        
-        tag_ids_to_link = []
-        
-        # 기존 태그 ID 연결
-        if post_data.tag_ids:
-            for tag_id in post_data.tag_ids:
-                tag = db.query(Tag).filter(Tag.id == tag_id).first()
-                if tag:
-                    tag_ids_to_link.append(tag_id)
-        
-        # 새 태그 이름으로 태그 생성 및 연결
-        if post_data.tag_names:
-            for tag_name in post_data.tag_names:
-                tag_name = tag_name.strip()
-                if tag_name:
-                    # 기존 태그 확인
-                    tag_slug = slugify(tag_name)
-                    existing_tag = db.query(Tag).filter(Tag.slug == tag_slug).first()
-                    if existing_tag:
-                        if existing_tag.id not in tag_ids_to_link:
-                            tag_ids_to_link.append(existing_tag.id)
-                    else:
-                        # 새 태그 생성
-                        new_tag = Tag(name=tag_name, slug=tag_slug)
-                        db.add(new_tag)
-                        db.flush()
-                        tag_ids_to_link.append(new_tag.id)
-        
-        # 자동 태그 추출 및 추가 (제목이나 내용이 변경된 경우, 이미 선택된 태그는 제외)
-        # 이미 선택된 태그 이름 목록 생성 (중복 체크용)
-        selected_tag_names = set()
-        if post_data.tag_ids:
-            for tag_id in post_data.tag_ids:
-                tag = db.query(Tag).filter(Tag.id == tag_id).first()
-                if tag:
-                    selected_tag_names.add(tag.name.lower())
-                    selected_tag_names.add(tag.slug.lower())
-        if post_data.tag_names:
-            for tag_name in post_data.tag_names:
-                tag_name_clean = tag_name.strip().lower()
-                if tag_name_clean:
-                    selected_tag_names.add(tag_name_clean)
-                    selected_tag_names.add(slugify(tag_name_clean).lower())
-        
-        title = post_data.title if post_data.title else post.title
-        content = post_data.content if post_data.content else post.content
-        auto_tags = extract_tags_from_content(title, content)
-        for tag_name in auto_tags:
-            tag_name = tag_name.strip()
-            if tag_name:
-                tag_slug = slugify(tag_name)
-                # 이미 선택된 태그인지 확인 (이름 또는 슬러그로 비교)
-                if tag_name.lower() in selected_tag_names or tag_slug.lower() in selected_tag_names:
-                    continue  # 이미 선택된 태그는 스킵
-                existing_tag = db.query(Tag).filter(Tag.slug == tag_slug).first()
-                if existing_tag:
-                    if existing_tag.id not in tag_ids_to_link:
-                        tag_ids_to_link.append(existing_tag.id)
-                else:
-                    # 새 태그 생성
-                    new_tag = Tag(name=tag_name, slug=tag_slug)
-                    db.add(new_tag)
-                    db.flush()
-                    tag_ids_to_link.append(new_tag.id)
-        
-        # 태그 연결
-        for tag_id in tag_ids_to_link:
-            post_tag = PostTag(post_id=post_id, tag_id=tag_id)
-            db.add(post_tag)
-    
-    db.commit()
-    db.refresh(post)
-    
-    post.author = db.query(User).filter(User.id == post.author_id).first()
-    if post.category_id:
-        post.category = db.query(Category).filter(Category.id == post.category_id).first()
-    post_editors = db.query(PostEditor).filter(PostEditor.post_id == post.id).all()
-    post.editors = [db.query(User).filter(User.id == pe.user_id).first() for pe in post_editors]
-    # 태그 로드
-    post_tags = db.query(PostTag).filter(PostTag.post_id == post.id).all()
-    post.tags = [db.query(Tag).filter(Tag.id == pt.tag_id).first() for pt in post_tags]
-    
-    return post
+    # 태그 업데이트 (지정된 경우) - 기존 연결과의 차이만 반영, 자동 태그는 커밋 후 백그라운드 작업에서 추가
+    # 제목/본문만 바뀐 경우에도 작업을 등록해 자동 태그용 문서 빈도를 갱신 (태그 연결은 바꾸지 않음)
+    job = None
+    tags_specified = post_data.tag_ids is not None or post_data.tag_names is not None
+    if tags_specified:
+        tag_ids = await db.run_sync(
+            resolve_post_tag_ids, post_data.tag_ids, post_data.tag_names, post.title, post.content,
+            auto_tags=False
+        )
+        await db.run_sync(set_post_tags, post_id, tag_ids)
+    if tags_specified or post_data.title is not None or post_data.content is not None:
+        job = enqueue_auto_tag(db, post_id, link_tags=tags_specified)
+    await invalidate_cache(db, "tags", f"post:{post_id}")
+    
+    await db.commit()
+    if job is not None:
+        job_queue.submit(job.id)
+    
+    return await db.run_sync(load_post, post.id)
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """포스트 삭제 (작성자 또는 관리자만)"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -570,8 +644,11 @@ async def delete_post(
                 detail="Not authorized to delete this post"
             )
     
-    db.delete(post)
-    db.commit()
+    # 자동 태그용 문서 빈도에서 제외
+    await db.run_sync(remove_post_terms, post_id)
+    await db.delete(post)
+    await invalidate_cache(db, f"post:{post_id}")
+    await db.commit()
     
     return None
 
@@ -579,11 +656,11 @@ async def delete_post(
 @router.post("/{post_id}/publish", response_model=PostResponse)
 async def toggle_publish_post(
     post_id: int,
-    current_user: User = Depends(require_editor_or_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_editor_or_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """포스트 publish 토글 (편집자/관리자만)"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -596,29 +673,23 @@ async def toggle_publish_post(
     elif not post.is_published:
         post.published_at = None
     
-    db.commit()
-    db.refresh(post)
+    await invalidate_cache(db, f"post:{post_id}")
+    await db.commit()
     
-    post.author = db.query(User).filter(User.id == post.author_id).first()
-    if post.category_id:
-        post.category = db.query(Category).filter(Category.id == post.category_id).first()
-    post_editors = db.query(PostEditor).filter(PostEditor.post_id == post.id).all()
-    post.editors = [db.query(User).filter(User.id == pe.user_id).first() for pe in post_editors]
-    # 태그 로드
-    post_tags = db.query(PostTag).filter(PostTag.post_id == post.id).all()
-    post.tags = [db.query(Tag).filter(Tag.id == pt.tag_id).first() for pt in post_tags]
-    
-    return post
+    return await db.run_sync(load_post, post.id)
 
 
 @router.get("/{post_id}/comments", response_model=List[CommentResponse])
 async def get_comments(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """댓글 목록 조회"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    """댓글 목록 조회 (작성순 키셋 페이지네이션)"""
+    post = (await db.execute(select(Post.is_published).where(Post.id == post_id))).first()
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -632,23 +703,19 @@ async def get_comments(
             detail="Post is not published"
         )
     
-    comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
-    
-    for comment in comments:
-        comment.user = db.query(User).filter(User.id == comment.user_id).first()
-    
-    return comments
+    query = select(Comment).where(Comment.post_id == post_id)
+    return await paginate_comments(db, query, response, limit, cursor, descending=False)
 
 
 @router.post("/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     post_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """댓글 작성"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = (await db.execute(select(Post.is_published).where(Post.id == post_id))).first()
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -670,22 +737,22 @@ async def create_comment(
     )
     
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
+    await db.flush()
+    await db.run_sync(record_comment_added, post_id)
+    await invalidate_cache(db, f"post:{post_id}")
+    await db.commit()
     
-    new_comment.user = current_user
-    
-    return new_comment
+    return await load_comment(db, new_comment.id)
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """댓글 삭제 (작성자 또는 관리자만)"""
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -699,8 +766,12 @@ async def delete_comment(
             detail="Not authorized to delete this comment"
         )
     
-    db.delete(comment)
-    db.commit()
+    post_id = comment.post_id
+    await db.delete(comment)
+    await db.flush()
+    await db.run_sync(record_comment_removed, post_id)
+    await invalidate_cache(db, f"post:{post_id}")
+    await db.commit()
     
     return None
 
@@ -709,11 +780,11 @@ async def delete_comment(
 async def update_comment(
     comment_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """댓글 수정"""
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -729,10 +800,7 @@ async def update_comment(
     
     comment.content = comment_data.content
     
-    db.commit()
-    db.refresh(comment)
-    
-    comment.user = db.query(User).filter(User.id == comment.user_id).first()
+    await db.commit()
     
-    return comment
+    return await load_comment(db, comment_id)
 
@@ -1,25 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from database import get_db
+from database import get_async_db
 from database.models import User, Profile
 from database.schemas import ProfileResponse, ProfileUpdate
-from auth import get_current_user
+from auth import Principal, get_principal
 
 router = APIRouter(prefix="/api/profile", tags=["profile"])
 
 
-def can_edit_profile(current_user: User, profile_user_id: int) -> bool:
+def can_edit_profile(current_user: Principal, profile_user_id: int) -> bool:
     """프로파일 편집 권한 확인: 자신의 프로파일이거나 관리자인 경우"""
     return current_user.id == profile_user_id or current_user.is_admin
 
 
 @router.get("/{user_id}")
-async def get_profile(user_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_profile(user_id: int, current_user: Principal = Depends(get_principal), db: AsyncSession = Depends(get_async_db)):
     """사용자 프로파일 조회 (모든 인증된 사용자 가능)"""
     # 사용자 존재 확인
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -27,7 +28,7 @@ async def get_profile(user_id: int, current_user: User = Depends(get_current_use
         )
     
     # 프로파일 조회 또는 생성
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user_id))
     if not profile:
         # 프로파일이 없으면 기본 프로파일 생성
         profile = Profile(
@@ -36,8 +37,8 @@ async def get_profile(user_id: int, current_user: User = Depends(get_current_use
             last_name=" ".join(user.full_name.split()[1:]) if user.full_name and len(user.full_name.split()) > 1 else None,
         )
         db.add(profile)
-        db.commit()
-        db.refresh(profile)
+        await db.commit()
+        await db.refresh(profile)
     
     # 프로파일 응답에 사용자 정보 포함
     from database.schemas import ProfileResponse
@@ -68,7 +69,7 @@ async def get_profile(user_id: int, current_user: User = Depends(get_current_use
 
 
 @router.get("/me")
-async def get_my_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_my_profile(current_user: Principal = Depends(get_principal), db: AsyncSession = Depends(get_async_db)):
     """현재 사용자의 프로파일 조회"""
     return await get_profile(current_user.id, current_user, db)
 
@@ -77,8 +78,8 @@ async def get_my_profile(current_user: User = Depends(get_current_user), db: Ses
 async def update_profile(
     user_id: int,
     profile_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로파일 업데이트 (자신의 프로파일이거나 관리자만 가능)"""
     # 권한 확인
@@ -89,7 +90,7 @@ async def update_profile(
         )
     
     # 사용자 존재 확인
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,7 +98,7 @@ async def update_profile(
         )
     
     # 프로파일 조회 또는 생성
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user_id))
     if not profile:
         profile = Profile(user_id=user_id)
         db.add(profile)
@@ -107,8 +108,8 @@ async def update_profile(
     for field, value in update_data.items():
         setattr(profile, field, value)
     
-    db.commit()
-    db.refresh(profile)
+    await db.commit()
+    await db.refresh(profile)
     
     # 프로파일 응답에 사용자 정보 포함
     profile_dict = {
@@ -140,8 +141,8 @@ async def update_profile(
 @router.put("/me")
 async def update_my_profile(
     profile_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """현재 사용자의 프로파일 업데이트"""
     return await update_profile(current_user.id, profile_data, current_user, db)
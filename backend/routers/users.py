@@ -1,17 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from sqlalchemy import or_
+from sqlalchemy import select, or_, func, cast
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
 
-from database import get_db
+from database import get_async_db
 from database.models import User
+from database.pagination import encode_cursor, decode_cursor, keyset_filter, split_page, count_with_estimate
 from database.schemas import UserCreate, UserResponse
-from auth import get_current_user
+from auth import Principal, get_principal
+from cache import invalidate_cache
+from principals import invalidate_principals
+from passwords import password_hasher
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
-def require_admin(current_user: User = Depends(get_current_user)):
+def require_admin(current_user: Principal = Depends(get_principal)):
     """관리자 권한 확인"""
     if not current_user.is_admin:
         raise HTTPException(
@@ -21,38 +26,100 @@ def require_admin(current_user: User = Depends(get_current_user)):
     return current_user
 
 
+def escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자(%, _, \\) 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 @router.get("", response_model=List[UserResponse])
 async def get_users(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    include_total: bool = False,
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """사용자 목록 조회 (관리자만)"""
-    query = db.query(User)
+    """사용자 목록 조회 (관리자만)
+
+    검색어가 없으면 id 순, 있으면 pg_trgm 유사도 순(동점은 id)으로 정렬합니다.
+    검색 조건은 email/full_name의 trigram GIN 인덱스로 처리됩니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하며, cursor를 전달하면
+    키셋 페이지네이션으로 조회합니다.
+    include_total=true이면 X-Total-Count 헤더에 전체 개수를 담습니다. 개수가 많으면
+    플래너 추정치를 반환하고 X-Total-Count-Estimated: true를 함께 설정합니다.
+    """
+    query = select(User)
+    
+    # 정렬 키: 기본은 id 오름차순, 검색 시 (유사도, id) 내림차순
+    sort_columns = [User.id]
+    cursor_types = [int]
+    descending = False
     
-    # 검색 기능
+    # 검색 기능 (ix_users_email_trgm / ix_users_full_name_trgm 인덱스 사용)
     if search:
-        query = query.filter(
+        pattern = f"%{escape_like(search)}%"
+        query = query.where(
             or_(
-                User.email.ilike(f"%{search}%"),
-                User.full_name.ilike(f"%{search}%")
+                User.email.ilike(pattern, escape="\\"),
+                User.full_name.ilike(pattern, escape="\\")
             )
         )
+        score = cast(
+            func.greatest(
+                func.similarity(User.email, search),
+                func.similarity(func.coalesce(User.full_name, ""), search)
+            ),
+            DOUBLE_PRECISION
+        )
+        query = query.add_columns(score)
+        sort_columns.insert(0, score)
+        cursor_types.insert(0, float)
+        descending = True
+    
+    if include_total:
+        total, estimated = await db.run_sync(count_with_estimate, query)
+        response.headers["X-Total-Count"] = str(total)
+        if estimated:
+            response.headers["X-Total-Count-Estimated"] = "true"
+    
+    if cursor:
+        try:
+            cursor_values = decode_cursor(cursor, cursor_types)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        query = query.where(keyset_filter(sort_columns, cursor_values, descending=descending))
+    
+    query = query.order_by(*[column.desc() if descending else column for column in sort_columns])
+    if not cursor:
+        query = query.offset(skip)
+    
+    result = await db.execute(query.limit(limit + 1))
+    rows, has_more = split_page(result.all(), limit)
+    users = [row[0] for row in rows]
+    
+    if has_more:
+        cursor_values = [users[-1].id]
+        if search:
+            cursor_values.insert(0, rows[-1][1])
+        response.headers["X-Next-Cursor"] = encode_cursor(cursor_values)
     
-    users = query.offset(skip).limit(limit).all()
     return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 상세 조회 (관리자만)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -64,12 +131,12 @@ async def get_user(
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 생성 (관리자만)"""
     # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -91,11 +158,11 @@ async def create_user(
         is_verified=True,
         is_admin=user_data.is_admin if user_data.is_admin is not None else False,
     )
-    new_user.set_password(user_data.password)
+    new_user.hashed_password = await password_hasher.hash(user_data.password)
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
@@ -104,11 +171,11 @@ async def create_user(
 async def update_user(
     user_id: int,
     user_data: UserCreate,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 정보 업데이트 (관리자만)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -117,31 +184,41 @@ async def update_user(
     
     # 이메일 변경 시 중복 확인
     if user_data.email != user.email:
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
+        existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
     
+    # 토큰에 담긴 정보(이메일, 역할, 활성 상태, 비밀번호)가 바뀌면 발급된 토큰 무효화
+    revoke = user_data.email != user.email or bool(user_data.password)
+
     # 사용자 정보 업데이트
     user.email = user_data.email
     user.full_name = user_data.full_name
     
     # 관리자 권한 업데이트 (자신의 권한은 변경 불가)
     if user_data.is_admin is not None and user_id != current_user.id:
+        revoke = revoke or user_data.is_admin != user.is_admin
         user.is_admin = user_data.is_admin
     
     # 활성화 상태 업데이트 (자신의 상태는 변경 불가)
     if user_data.is_active is not None and user_id != current_user.id:
+        revoke = revoke or user_data.is_active != user.is_active
         user.is_active = user_data.is_active
     
     # 비밀번호가 제공된 경우에만 업데이트
     if user_data.password:
-        user.set_password(user_data.password)
+        user.hashed_password = await password_hasher.hash(user_data.password)
     
-    db.commit()
-    db.refresh(user)
+    if revoke:
+        user.revoke_tokens()
+    await invalidate_principals(db, user.id)
+    # 포스트 응답에 포함된 작성자/편집자 정보 무효화
+    await invalidate_cache(db, "users")
+    await db.commit()
+    await db.refresh(user)
     
     return user
 
@@ -149,11 +226,11 @@ async def update_user(
 @router.post("/{user_id}/toggle-active")
 async def toggle_user_active(
     user_id: int,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 활성화/비활성화 토글 (관리자만)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -168,8 +245,10 @@ async def toggle_user_active(
         )
     
     user.is_active = not user.is_active
-    db.commit()
-    db.refresh(user)
+    user.revoke_tokens()
+    await invalidate_principals(db, user.id)
+    await db.commit()
+    await db.refresh(user)
     
     return {"message": f"User {'activated' if user.is_active else 'deactivated'}", "user": user}
 
@@ -177,11 +256,11 @@ async def toggle_user_active(
 @router.post("/{user_id}/toggle-admin")
 async def toggle_user_admin(
     user_id: int,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 관리자 권한 토글 (관리자만)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,8 +275,10 @@ async def toggle_user_admin(
         )
     
     user.is_admin = not user.is_admin
-    db.commit()
-    db.refresh(user)
+    user.revoke_tokens()
+    await invalidate_principals(db, user.id)
+    await db.commit()
+    await db.refresh(user)
     
     return {"message": f"User admin role {'granted' if user.is_admin else 'revoked'}", "user": user}
 
@@ -205,11 +286,11 @@ async def toggle_user_admin(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 삭제 (관리자만)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -223,8 +304,10 @@ async def delete_user(
             detail="Cannot delete yourself"
         )
     
-    db.delete(user)
-    db.commit()
+    await invalidate_principals(db, user.id)
+    await db.delete(user)
+    await invalidate_cache(db, "users")
+    await db.commit()
     
     return None
 
@@ -0,0 +1,101 @@
+"""
+만료 토큰 정리
+만료 시각이 지난 토큰 행(비밀번호 재설정, 리프레시, 폐기된 액세스 토큰)은 더 이상 조회에 쓰이지 않으므로,
+TOKEN_SWEEP_INTERVAL_SECONDS마다 테이블별로 TOKEN_SWEEP_BATCH_SIZE개씩 나누어 삭제합니다.
+배치마다 커밋하므로 한 번에 많은 행이 만료되어도 긴 트랜잭션이나 큰 잠금을 만들지 않고,
+여러 워커가 동시에 실행해도 SKIP LOCKED로 서로 같은 행을 기다리지 않습니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select
+
+from database import async_engine
+from database.models import PasswordResetToken, RefreshToken, RevokedToken
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SWEEP_INTERVAL_SECONDS = float(os.getenv("TOKEN_SWEEP_INTERVAL_SECONDS", "300"))
+TOKEN_SWEEP_BATCH_SIZE = int(os.getenv("TOKEN_SWEEP_BATCH_SIZE", "1000"))
+
+# (이름, 기본 키 컬럼, 만료 시각 컬럼)
+SWEPT_TABLES = (
+    ("password_reset_tokens", PasswordResetToken.id, PasswordResetToken.expires_at),
+    ("refresh_tokens", RefreshToken.id, RefreshToken.expires_at),
+    ("revoked_tokens", RevokedToken.jti, RevokedToken.expires_at),
+)
+
+
+class TokenSweeper:
+    """만료된 토큰 행을 주기적으로 배치 삭제하는 태스크"""
+
+    def __init__(self, interval: float = TOKEN_SWEEP_INTERVAL_SECONDS, batch_size: int = TOKEN_SWEEP_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._deleted = {name: 0 for name, _, _ in SWEPT_TABLES}
+        self._stats = {"runs": 0, "batches": 0, "errors": 0, "last_duration_seconds": None}
+
+    async def start(self) -> None:
+        """정리 시작 (애플리케이션 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Token sweep failed")
+                with self._lock:
+                    self._stats["errors"] += 1
+            await asyncio.sleep(self.interval)
+
+    async def sweep(self) -> Dict[str, int]:
+        """모든 테이블의 만료 행 삭제 - 테이블별 삭제 수 반환"""
+        started = time.monotonic()
+        deleted = {}
+        for name, key, expires_at in SWEPT_TABLES:
+            deleted[name] = 0
+            while True:
+                expired = (
+                    select(key).where(expires_at < func.now())
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                async with async_engine.begin() as conn:
+                    count = (await conn.execute(delete(key.table).where(key.in_(expired)))).rowcount
+                deleted[name] += count
+                with self._lock:
+                    self._stats["batches"] += 1
+                    self._deleted[name] += count
+                if count < self.batch_size:
+                    break
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["last_duration_seconds"] = time.monotonic() - started
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        """실행/배치/오류 수, 테이블별 누적 삭제 수"""
+        with self._lock:
+            return {
+                **self._stats,
+                "deleted": dict(self._deleted),
+                "interval_seconds": self.interval,
+                "batch_size": self.batch_size,
+            }
+
+
+token_sweeper = TokenSweeper()
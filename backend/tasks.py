@@ -0,0 +1,28 @@
+"""
+백그라운드 작업 핸들러
+요청 경로에서 분리한 후처리 작업을 jobs.py 작업 큐에 등록합니다.
+"""
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from cache import invalidate_cache_tags
+from database.tag_extraction import add_auto_tags
+from jobs import job_handler, enqueue_job
+
+AUTO_TAG_POST = "auto_tag_post"
+
+
+def enqueue_auto_tag(db: Session, post_id: int, link_tags: bool = True):
+    """포스트 자동 태그 작업을 현재 트랜잭션에 추가 (link_tags=False: 문서 빈도만 갱신)"""
+    return enqueue_job(db, AUTO_TAG_POST, {"post_id": post_id, "link_tags": link_tags})
+
+
+@job_handler(AUTO_TAG_POST)
+def auto_tag_post(db: Session, payload: Dict[str, Any]) -> None:
+    """문서 빈도를 갱신하고 TF-IDF로 추출한 태그 중 연결되지 않은 것만 추가 (포스트가 삭제되었으면 무시)"""
+    post_id = payload["post_id"]
+    changed = add_auto_tags(db, post_id, link_tags=payload.get("link_tags", True))
+    if changed:
+        invalidate_cache_tags(db, "tags", f"post:{post_id}")
+    db.commit()
@@ -0,0 +1,81 @@
+"""
+포스트 조회 쿼리 수 예산
+목록/상세 조회의 SQL 문 수가 페이지 크기, 편집자 수, 태그 수와 무관하게 고정되어 있는지 확인합니다
+(database.loaders - 작성자/카테고리 JOIN, 편집자/태그 IN 배치). 관계를 지연 로딩하는 코드가
+추가되면 포스트 수에 비례해 쿼리가 늘어나 이 테스트가 실패합니다.
+"""
+import time
+
+import pytest
+
+from cache import response_cache
+from database import SessionLocal
+from database.models import Category, Post, PostEditor, PostTag, Tag, User
+from principals import principal_cache
+from revocation import token_revocations
+
+# 인증(token_version 1) + 목록(포스트 1, 편집자 1, 태그 1)
+POST_LIST_QUERY_BUDGET = 4
+# 인증(token_version 1) + ETag 버전 1 + 본문(포스트 1, 편집자 1, 태그 1)
+POST_DETAIL_QUERY_BUDGET = 5
+POST_COUNT = 40
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    """관리자, 편집자 6명, 태그 8개, 편집자/태그 수가 제각각인 포스트 POST_COUNT개"""
+    db = SessionLocal()
+    try:
+        admin = User(email="admin@example.com", full_name="Admin", is_admin=True, is_active=True)
+        admin.set_password("pw")
+        editors = [User(email=f"editor{i}@example.com", full_name=f"Editor {i}", is_editor=True, is_active=True)
+                   for i in range(6)]
+        for editor in editors:
+            editor.set_password("pw")
+        category = Category(name="General", slug="general")
+        tags = [Tag(name=f"tag{i}", slug=f"tag{i}") for i in range(8)]
+        db.add_all([admin, *editors, category, *tags])
+        db.flush()
+
+        post_ids = []
+        for i in range(POST_COUNT):
+            post = Post(title=f"Post {i}", content=f"Content {i}", slug=f"post-{i}", is_published=True,
+                        author_id=admin.id, category_id=category.id)
+            db.add(post)
+            db.flush()
+            db.add_all([PostEditor(post_id=post.id, user_id=editor.id) for editor in editors[:i % 7]])
+            db.add_all([PostTag(post_id=post.id, tag_id=tag.id) for tag in tags[:i % 9]])
+            post_ids.append(post.id)
+        db.commit()
+    finally:
+        db.close()
+
+    token = client.post("/api/auth/login", data={"username": "admin@example.com", "password": "pw"}).json()["access_token"]
+    # 폐기 토큰 필터가 만들어지기 전에는 매 요청 revoked_tokens를 조회하므로 적재를 기다림
+    deadline = time.monotonic() + 10
+    while not token_revocations.stats()["loaded"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return {"Authorization": f"Bearer {token}"}, post_ids
+
+
+def count_queries(client, query_counter, url, headers) -> int:
+    """캐시를 비운 상태에서 요청 하나가 실행한 SQL 문 수"""
+    response_cache.clear()
+    principal_cache.clear()
+    before = query_counter["count"]
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    return query_counter["count"] - before
+
+
+@pytest.mark.parametrize("limit", [1, 10, POST_COUNT])
+def test_post_list_query_count_is_fixed(client, seeded, query_counter, limit):
+    headers, _ = seeded
+    assert count_queries(client, query_counter, f"/api/posts?limit={limit}", headers) == POST_LIST_QUERY_BUDGET
+
+
+@pytest.mark.parametrize("index", [0, 6, 7, POST_COUNT - 1])
+def test_post_detail_query_count_is_fixed(client, seeded, query_counter, index):
+    # 편집자 0~6명, 태그 0~8개인 포스트
+    headers, post_ids = seeded
+    assert count_queries(client, query_counter, f"/api/posts/{post_ids[index]}", headers) == POST_DETAIL_QUERY_BUDGET
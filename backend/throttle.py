@@ -0,0 +1,146 @@
+"""
+로그인 시도 제한
+/api/auth/login은 시도마다 bcrypt 검증(수백 ms CPU)을 하므로, 비밀번호를 검증하기 전에
+클라이언트 IP별, 대상 이메일별 토큰 버킷에서 토큰을 하나씩 꺼냅니다. 토큰이 없으면 429와
+Retry-After로 거절하여 반복 시도가 CPU를 점유하지 못하게 합니다.
+
+버킷 상태 저장소 (LOGIN_THROTTLE_STORE)
+- memory: 프로세스 내 (워커 1개로 실행할 때)
+- postgres: rate_limit_buckets 테이블 - 키마다 UPSERT 한 번으로 판정/갱신하므로 모든 워커가 같은 한도를 공유
+저장소 오류 시에는 로그인을 막지 않고 허용합니다 (errors 카운터).
+
+클라이언트 IP는 request.client.host입니다. 프록시 뒤에서는 uvicorn --proxy-headers와
+FORWARDED_ALLOW_IPS(프록시 주소)로 X-Forwarded-For가 반영되도록 실행합니다 (Dockerfile,
+docker-compose.yaml). 그렇지 않으면 모든 로그인이 프록시 IP 하나의 버킷을 공유합니다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from database import async_engine
+from database.models import RateLimitBucket
+
+logger = logging.getLogger(__name__)
+
+LOGIN_THROTTLE_STORE = os.getenv("LOGIN_THROTTLE_STORE", "memory")
+# IP별: 최대 LOGIN_IP_BURST회 연속, 이후 분당 LOGIN_IP_PER_MINUTE회
+LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", "20"))
+LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", "10"))
+# 이메일별: 여러 IP에서 한 계정을 대입하는 경우
+LOGIN_EMAIL_BURST = int(os.getenv("LOGIN_EMAIL_BURST", "5"))
+LOGIN_EMAIL_PER_MINUTE = float(os.getenv("LOGIN_EMAIL_PER_MINUTE", "2"))
+# 메모리 저장소 최대 버킷 수 (LRU) - 오래 쓰지 않은 버킷은 가득 찬 버킷과 같음
+MEMORY_MAX_BUCKETS = 100_000
+# Postgres 저장소에서 이 시간 동안 갱신되지 않은 버킷 정리 (가득 차는 데 걸리는 시간보다 길어야 함)
+BUCKET_RETENTION_SECONDS = 3600
+PRUNE_INTERVAL_SECONDS = 600
+
+
+class MemoryBucketStore:
+    """프로세스 내 토큰 버킷 저장소"""
+
+    def __init__(self, max_buckets: int = MEMORY_MAX_BUCKETS):
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, capacity: int, rate: float) -> float:
+        """토큰 하나 사용 - 허용이면 0, 거절이면 다음 토큰까지 남은 시간(초)"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return 0.0 if allowed else (1 - tokens) / rate
+
+
+class PostgresBucketStore:
+    """rate_limit_buckets 테이블 토큰 버킷 저장소 (워커 간 공유)"""
+
+    def __init__(self):
+        self._pruned_at = time.monotonic()
+
+    async def take(self, key: str, capacity: int, rate: float) -> float:
+        bucket = RateLimitBucket.__table__.c
+        # 행 잠금 아래에서 경과 시간만큼 채운 토큰 수 (기존 행 기준)
+        refilled = func.least(
+            float(capacity),
+            bucket.tokens + func.extract("epoch", func.now() - bucket.updated_at) * rate,
+        )
+        statement = insert(RateLimitBucket).values(
+            key=key, tokens=float(capacity - 1), allowed=True, updated_at=func.now()
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={
+                "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+                "allowed": refilled >= 1,
+                "updated_at": func.now(),
+            },
+        ).returning(RateLimitBucket.tokens, RateLimitBucket.allowed)
+
+        async with async_engine.begin() as conn:
+            tokens, allowed = (await conn.execute(statement)).one()
+            if time.monotonic() - self._pruned_at > PRUNE_INTERVAL_SECONDS:
+                self._pruned_at = time.monotonic()
+                await conn.execute(delete(RateLimitBucket).where(
+                    RateLimitBucket.updated_at < func.now() - timedelta(seconds=BUCKET_RETENTION_SECONDS)
+                ))
+        return 0.0 if allowed else (1 - tokens) / rate
+
+
+class LoginThrottle:
+    """IP별, 이메일별 로그인 시도 제한"""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._stats = {"allowed": 0, "rejected_ip": 0, "rejected_email": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    async def check(self, client_ip: str, email: str) -> None:
+        """허용 한도를 넘으면 429 (Retry-After) - 비밀번호 검증 전에 호출"""
+        # IP에서 거절된 시도는 이메일 버킷을 소모하지 않음
+        limits = (
+            ("rejected_ip", f"login:ip:{client_ip}", LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE / 60),
+            ("rejected_email", f"login:email:{email.strip().lower()}", LOGIN_EMAIL_BURST, LOGIN_EMAIL_PER_MINUTE / 60),
+        )
+        for counter, key, capacity, rate in limits:
+            try:
+                retry_after = await self.store.take(key, capacity, rate)
+            except Exception:
+                logger.exception("Login throttle store failed")
+                self._count("errors")
+                continue
+            if retry_after > 0:
+                self._count(counter)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many login attempts, please retry later",
+                    headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+                )
+        self._count("allowed")
+
+    def stats(self) -> Dict[str, Any]:
+        """허용/거절(IP, 이메일)/저장소 오류 수"""
+        with self._lock:
+            return {**self._stats, "store": LOGIN_THROTTLE_STORE}
+
+
+login_throttle = LoginThrottle(PostgresBucketStore() if LOGIN_THROTTLE_STORE == "postgres" else MemoryBucketStore())
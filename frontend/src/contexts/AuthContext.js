@@ -30,6 +30,7 @@ export const AuthProvider = ({ children }) => {
       setUser(userData);
     } catch (error) {
       localStorage.removeItem('token');
+      localStorage.removeItem('refreshToken');
       setToken(null);
       setUser(null);
     } finally {
@@ -54,6 +55,9 @@ export const AuthProvider = ({ children }) => {
 
     const data = await response.json();
     localStorage.setItem('token', data.access_token);
+    if (data.refresh_token) {
+      localStorage.setItem('refreshToken', data.refresh_token);
+    }
     setToken(data.access_token);
     await fetchUser();
     return data;
@@ -69,7 +73,13 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // 서버에서 액세스 토큰과 로그인 세션(리프레시 토큰)을 폐기 - 실패해도 로컬 로그아웃은 진행
+    const refreshToken = localStorage.getItem('refreshToken');
+    if (localStorage.getItem('token')) {
+      api.post('/api/auth/logout', { refresh_token: refreshToken }).catch(() => {});
+    }
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
     setToken(null);
     setUser(null);
   };
@@ -89,6 +99,9 @@ export const AuthProvider = ({ children }) => {
     const response = await api.post('/api/auth/verify-2fa', { code });
     if (response.access_token) {
       localStorage.setItem('token', response.access_token);
+      if (response.refresh_token) {
+        localStorage.setItem('refreshToken', response.refresh_token);
+      }
       setToken(response.access_token);
       await fetchUser();
     }
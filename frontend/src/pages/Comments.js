@@ -26,7 +26,7 @@ const Comments = () => {
   const fetchComments = async () => {
     try {
       setLoading(true);
-      const data = await api.get('/api/posts/comments');
+      const data = await api.getAll('/api/posts/comments');
       setComments(data);
       setError('');
     } catch (err) {
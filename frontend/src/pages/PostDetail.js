@@ -80,7 +80,7 @@ const PostDetail = () => {
 
   const fetchComments = async () => {
     try {
-      const data = await api.get(`/api/posts/${id}/comments`);
+      const data = await api.getAll(`/api/posts/${id}/comments`);
       setComments(data);
     } catch (error) {
       console.error('Failed to load comments:', error);
@@ -25,7 +25,8 @@ const Posts = () => {
   const fetchPosts = async () => {
     try {
       setLoading(true);
-      const params = new URLSearchParams();
+      // 목록에는 본문 대신 발췌만 필요하므로 요약 모드로 조회
+      const params = new URLSearchParams({ view: 'summary' });
       if (publishedFilter === 'published') {
         params.append('published_only', 'true');
       } else if (publishedFilter === 'draft') {
@@ -75,7 +76,7 @@ const Posts = () => {
   const filteredPosts = posts.filter(
     (post) =>
       post.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      post.content.toLowerCase().includes(searchTerm.toLowerCase())
+      (post.excerpt || '').toLowerCase().includes(searchTerm.toLowerCase())
   );
 
   // 페이징 계산
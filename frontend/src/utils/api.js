@@ -2,8 +2,50 @@
 // 개발 환경에서는 환경변수나 localhost 사용
 const API_BASE_URL = process.env.REACT_APP_API_URL || (process.env.NODE_ENV === 'production' ? '' : 'http://localhost:8000');
 
+// 액세스 토큰 만료 시 리프레시 토큰으로 재발급 (리프레시 토큰은 1회용이므로 동시에 한 번만 요청)
+let refreshing = null;
+
+const refreshAccessToken = () => {
+  if (!refreshing) {
+    refreshing = (async () => {
+      const refreshToken = localStorage.getItem('refreshToken');
+      if (!refreshToken) return false;
+      try {
+        const response = await fetch(`${API_BASE_URL}/api/auth/refresh`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ refresh_token: refreshToken }),
+        });
+        if (!response.ok) {
+          // 다른 탭이 같은 토큰으로 먼저 재발급했으면 그 탭이 저장한 새 토큰 사용
+          if (localStorage.getItem('refreshToken') !== refreshToken) {
+            return true;
+          }
+          localStorage.removeItem('refreshToken');
+          return false;
+        }
+        const data = await response.json();
+        localStorage.setItem('token', data.access_token);
+        localStorage.setItem('refreshToken', data.refresh_token);
+        return true;
+      } catch (error) {
+        return false;
+      }
+    })().finally(() => {
+      refreshing = null;
+    });
+  }
+  return refreshing;
+};
+
 export const api = {
   async request(endpoint, options = {}) {
+    const response = await this.send(endpoint, options);
+    return response.json();
+  },
+
+  // 응답 헤더가 필요한 호출용 - 성공 응답(Response)을 그대로 반환
+  async send(endpoint, options = {}, retried = false) {
     const url = `${API_BASE_URL}${endpoint}`;
     const token = localStorage.getItem('token');
     
@@ -31,18 +73,40 @@ export const api = {
       throw error;
     }
     
+    // 401이면 토큰을 재발급받아 한 번 다시 요청 (다른 탭에서 이미 재발급했으면 새 토큰으로 바로 재시도)
+    if (response.status === 401 && token && !retried) {
+      if (localStorage.getItem('token') !== token || await refreshAccessToken()) {
+        return this.send(endpoint, options, true);
+      }
+    }
+
     if (!response.ok) {
       const error = await response.json().catch(() => ({ detail: 'An error occurred' }));
       throw new Error(error.detail || 'An error occurred');
     }
 
-    return response.json();
+    return response;
   },
 
   async get(endpoint) {
     return this.request(endpoint, { method: 'GET' });
   },
 
+  // 키셋 페이지네이션 목록을 X-Next-Cursor 헤더를 따라 마지막 페이지까지 모두 조회
+  async getAll(endpoint, limit = 500) {
+    const items = [];
+    let cursor = null;
+    do {
+      const params = new URLSearchParams({ limit });
+      if (cursor) params.set('cursor', cursor);
+      const separator = endpoint.includes('?') ? '&' : '?';
+      const response = await this.send(`${endpoint}${separator}${params}`, { method: 'GET' });
+      items.push(...(await response.json()));
+      cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    return items;
+  },
+
   async post(endpoint, data) {
     return this.request(endpoint, {
       method: 'POST',